@@ -0,0 +1,8 @@
+# benchmarks/__init__.py
+"""
+Repeatable timings of the core SauceDemo flows, driven through the page objects.
+
+    python -m benchmarks run --base-url local -n 15 --out benchmarks/baselines/main.json
+    python -m benchmarks compare benchmarks/baselines/main.json artifacts/benchmarks/latest.json
+    python -m benchmarks load --base-url local --users 4 --duration 120   (concurrent virtual users)
+"""
@@ -0,0 +1,210 @@
+# benchmarks/__main__.py
+"""
+python -m benchmarks run      [--base-url URL|local] [-n N] [--flow PREFIX ...] [--out FILE] [--compare-to FILE]
+python -m benchmarks compare  BASELINE CURRENT [--alpha 0.05] [--min-slowdown 0.10]
+python -m benchmarks load     [--base-url URL|local] [--users M] [--duration S] [--mix purchase=3,browse=1]
+
+`compare` (and `run --compare-to`) exits with status 1 when a flow got slower.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.flows import select_flows
+from benchmarks.stats import compare_flow, summarize
+from utils import command_counter
+from utils.chromedriver import CACHE_DIR, stop_shared_service
+from utils.driver_factory import DEFAULT_PROFILE, PROFILES, new_driver, quit_driver
+from utils.parallel import ARTIFACTS_ROOT
+from utils.session_cache import SessionCache
+
+DEFAULT_OUT = Path(ARTIFACTS_ROOT) / "benchmarks" / "latest.json"
+
+
+# ---------- run ----------
+def _measure(flow, driver, ctx, iterations: int, warmup: int):
+    counter = command_counter.attach(driver)
+    samples, commands, errors = [], [], []
+    for i in range(warmup + iterations):
+        try:
+            flow.setup(driver, ctx)
+            counter.reset()
+            start = time.perf_counter()
+            flow.run(driver, ctx)
+            elapsed = time.perf_counter() - start
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}".strip()[:300])
+            continue
+        if i >= warmup:
+            samples.append(elapsed)
+            commands.append(counter.total)
+    return samples, commands, errors
+
+
+def run(args) -> dict:
+    site = None
+    base_url = args.base_url
+    if base_url == "local":
+        from utils.local_site import LocalSite
+        site = LocalSite(glitch_delay_ms=args.local_glitch_ms).start()
+        base_url = site.url
+
+    ctx = {
+        "base_url": base_url,
+        "password": args.password,
+        "sessions": SessionCache(CACHE_DIR / "bench_sessions"),
+    }
+    result = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "base_url": args.base_url,
+            "profile": args.profile,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "host": platform.node(),
+            "python": platform.python_version(),
+        },
+        "flows": {},
+    }
+    driver = new_driver(profile=args.profile)
+    try:
+        for flow in select_flows(args.flow):
+            samples, commands, errors = _measure(flow, driver, ctx, args.iterations, args.warmup)
+            entry = {"samples_s": [round(s, 4) for s in samples], **summarize(samples),
+                     "commands": {"samples": commands, **summarize(commands)},
+                     "errors": len(errors), "error_samples": errors[:3]}
+            result["flows"][flow.name] = entry
+            print(f"{flow.name:<36} p50 {entry['p50']:7.3f}s  p95 {entry['p95']:7.3f}s  "
+                  f"max {entry['max']:7.3f}s  cmds {entry['commands']['p50']:5.0f}  errors {len(errors)}",
+                  flush=True)
+    finally:
+        quit_driver(driver)
+        stop_shared_service()
+        if site:
+            site.stop()
+    return result
+
+
+# ---------- compare ----------
+def compare(baseline: dict, current: dict, alpha: float, min_slowdown: float) -> bool:
+    """Print the comparison table; True when something regressed."""
+    for key in ("base_url", "profile"):
+        if baseline["meta"].get(key) != current["meta"].get(key):
+            print(f"warning: {key} differs (baseline {baseline['meta'].get(key)!r}, "
+                  f"current {current['meta'].get(key)!r})")
+
+    regressed = False
+    print(f"{'flow':<36}{'base p50':>10}{'cur p50':>10}{'change':>9}{'p':>8}{'cmds':>11}  verdict")
+    for name, cur in current["flows"].items():
+        base = baseline["flows"].get(name)
+        if base is None or not base["samples_s"] or not cur["samples_s"]:
+            print(f"{name:<36}{'':>10}{'':>10}{'':>9}{'':>8}{'':>11}  no data to compare")
+            continue
+        r = compare_flow(base, cur, alpha=alpha, min_slowdown=min_slowdown)
+        verdict = []
+        if r["slower"]:
+            verdict.append("SLOWER")
+        if r["more_commands"]:
+            verdict.append("MORE COMMANDS")
+        if cur["errors"] > base["errors"]:
+            verdict.append("MORE ERRORS")
+        regressed = regressed or bool(verdict)
+        cmds = f"{r['commands_base'] or 0:.0f}->{r['commands_current'] or 0:.0f}"
+        print(f"{name:<36}{r['p50_base']:>9.3f}s{r['p50_current']:>9.3f}s{r['change']:>+9.1%}"
+              f"{r['p_value']:>8.3f}{cmds:>11}  {', '.join(verdict) or 'ok'}")
+    return regressed
+
+
+# ---------- load ----------
+def load(args) -> int:
+    from benchmarks.load import parse_mix, print_report, run_load
+
+    mix = parse_mix(args.mix)
+    site, base_url = None, args.base_url
+    if base_url == "local":
+        from utils.local_site import LocalSite
+        site = LocalSite(glitch_delay_ms=args.local_glitch_ms).start()
+        base_url = site.url
+    try:
+        report = run_load(base_url, args.users, args.duration, mix, args.user, args.password,
+                          profile=args.profile, seed=args.seed)
+    finally:
+        stop_shared_service()
+        if site:
+            site.stop()
+    report["meta"] = {"base_url": args.base_url, "mix": mix, "profile": args.profile,
+                      "created": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    print_report(report)
+    if args.out:
+        Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.out).write_text(json.dumps(report, indent=1))
+    return 0
+
+
+def _load(path) -> dict:
+    return json.loads(Path(path).read_text())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_run = sub.add_parser("run", help="run the flows and write a result/baseline JSON")
+    p_run.add_argument("--base-url", default=os.getenv("SAUCEDEMO_BASE_URL", "https://www.saucedemo.com/"),
+                       help="site under test; 'local' starts the bundled stand-in")
+    p_run.add_argument("--password", default=os.getenv("SAUCEDEMO_PASSWORD", "secret_sauce"))
+    p_run.add_argument("-n", "--iterations", type=int, default=10)
+    p_run.add_argument("--warmup", type=int, default=1, help="untimed iterations per flow")
+    p_run.add_argument("--flow", action="append", default=[], help="only flows starting with this (repeatable)")
+    p_run.add_argument("--profile", choices=list(PROFILES), default=DEFAULT_PROFILE)
+    p_run.add_argument("--local-glitch-ms", type=int,
+                       default=int(os.getenv("SAUCEDEMO_LOCAL_GLITCH_MS", "1500")))
+    p_run.add_argument("--out", default=str(DEFAULT_OUT))
+    p_run.add_argument("--compare-to", help="baseline JSON to compare the fresh results against")
+
+    p_cmp = sub.add_parser("compare", help="compare a result JSON against a baseline")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+
+    p_load = sub.add_parser("load", help="M concurrent virtual users looping a flow mix (see benchmarks/load.py)")
+    p_load.add_argument("--base-url", default=os.getenv("SAUCEDEMO_BASE_URL", "https://www.saucedemo.com/"),
+                        help="site under test; 'local' starts the bundled stand-in")
+    p_load.add_argument("--password", default=os.getenv("SAUCEDEMO_PASSWORD", "secret_sauce"))
+    p_load.add_argument("--user", default="standard_user")
+    p_load.add_argument("--users", type=int, default=4, help="concurrent virtual users (browsers)")
+    p_load.add_argument("--duration", type=float, default=60, help="seconds")
+    p_load.add_argument("--mix", default="purchase=3,browse=1,cart=1",
+                        help="weighted flows: purchase, browse, cart")
+    p_load.add_argument("--profile", choices=list(PROFILES), default="perf")
+    p_load.add_argument("--local-glitch-ms", type=int,
+                        default=int(os.getenv("SAUCEDEMO_LOCAL_GLITCH_MS", "1500")))
+    p_load.add_argument("--seed", type=int, default=1)
+    p_load.add_argument("--out", help="also write the report as JSON")
+
+    for p in (p_run, p_cmp):
+        p.add_argument("--alpha", type=float, default=0.05, help="significance level (one-sided)")
+        p.add_argument("--min-slowdown", type=float, default=0.10,
+                       help="relative p50 increase that counts as a regression")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "compare":
+        return int(compare(_load(args.baseline), _load(args.current), args.alpha, args.min_slowdown))
+    if args.cmd == "load":
+        return load(args)
+
+    result = run(args)
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, indent=1))
+    print(f"results written to {out}")
+    if args.compare_to:
+        return int(compare(_load(args.compare_to), result, args.alpha, args.min_slowdown))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
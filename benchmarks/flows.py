@@ -0,0 +1,116 @@
+# benchmarks/flows.py
+"""
+The benchmarked flows. Each flow has an untimed setup() that brings the browser into
+its start state and a timed run(). Both get the driver and a shared context dict
+(base_url, password, session cache, product picks).
+"""
+from typing import Callable, List, NamedTuple
+from urllib.parse import urljoin
+
+from pages.cart_page import CartPage
+from pages.catalog import USERS_MATRIX
+from pages.checkout_page import CheckoutPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from utils.driver_pool import reset_driver
+from utils.session_cache import login_via_session
+
+ITEMS_PER_CART = 4
+PICK_SEED = 42  # same picks as the picked_products fixture
+
+
+class Flow(NamedTuple):
+    name: str
+    setup: Callable
+    run: Callable
+
+
+# ---------- setups (untimed) ----------
+def _logged_out(driver, ctx):
+    reset_driver(driver, ctx["base_url"])
+
+
+def _logged_in(driver, ctx):
+    reset_driver(driver, ctx["base_url"])
+    inv = login_via_session(driver, ctx["base_url"], "standard_user", ctx["password"], ctx["sessions"])
+    assert inv.is_loaded()
+    if "picks" not in ctx:
+        ctx["picks"] = [p["name"] for p in inv.choose_random_products(k=ITEMS_PER_CART, seed=PICK_SEED)]
+    return inv
+
+
+def _items_in_cart(driver, ctx):
+    return _logged_in(driver, ctx).seed_cart(ctx["picks"])
+
+
+def _on_cart_page(driver, ctx):
+    _items_in_cart(driver, ctx).open_cart()
+    assert CartPage(driver).is_loaded()
+
+
+# ---------- timed bodies ----------
+def _login_run(username: str, expect_success: bool):
+    def run(driver, ctx):
+        login = LoginPage(driver).load(ctx["base_url"])
+        login.login(username, ctx["password"])
+        if expect_success:
+            assert InventoryPage(driver).is_loaded(), f"{username}: inventory did not load"
+        else:
+            assert "locked out" in login.get_error_text().lower()
+    return run
+
+
+def _inventory_load(driver, ctx):
+    driver.get(urljoin(ctx["base_url"], "inventory.html"))
+    assert InventoryPage(driver).is_loaded()
+
+
+def _add_items(driver, ctx):
+    inv = InventoryPage(driver)
+    inv.add_products_to_cart_by_names(ctx["picks"])
+    inv.wait_cart_badge_equals(len(ctx["picks"]))
+
+
+def _verify_cart(driver, ctx):
+    InventoryPage(driver).open_cart()
+    cart = CartPage(driver)
+    assert cart.is_loaded()
+    assert set(cart.item_names()) == set(ctx["picks"])
+
+
+def _checkout(driver, ctx):
+    CartPage(driver).go_to_checkout()
+    co = CheckoutPage(driver)
+    co.fill_info_and_continue(first="Bench", last="Mark", postal="12345")
+    assert co.is_overview_loaded()
+    assert len(co.overview_items()) == len(ctx["picks"])
+    co.finish()
+    assert "Thank you for your order!" in co.confirmation_message()
+
+
+def _reset_app_state(driver, ctx):
+    inv = InventoryPage(driver)
+    inv.reset_app_state_and_wait(names_to_check=ctx["picks"])
+    assert inv.get_cart_badge_count() == 0
+
+
+def all_flows() -> List[Flow]:
+    flows = [Flow(f"login[{user}]", _logged_out, _login_run(user, ok)) for user, ok, _ in USERS_MATRIX]
+    flows += [
+        Flow("inventory_load", _logged_in, _inventory_load),
+        Flow("add_items", _logged_in, _add_items),
+        Flow("cart_verification", _items_in_cart, _verify_cart),
+        Flow("checkout", _on_cart_page, _checkout),
+        Flow("reset_app_state", _items_in_cart, _reset_app_state),
+    ]
+    return flows
+
+
+def select_flows(patterns: List[str]) -> List[Flow]:
+    """Flows whose name starts with any of `patterns` (all flows when empty)."""
+    flows = all_flows()
+    if not patterns:
+        return flows
+    return [f for f in flows if any(f.name.startswith(p) for p in patterns)]
+
+
@@ -0,0 +1,216 @@
+# benchmarks/load.py
+"""
+Load driver: M virtual users, each a headless Chrome driven through the page objects,
+looping a weighted mix of flows for a fixed duration.
+
+    python -m benchmarks load --base-url local --users 4 --duration 120 --mix purchase=3,browse=1
+
+Reports throughput (completed flows/min), per-step latency percentiles and error rates.
+Every virtual user keeps its own results (no locking); they are merged at the end.
+"""
+import random
+import threading
+import time
+from functools import partial
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.stats import percentile
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from utils.driver_factory import new_driver, quit_driver
+from utils.driver_pool import is_healthy, reset_driver
+
+ITEMS_PER_ORDER = 4
+
+
+# ---------- steps: fn(driver, vu) where vu is the virtual user's state ----------
+def _login(driver, vu):
+    LoginPage(driver).load(vu["base_url"]).login(vu["user"], vu["password"])
+    assert InventoryPage(driver).is_loaded(), "inventory did not load after login"
+
+
+def _add_items(driver, vu):
+    inv = InventoryPage(driver)
+    names = [p["name"] for p in vu["rng"].sample(inv.fetch_all_products(), ITEMS_PER_ORDER)]
+    inv.add_products_to_cart_by_names(names)
+    inv.wait_cart_badge_equals(ITEMS_PER_ORDER)
+    vu["names"] = names
+
+
+def _open_cart(driver, vu):
+    InventoryPage(driver).open_cart()
+    cart = CartPage(driver)
+    assert cart.is_loaded(), "cart page did not load"
+    assert set(cart.item_names()) == set(vu.get("names", [])), "cart content differs"
+
+
+def _checkout(driver, vu):
+    CartPage(driver).go_to_checkout()
+    co = CheckoutPage(driver)
+    co.fill_info_and_continue(first="Load", last="User", postal="12345")
+    assert co.is_overview_loaded(), "checkout overview did not load"
+    co.finish()
+    assert "Thank you" in co.confirmation_message()
+
+
+def _sort(driver, vu):
+    inv = InventoryPage(driver)
+    inv.select_sort(vu["rng"].choice(["az", "za", "lohi", "hilo"]))
+
+
+def _reset(driver, vu):
+    InventoryPage(driver).reset_app_state_and_wait()
+
+
+FLOWS: Dict[str, List[Tuple[str, Callable]]] = {
+    "purchase": [("login", _login), ("add_items", _add_items), ("open_cart", _open_cart), ("checkout", _checkout)],
+    "browse": [("login", _login), ("sort", _sort), ("sort_again", _sort)],
+    "cart": [("login", _login), ("add_items", _add_items), ("reset_app_state", _reset)],
+}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """'purchase=3,browse=1' -> {'purchase': 3.0, 'browse': 1.0}; a bare name has weight 1."""
+    mix = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in FLOWS:
+            raise ValueError(f"unknown flow {name!r}; expected one of {sorted(FLOWS)}")
+        mix[name] = float(weight or 1)
+    if not mix:
+        raise ValueError("empty flow mix")
+    return mix
+
+
+# ---------- one virtual user ----------
+class VirtualUser(threading.Thread):
+    def __init__(self, index: int, driver_factory: Callable, base_url: str, user: str, password: str,
+                 mix: Dict[str, float], deadline: float, seed: int):
+        super().__init__(name=f"vu{index}", daemon=True)
+        self.factory = driver_factory
+        self.driver = driver_factory()  # created up front, one at a time, by the main thread
+        self.base_url = base_url
+        self.vu = {"base_url": base_url, "user": user, "password": password, "rng": random.Random(seed)}
+        self.mix = mix
+        self.deadline = deadline
+        # results: step -> [latency s], errors per step, flow -> [durations], flow -> errors
+        self.steps: Dict[Tuple[str, str], List[float]] = {}
+        self.step_errors: Dict[Tuple[str, str], int] = {}
+        self.flows: Dict[str, List[float]] = {}
+        self.flow_errors: Dict[str, int] = {}
+        self.error_samples: List[str] = []
+
+    def _fresh_session(self):
+        try:
+            reset_driver(self.driver, self.base_url)
+            if is_healthy(self.driver, self.base_url):
+                return
+        except Exception:
+            pass
+        quit_driver(self.driver)
+        self.driver = self.factory()
+
+    def _run_flow(self, name: str):
+        self.vu.pop("names", None)
+        flow_start = time.perf_counter()
+        for step, fn in FLOWS[name]:
+            key = (name, step)
+            start = time.perf_counter()
+            try:
+                fn(self.driver, self.vu)
+            except Exception as e:
+                self.step_errors[key] = self.step_errors.get(key, 0) + 1
+                self.flow_errors[name] = self.flow_errors.get(name, 0) + 1
+                if len(self.error_samples) < 5:
+                    self.error_samples.append(f"{name}/{step}: {type(e).__name__}: {e}"[:300])
+                return
+            self.steps.setdefault(key, []).append(time.perf_counter() - start)
+        self.flows.setdefault(name, []).append(time.perf_counter() - flow_start)
+
+    def run(self):
+        names, weights = list(self.mix), list(self.mix.values())
+        try:
+            while time.time() < self.deadline:
+                self._fresh_session()
+                self._run_flow(self.vu["rng"].choices(names, weights)[0])
+        finally:
+            quit_driver(self.driver)
+
+
+# ---------- report ----------
+def merge(users: List[VirtualUser], elapsed_s: float) -> Dict:
+    steps, step_errors, flows, flow_errors, samples = {}, {}, {}, {}, []
+    for u in users:
+        for k, v in u.steps.items():
+            steps.setdefault(k, []).extend(v)
+        for k, v in u.step_errors.items():
+            step_errors[k] = step_errors.get(k, 0) + v
+        for k, v in u.flows.items():
+            flows.setdefault(k, []).extend(v)
+        for k, v in u.flow_errors.items():
+            flow_errors[k] = flow_errors.get(k, 0) + v
+        samples.extend(u.error_samples)
+
+    minutes = elapsed_s / 60.0 or 1.0
+    report = {"elapsed_s": round(elapsed_s, 1), "users": len(users), "flows": {}, "steps": {},
+              "error_samples": samples[:10]}
+    for name in sorted(set(flows) | set(flow_errors)):
+        done, failed = len(flows.get(name, [])), flow_errors.get(name, 0)
+        report["flows"][name] = {
+            "completed": done, "failed": failed,
+            "per_min": round(done / minutes, 2),
+            "error_rate": round(failed / (done + failed), 4) if done + failed else 0.0,
+            "p50_s": round(percentile(flows.get(name, []), 50), 3) if done else None,
+        }
+    for key in sorted(set(steps) | set(step_errors)):
+        lat, failed = steps.get(key, []), step_errors.get(key, 0)
+        report["steps"]["/".join(key)] = {
+            "ok": len(lat), "failed": failed,
+            "error_rate": round(failed / (len(lat) + failed), 4) if lat or failed else 0.0,
+            **({f"p{q}_s": round(percentile(lat, q), 3) for q in (50, 90, 95, 99)} if lat else {}),
+            "max_s": round(max(lat), 3) if lat else None,
+        }
+    total_done = sum(f["completed"] for f in report["flows"].values())
+    report["throughput_per_min"] = round(total_done / minutes, 2)
+    return report
+
+
+def print_report(report: Dict):
+    print(f"\n{report['users']} virtual users, {report['elapsed_s']}s: "
+          f"{report['throughput_per_min']} flows/min")
+    print(f"{'flow':<12}{'done':>7}{'failed':>8}{'per min':>9}{'err %':>8}{'p50 s':>8}")
+    for name, f in report["flows"].items():
+        p50 = f"{f['p50_s']:.3f}" if f["p50_s"] is not None else "-"
+        print(f"{name:<12}{f['completed']:>7}{f['failed']:>8}{f['per_min']:>9}{f['error_rate']:>8.1%}{p50:>8}")
+    print(f"{'step':<28}{'ok':>6}{'err %':>8}{'p50 s':>8}{'p95 s':>8}{'p99 s':>8}{'max s':>8}")
+    for name, s in report["steps"].items():
+        cols = "".join(f"{s[k]:>8.3f}" if s.get(k) is not None else f"{'-':>8}"
+                       for k in ("p50_s", "p95_s", "p99_s", "max_s"))
+        print(f"{name:<28}{s['ok']:>6}{s['error_rate']:>8.1%}{cols}")
+    for e in report["error_samples"]:
+        print(f"  error: {e}")
+
+
+def run_load(base_url: str, users: int, duration_s: float, mix: Dict[str, float], user: str,
+             password: str, profile: str = "perf", seed: int = 1) -> Dict:
+    """Start `users` virtual users for `duration_s` seconds and return the merged report."""
+    factory = partial(new_driver, profile=profile)
+    vus = []
+    try:
+        # browsers start one after another; the clock only runs once all are up
+        for i in range(users):
+            vus.append(VirtualUser(i, factory, base_url, user, password, mix, 0, seed + i))
+    except Exception:
+        for vu in vus:
+            quit_driver(vu.driver)
+        raise
+    start = time.perf_counter()
+    deadline = time.time() + duration_s
+    for vu in vus:
+        vu.deadline = deadline
+        vu.start()
+    for vu in vus:
+        vu.join()
+    return merge(vus, time.perf_counter() - start)
@@ -0,0 +1,84 @@
+# benchmarks/stats.py
+"""Summary statistics and the baseline-vs-current regression check (stdlib only)."""
+import math
+from typing import Dict, List, Sequence, Tuple
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """q in [0, 100], linear interpolation between closest ranks (numpy's default)."""
+    if not samples:
+        return float("nan")
+    xs = sorted(samples)
+    pos = (len(xs) - 1) * q / 100.0
+    lo, hi = math.floor(pos), math.ceil(pos)
+    return xs[lo] + (xs[hi] - xs[lo]) * (pos - lo)
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    return {
+        "n": len(samples),
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "max": max(samples) if samples else float("nan"),
+        "mean": sum(samples) / len(samples) if samples else float("nan"),
+    }
+
+
+def _ranks(values: List[float]) -> Tuple[List[float], List[int]]:
+    """Average ranks (1-based) of `values` and the sizes of each tie group."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = []
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2.0 + 1
+        ties.append(j - i + 1)
+        i = j + 1
+    return ranks, ties
+
+
+def mann_whitney_greater(baseline: Sequence[float], current: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U test: p-value for "current tends to be larger than baseline".
+    Normal approximation with tie and continuity correction; fine from ~8 samples a side.
+    """
+    n1, n2 = len(baseline), len(current)
+    if not n1 or not n2:
+        return 1.0
+    ranks, ties = _ranks(list(baseline) + list(current))
+    u = sum(ranks[n1:]) - n2 * (n2 + 1) / 2.0
+    n = n1 + n2
+    tie_term = sum(t ** 3 - t for t in ties) / (n * (n - 1)) if n > 1 else 0.0
+    var = n1 * n2 / 12.0 * ((n + 1) - tie_term)
+    if var <= 0:
+        return 1.0  # everything tied
+    z = (u - n1 * n2 / 2.0 - 0.5) / math.sqrt(var)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare_flow(base: Dict, cur: Dict, alpha: float = 0.05, min_slowdown: float = 0.10) -> Dict:
+    """
+    Compare one flow's results. A timing regression needs BOTH a significant test result
+    (p < alpha) and a p50 slowdown of at least `min_slowdown`, so noise on fast flows
+    and tiny-but-consistent shifts don't fail the build. Command counts are deterministic,
+    so any increase of the median count is reported.
+    """
+    b, c = base["samples_s"], cur["samples_s"]
+    p = mann_whitney_greater(b, c)
+    b50, c50 = percentile(b, 50), percentile(c, 50)
+    change = (c50 - b50) / b50 if b50 else 0.0
+    b_cmd, c_cmd = base.get("commands", {}).get("p50"), cur.get("commands", {}).get("p50")
+    return {
+        "p50_base": b50,
+        "p50_current": c50,
+        "change": change,
+        "p_value": p,
+        "slower": p < alpha and change >= min_slowdown,
+        "commands_base": b_cmd,
+        "commands_current": c_cmd,
+        "more_commands": b_cmd is not None and c_cmd is not None and c_cmd > b_cmd,
+    }
@@ -1,56 +1,390 @@
+import json
 import os
-import tempfile, shutil, pytest
+import shutil
+import time
+from functools import partial
+from pathlib import Path
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+from utils import artifacts, command_counter, instrumentation, network_trace, page_metrics
+from utils.browser_contexts import ContextHost
+from utils.checkpoints import CheckpointStore
+from utils.chromedriver import STARTUP, stop_shared_service
+from utils.driver_factory import DEFAULT_PROFILE, PROFILES, new_driver, quit_driver
+from utils.driver_pool import DriverPool
+from utils.local_site import LocalSite
+from utils.parallel import ARTIFACTS_ROOT, artifact_dir, auto_worker_count
+from utils.session_cache import SessionCache, login_via_session
+
+pytest_plugins = ["utils.state_affinity"]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--driver-mode",
+        choices=["pooled", "fresh", "contexts"],
+        default=os.getenv("SAUCEDEMO_DRIVER_MODE", "pooled"),
+        help="pooled: reuse browsers across tests (reset between tests); fresh: new Chrome per test; "
+             "contexts: one Chrome per worker, a new isolated browser context (CDP) per test",
+    )
+    parser.addoption(
+        "--pool-max-uses",
+        type=int,
+        default=int(os.getenv("SAUCEDEMO_POOL_MAX_USES", "25")),
+        help="recycle a pooled (or contexts-mode host) browser after this many tests",
+    )
+    parser.addoption(
+        "--browser-profile",
+        choices=list(PROFILES),
+        default=DEFAULT_PROFILE,
+        help="debug: headed Chrome (default); perf: headless, lean, images/fonts/analytics blocked "
+             "(env SAUCEDEMO_PROFILE)",
+    )
+    parser.addoption(
+        "--page-timing",
+        action="store_true",
+        default=os.getenv("SAUCEDEMO_PAGE_TIMING") == "1",
+        help="time every public page-object method (wait/sleep/act split); "
+             "per-test JSON under artifacts/<worker>/timing/",
+    )
+    parser.addoption(
+        "--command-report",
+        action="store_true",
+        default=os.getenv("SAUCEDEMO_COMMAND_REPORT") == "1",
+        help="write WebDriver command counts per test and per page-object method "
+             "to artifacts/<worker>/commands/ and list the chattiest methods",
+    )
+    parser.addoption(
+        "--page-metrics",
+        action="store_true",
+        default=os.getenv("SAUCEDEMO_PAGE_METRICS") == "1",
+        help="collect navigation/paint/long-task metrics on every page-object load, attach them "
+             "to the report and fail tests that break a page's PERF_BUDGETS",
+    )
+    parser.addoption(
+        "--network-trace",
+        action="store_true",
+        default=os.getenv("SAUCEDEMO_NETWORK_TRACE") == "1",
+        help="stream every request (url, type, timing phases, size, cache) to "
+             "artifacts/<worker>/network/<test>.jsonl with a per-step summary next to it",
+    )
+    parser.addoption(
+        "--page-timing-top",
+        type=int,
+        default=15,
+        help="how many of the slowest page-object actions to list in the summary",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "command_budget(n): fail the test if it sends more than n WebDriver commands "
+        "(counted from the moment the driver fixture hands over the browser)",
+    )
+    # command attribution and per-step network traces need the page-object action stack
+    if any(config.getoption(o) for o in ("--page-timing", "--command-report", "--network-trace")):
+        instrumentation.enable()
+    if config.getoption("--page-metrics"):
+        page_metrics.enable()
+
+
+def pytest_collection_finish(session):
+    # a command_budget failure lists the top actions; without attribution all is "<test>"
+    if any(item.get_closest_marker("command_budget") for item in session.items):
+        instrumentation.enable()
+
+
+def pytest_unconfigure(config):
+    instrumentation.disable()
+
+
+# harness start-up measurement: session start -> first test body
+_HARNESS = {"session_start": None, "first_test": None}
+
+
+def pytest_sessionstart(session):
+    _HARNESS["session_start"] = time.perf_counter()
+    # controller (or single process) starts the run with no report files from earlier runs
+    if not hasattr(session.config, "workerinput"):
+        for kind in ("timing", "commands", "page_metrics", "network"):
+            for d in Path(ARTIFACTS_ROOT).glob(f"*/{kind}"):
+                shutil.rmtree(d, ignore_errors=True)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    if _HARNESS["first_test"] is None:
+        _HARNESS["first_test"] = time.perf_counter()
+    result = yield
+
+    if page_metrics.ENABLED:
+        records = page_metrics.take_records()
+        item.page_metrics = records
+        item.user_properties.append(("page_metrics", records))
+        broken = [v for r in records for v in r["violations"]]
+        if broken:
+            pytest.fail("page performance budget exceeded: " + "; ".join(broken), pytrace=False)
+
+    driver = item.funcargs.get("driver")
+    counter = getattr(driver, "command_counter", None)
+    if counter is None:
+        return result
+    item.command_counts = counter.as_dict()
+    marker = item.get_closest_marker("command_budget")
+    if marker and counter.total > marker.args[0]:
+        top = ", ".join(f"{a}={c['total']}" for a, c in list(item.command_counts["by_action"].items())[:5])
+        pytest.fail(f"WebDriver command budget exceeded: {counter.total} > {marker.args[0]} "
+                    f"(by action: {top})", pytrace=False)
+    return result
+
+
+def pytest_sessionfinish(session):
+    stop_shared_service()
+    artifacts.close()
+
+
+def _page_timing_summary(terminalreporter):
+    records = []
+    for f in Path(ARTIFACTS_ROOT).glob("*/timing/*.json"):
+        try:
+            records.extend(json.loads(f.read_text())["actions"])
+        except (OSError, ValueError, KeyError):
+            continue
+    if not records:
+        return
+    top = terminalreporter.config.getoption("--page-timing-top")
+    terminalreporter.write_sep("-", f"slowest page-object actions (top {top}, inclusive)")
+    terminalreporter.write_line(f"{'action':<48}{'calls':>6}{'total s':>9}{'max s':>8}"
+                                f"{'wait s':>8}{'sleep s':>8}{'act s':>8}")
+    for a in instrumentation.summarize(records)[:top]:
+        terminalreporter.write_line(
+            f"{a['action']:<48}{a['calls']:>6}{a['total_s']:>9.2f}{a['max_s']:>8.2f}"
+            f"{a['wait_s']:>8.2f}{a['sleep_s']:>8.2f}{a['act_s']:>8.2f}"
+        )
+
+
+def _command_summary(terminalreporter):
+    per_action, per_test = {}, []
+    for f in Path(ARTIFACTS_ROOT).glob("*/commands/*.json"):
+        try:
+            data = json.loads(f.read_text())
+        except (OSError, ValueError):
+            continue
+        per_test.append((data["total"], data["test"]))
+        for action, counts in data["by_action"].items():
+            per_action[action] = per_action.get(action, 0) + counts["total"]
+    if not per_test:
+        return
+    top = terminalreporter.config.getoption("--page-timing-top")
+    terminalreporter.write_sep("-", f"WebDriver commands (top {top})")
+    for total, test in sorted(per_test, reverse=True)[:top]:
+        terminalreporter.write_line(f"{total:>6}  {test}")
+    terminalreporter.write_line("by page-object action:")
+    for action, total in sorted(per_action.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        terminalreporter.write_line(f"{total:>6}  {action}")
+
+
+def _page_metrics_summary(terminalreporter):
+    by_page = {}
+    for f in Path(ARTIFACTS_ROOT).glob("*/page_metrics/*.json"):
+        try:
+            pages = json.loads(f.read_text())["pages"]
+        except (OSError, ValueError, KeyError):
+            continue
+        for r in pages:
+            by_page.setdefault((r["page"], r.get("user") or "-"), []).append(r)
+    if not by_page:
+        return
+    terminalreporter.write_sep("-", "page metrics (ready_ms = action/navigation -> page object saw it ready)")
+    terminalreporter.write_line(f"{'page':<16}{'user':<26}{'loads':>6}{'ready p50':>10}{'ready max':>10}"
+                                f"{'fcp max':>9}{'longtask':>9}{'over':>6}")
+    for (page, user), recs in sorted(by_page.items()):
+        # unmarked loads have no ready_ms
+        ready = sorted(r["ready_ms"] for r in recs if r.get("ready_ms") is not None) or ["-"]
+        fcp = max((r.get("fcp_ms") or 0) for r in recs)
+        lt = max((r.get("longtask_ms") or 0) for r in recs)
+        over = sum(1 for r in recs if r["violations"])
+        terminalreporter.write_line(f"{page:<16}{user:<26}{len(recs):>6}{ready[len(ready) // 2]:>10}"
+                                    f"{ready[-1]:>10}{fcp:>9}{lt:>9}{over:>6}")
+
+
+def pytest_terminal_summary(terminalreporter):
+    from pages.base_page import POPUP_STATS
+    if terminalreporter.config.getoption("--page-timing"):
+        _page_timing_summary(terminalreporter)
+    if terminalreporter.config.getoption("--command-report"):
+        _command_summary(terminalreporter)
+    if terminalreporter.config.getoption("--page-metrics"):
+        _page_metrics_summary(terminalreporter)
+
+    if POPUP_STATS["checks"]:
+        terminalreporter.write_sep("-", "native popup guard")
+        terminalreporter.write_line(
+            f"checked {POPUP_STATS['checks']}x, fired {POPUP_STATS['fired']}x, "
+            f"cost {POPUP_STATS['seconds']:.2f}s"
+        )
+
+    if _HARNESS["first_test"] is None:
+        return
+    ttft = _HARNESS["first_test"] - _HARNESS["session_start"]
+    terminalreporter.write_sep("-", "harness start-up")
+    terminalreporter.write_line(
+        f"time to first test: {ttft:.2f}s  "
+        f"(chromedriver resolve: {STARTUP['resolve_s']:.3f}s via {STARTUP['resolved_from'] or '-'}, "
+        f"chromedriver start: {STARTUP['service_start_s']:.3f}s)"
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    # `pytest -n auto`: one worker per core, capped by RAM per Chrome (see utils/parallel.py)
+    return auto_worker_count()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # expose each phase's report on the item (item.rep_setup / rep_call / rep_teardown)
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+    if rep.failed:
+        # write the step ring buffer (+ a final shot while the browser is still up)
+        artifacts.flush_failure(item.funcargs.get("driver") if rep.when != "teardown" else None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    # page-object screenshots of this test go to its own in-memory ring buffer
+    artifacts.begin_test(item.nodeid)
+    instrumentation.begin_test()
+    page_metrics.begin_test()
+    yield
+    artifacts.end_test()
+    if item.config.getoption("--page-timing"):
+        records = instrumentation.take_records()
+        path = artifact_dir("timing") / f"{artifacts.safe_name(item.nodeid)}.json"
+        path.write_text(json.dumps({"test": item.nodeid, "actions": records}, indent=1))
+    records = getattr(item, "page_metrics", None)
+    if records:
+        path = artifact_dir("page_metrics") / f"{artifacts.safe_name(item.nodeid)}.json"
+        path.write_text(json.dumps({"test": item.nodeid, "pages": records}, indent=1))
+    counts = getattr(item, "command_counts", None)
+    if counts and item.config.getoption("--command-report"):
+        path = artifact_dir("commands") / f"{artifacts.safe_name(item.nodeid)}.json"
+        path.write_text(json.dumps({"test": item.nodeid, **counts}, indent=1))
+
 
 @pytest.fixture(scope="session")
-def base_url():
-    # Allow override via env if needed
-    return os.getenv("SAUCEDEMO_BASE_URL", "https://www.saucedemo.com/")
+def local_site():
+    # offline SauceDemo stand-in on an ephemeral localhost port (one per xdist worker)
+    site = LocalSite(glitch_delay_ms=int(os.getenv("SAUCEDEMO_LOCAL_GLITCH_MS", "1500"))).start()
+    yield site
+    site.stop()
+
+@pytest.fixture(scope="session")
+def base_url(request):
+    # Allow override via env if needed; SAUCEDEMO_BASE_URL=local runs against the bundled stand-in
+    url = os.getenv("SAUCEDEMO_BASE_URL", "https://www.saucedemo.com/")
+    if url == "local":
+        return request.getfixturevalue("local_site").url
+    return url
 
 @pytest.fixture(scope="session")
 def password():
     # SauceDemo default password for all predefined users
     return os.getenv("SAUCEDEMO_PASSWORD", "secret_sauce")
 
+@pytest.fixture(scope="session")
+def session_cache(request):
+    # lives under .pytest_cache, so `pytest --cache-clear` forces fresh UI logins
+    return SessionCache(request.config.cache.mkdir("saucedemo_sessions"))
+
+@pytest.fixture
+def login_as(driver, base_url, password, session_cache):
+    """
+    Factory: login_as("standard_user") -> InventoryPage on inventory.html, logged in
+    by injecting the cached session (cookie + app storage) instead of typing into the form.
+    """
+    def _login_as(username: str = "standard_user"):
+        return login_via_session(driver, base_url, username, password, session_cache)
+    return _login_as
+
+@pytest.fixture(scope="module")
+def checkpoint_store():
+    # one per module: a parametrized test file pays for each prefix once
+    return CheckpointStore()
+
+@pytest.fixture
+def checkpoint(driver, base_url, checkpoint_store):
+    """
+    Factory: checkpoint("prefix", "user", build) runs build() once per module and
+    captures the resulting browser state; later calls restore it instead. Returns build()'s result.
+    """
+    def _checkpoint(name: str, user: str, build):
+        return checkpoint_store.get_or_build(driver, base_url, name, user, build)
+    return _checkpoint
+
 @pytest.fixture
-def picked_products(driver, base_url, password):
-    from pages.login_page import LoginPage
+def picked_products(driver, login_as, checkpoint):
     from pages.inventory_page import InventoryPage
 
-    LoginPage(driver).load(base_url).login("standard_user", password)
-    inv = InventoryPage(driver)
-    assert inv.is_loaded()
+    def build():
+        inv = login_as("standard_user")
+        assert inv.is_loaded()
+        inv.clear_cart()
+        picks = inv.choose_random_products(k=4, seed=42)
+        return [p["name"] for p in picks]
 
-    inv.reset_app_state_and_wait()
-    picks = inv.choose_random_products(k=4, seed=42)
-    return [p["name"] for p in picks]
+    names = checkpoint("picked_products", "standard_user", build)
+    assert InventoryPage(driver).is_loaded()
+    return names
+
+def _driver_factory(config):
+    return partial(new_driver, profile=config.getoption("--browser-profile"),
+                   network_log=config.getoption("--network-trace"))
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    pool = DriverPool(_driver_factory(request.config), max_uses=request.config.getoption("--pool-max-uses"))
+    yield pool
+    from utils.state_affinity import STATS
+    STATS["resets_skipped"] += pool.resets_skipped
+    pool.close()
+
+@pytest.fixture(scope="session")
+def context_host(request):
+    host = ContextHost(_driver_factory(request.config), max_uses=request.config.getoption("--pool-max-uses"))
+    yield host
+    host.shutdown()
 
 @pytest.fixture
-def driver():
-    user_data = tempfile.mkdtemp(prefix="chromedata_")
-    options = webdriver.ChromeOptions()
-    options.add_argument(f"--user-data-dir={user_data}")
-    options.add_argument("--no-first-run")
-    options.add_argument("--no-default-browser-check")
-    options.add_argument("--incognito")
-    
-    prefs = {
-        "credentials_enable_service": False,
-        "profile.password_manager_enabled": False
-    }
-    options.add_experimental_option("prefs", prefs)
-    # options.add_argument("--headless=new")  # Uncomment for CI
-    options.add_argument(
-        "--disable-features=PasswordLeakDetection,PasswordManagerOnboarding,AutofillKeychainIntegration"
-    )
-    options.add_argument("--disable-notifications")
-    options.add_argument("--disable-extensions")
-    
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()),options=options)
-    driver.set_page_load_timeout(60)
+def driver(request, base_url):
+    mode = request.config.getoption("--driver-mode")
+    if mode == "contexts":
+        host = request.getfixturevalue("context_host")
+        driver = host.open(base_url)
+    elif mode == "fresh":
+        driver = _driver_factory(request.config)()
+    else:
+        from utils.state_affinity import start_state
+        pool = request.getfixturevalue("driver_pool")
+        driver = pool.acquire(base_url, state=start_state(request.node))
+
+    # count/trace only what the test itself does, not the pool's reset
+    command_counter.attach(driver).reset()
+    if request.config.getoption("--network-trace"):
+        network_trace.start(driver, artifact_dir("network") / f"{artifacts.safe_name(request.node.nodeid)}.jsonl")
     yield driver
-    driver.quit()
-    
+    network_trace.stop()
+
+    rep = getattr(request.node, "rep_call", None)
+    failed = rep is not None and rep.failed
+    if mode == "contexts":
+        # the context goes away either way; a failure also retires the host browser
+        host.close(driver, discard=failed)
+    elif mode == "fresh":
+        quit_driver(driver)
+    else:
+        # a failed test may leave the browser in a weird state; don't hand it on
+        from utils.state_affinity import end_state
+        pool.release(driver, discard=failed, state=end_state(request.node))
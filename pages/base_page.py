@@ -1,41 +1,131 @@
 # pages/base_page.py
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoAlertPresentException, TimeoutException, ElementClickInterceptedException
+from selenium.common.exceptions import (NoAlertPresentException, NoSuchElementException, TimeoutException,
+                                        ElementClickInterceptedException, StaleElementReferenceException,
+                                        WebDriverException)
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
+import copy
+import os
 import time
 
+from pages.catalog import CART_STORAGE_KEY, ids_for, names_for
+from utils import artifacts, instrumentation, locator_cache, page_metrics
+
 
 DEFAULT_TIMEOUT = 15
 
+# how often the native-popup guard was consulted / actually fired, and what firing cost
+POPUP_STATS = {"checks": 0, "fired": 0, "seconds": 0.0}
+# how long each strategy of a FallbackLocator gets before we wait on all of them at once
+FALLBACK_PROBE = 0.5
+
+
+class FallbackLocator:
+    """
+    Alternative locators for ONE element (old/new markup, real site vs stand-in).
+    Accepted by wait_visible/wait_present/wait_clickable; the strategy that matched
+    last time is tried first, also in later runs (see utils/locator_cache.py).
+    """
+
+    def __init__(self, name: str, *locators):
+        self.name = name
+        self.locators = list(locators)
+
+    def ordered(self):
+        best = locator_cache.learned(self.name)
+        return sorted(self.locators, key=lambda loc: locator_cache.key_of(loc) != best)
+
+    def __repr__(self):
+        return f"FallbackLocator({self.name!r}, {len(self.locators)} strategies)"
+
+
 class BasePage:
+    # {user or "*": {metric: max}}, checked when --page-metrics is on (see utils/page_metrics.py)
+    PERF_BUDGETS: dict = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # opt-in per-action timing (pytest --page-timing)
+        instrumentation.maybe_instrument(cls)
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, DEFAULT_TIMEOUT)
+        self._elements = {}  # locator -> WebElement, reused until it goes stale
+        self._memo = {}      # key -> (dom version, value), see cached()
 
     def open(self, url: str):
         self.driver.get(url)
 
     def wait_visible(self, locator, timeout=DEFAULT_TIMEOUT):
-        return WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+        return self._wait_for(EC.visibility_of_element_located, locator, timeout)
 
     def wait_present(self, locator, timeout=DEFAULT_TIMEOUT):
-        return WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
+        return self._wait_for(EC.presence_of_element_located, locator, timeout)
 
     def wait_clickable(self, locator, timeout=DEFAULT_TIMEOUT):
-        return WebDriverWait(self.driver, timeout).until(EC.element_to_be_clickable(locator))
+        return self._wait_for(EC.element_to_be_clickable, locator, timeout)
+
+    def _wait_for(self, condition, locator, timeout):
+        if isinstance(locator, FallbackLocator):
+            return self.find_fallback(locator, condition, timeout)
+        return WebDriverWait(self.driver, timeout).until(condition(locator))
+
+    def find_fallback(self, fallback: FallbackLocator, condition=EC.visibility_of_element_located,
+                      timeout=DEFAULT_TIMEOUT, probe: float = FALLBACK_PROBE):
+        """
+        Resolve a FallbackLocator within ONE timeout (not one per strategy).
+        Each strategy, learned one first, gets a short probe; then a single wait for
+        the remaining time accepts whichever strategy matches first. The winner is remembered.
+        """
+        end = time.time() + timeout
+        strategies = fallback.ordered()
+        for loc in strategies:
+            try:
+                el = WebDriverWait(self.driver, min(probe, max(0, end - time.time())),
+                                   poll_frequency=0.1).until(condition(loc))
+            except TimeoutException:
+                continue
+            locator_cache.remember(fallback.name, loc)
+            return el
+
+        hit = {}
+
+        def any_strategy(d):
+            for loc in strategies:
+                try:
+                    el = condition(loc)(d)
+                except (NoSuchElementException, StaleElementReferenceException):
+                    continue
+                if el:
+                    hit["loc"] = loc
+                    return el
+            return False
+
+        el = WebDriverWait(self.driver, max(0, end - time.time()), poll_frequency=0.2).until(
+            any_strategy, f"none of the {len(strategies)} strategies of {fallback.name!r} matched")
+        locator_cache.remember(fallback.name, hit["loc"])
+        return el
 
     def wait_gone(self, locator, timeout=DEFAULT_TIMEOUT):
         return WebDriverWait(self.driver, timeout).until(EC.invisibility_of_element_located(locator))
     
     def screenshot(self, filename: str) -> bool:
-        """Save a screenshot to the project working dir; returns True/False."""
-        try:
-            return self.driver.save_screenshot(filename)
-        except Exception:
-            return False
+        """
+        Step snapshot; returns True/False. During a test it only records the step in the
+        in-memory ring buffer (label/URL; a PNG only with SAUCEDEMO_STEP_SCREENSHOTS=1),
+        written to artifacts/<worker>/<test>/ if the test fails.
+        Absolute paths are saved immediately, as-is.
+        """
+        if os.path.isabs(filename):
+            try:
+                return self.driver.save_screenshot(filename)
+            except Exception:
+                return False
+        return artifacts.snapshot(self.driver, filename)
         
     def dismiss_pwd_breach_popup(self, tag="pwd_breach"):
         """Best-effort: dismiss Chrome Password Manager breach dialog."""
@@ -74,6 +164,47 @@ class BasePage:
         except Exception: pass
     
         
+    def _escape_enter_twice(self, tag="chrome_pwd_alert"):
+        """Popup action for guard_popup(): ESC+ENTER to the active element, twice."""
+        self.screenshot(f"{tag}_before.png")
+        self.send_escape_enter()
+        time.sleep(0.35)
+        self.send_escape_enter()
+        time.sleep(0.2)
+        self.screenshot(f"{tag}_after.png")
+
+    def page_has_focus(self) -> bool:
+        try:
+            return bool(self.driver.execute_script("return document.hasFocus();"))
+        except Exception:
+            return True
+
+    def guard_popup(self, tag="popup", force=False, action=None) -> bool:
+        """
+        On-demand guard against Chrome's native password popups.
+        Runs `action` (default: dismiss_pwd_breach_popup) only when forced, i.e. a click was
+        intercepted, or when the page has lost focus. Returns True if it fired.
+        """
+        POPUP_STATS["checks"] += 1
+        if not force and self.page_has_focus():
+            return False
+        start = time.perf_counter()
+        try:
+            (action or self.dismiss_pwd_breach_popup)(tag)
+        except Exception:
+            pass
+        POPUP_STATS["fired"] += 1
+        POPUP_STATS["seconds"] += time.perf_counter() - start
+        return True
+
+    def click_guarded(self, element, tag="click"):
+        """Native click; if something intercepts it, run the popup guard and JS-click instead."""
+        try:
+            element.click()
+        except ElementClickInterceptedException:
+            self.guard_popup(tag, force=True)
+            self.driver.execute_script("arguments[0].click();", element)
+
     def send_escape_enter(self):
         """Best-effort: dismiss native browser prompts (e.g., password manager)."""
         try:
@@ -121,7 +252,259 @@ class BasePage:
     def execute_script(self, script, *args):
         return self.driver.execute_script(script, *args)
 
-    
+    # ---------- in-browser waits ----------
+    # The condition is a JS function body; wait args arrive as arguments[0..n].
+    # It is re-checked on every DOM mutation (plus a slow safety tick for non-DOM
+    # state like URL/storage), so the wait costs one round trip and returns as
+    # soon as the page changes.
+    _WAIT_JS = """
+        var done = arguments[arguments.length - 1];
+        var timeoutMs = arguments[arguments.length - 2];
+        var args = Array.prototype.slice.call(arguments, 0, arguments.length - 2);
+        function check() { /*CONDITION*/ }
+        function test() { try { return check.apply(null, args); } catch (e) { return null; } }
+        var first = test();
+        if (first) { done({ok: true, value: first}); return; }
+        var finished = false, obs, tick, timer;
+        function finish(ok, value) {
+            if (finished) { return; }
+            finished = true; obs.disconnect(); clearInterval(tick); clearTimeout(timer);
+            done({ok: ok, value: value});
+        }
+        function retest() { var v = test(); if (v) { finish(true, v); } }
+        obs = new MutationObserver(retest);
+        obs.observe(document.documentElement,
+                    {subtree: true, childList: true, attributes: true, characterData: true});
+        tick = setInterval(retest, 250);
+        timer = setTimeout(function () { finish(false, test()); }, timeoutMs);
+    """
+    _CHECK_JS = "return (function () { /*CONDITION*/ }).apply(null, arguments);"
+
+    def _ensure_script_timeout(self, seconds: float):
+        # set once per driver (it's a round trip of its own), only ever raised
+        current = getattr(self.driver, "_pom_script_timeout", 0)
+        if current < seconds:
+            self.driver.set_script_timeout(seconds)
+            self.driver._pom_script_timeout = seconds
+
+    def wait_for_js(self, condition: str, *args, timeout: float = DEFAULT_TIMEOUT, message: str = ""):
+        """
+        Wait until the JS function body `condition` returns something truthy; returns that value.
+        Raises TimeoutException like WebDriverWait. If the page navigates mid-wait the
+        async script dies with it, so we fall back to polling the same condition.
+        """
+        end = time.time() + timeout
+        self._ensure_script_timeout(max(30, timeout + 5))
+        try:
+            res = self.driver.execute_async_script(
+                self._WAIT_JS.replace("/*CONDITION*/", condition), *args, int(timeout * 1000))
+            if res and res.get("ok"):
+                return res["value"]
+            raise TimeoutException(message or f"JS condition not met within {timeout}s")
+        except TimeoutException:
+            raise
+        except WebDriverException:
+            remaining = max(0.5, end - time.time())
+            check = self._CHECK_JS.replace("/*CONDITION*/", condition)
+            return WebDriverWait(self.driver, remaining, poll_frequency=0.1).until(
+                lambda d: d.execute_script(check, *args), message)
+
+    # ---------- settled absence (fast negative checks) ----------
+    # Resolves on the first of: a terminal selector shows up, the DOM has been
+    # quiet for quietMs on a stable URL with the document loaded, or the cap.
+    _SETTLE_JS = """
+        var done = arguments[arguments.length - 1];
+        var terminal = arguments[0], quietMs = arguments[1], capMs = arguments[2];
+        var url = location.href, last = Date.now(), finished = false, obs, tick, cap;
+        function hit() {
+            for (var i = 0; i < terminal.length; i++) {
+                if (document.querySelector(terminal[i])) { return terminal[i]; }
+            }
+            return null;
+        }
+        function finish(reason, selector) {
+            if (finished) { return; }
+            finished = true; obs.disconnect(); clearInterval(tick); clearTimeout(cap);
+            done({reason: reason, selector: selector || null});
+        }
+        obs = new MutationObserver(function () {
+            last = Date.now();
+            var t = hit(); if (t) { finish('terminal', t); }
+        });
+        var t0 = hit();
+        if (t0) { done({reason: 'terminal', selector: t0}); return; }
+        obs.observe(document.documentElement,
+                    {subtree: true, childList: true, attributes: true, characterData: true});
+        tick = setInterval(function () {
+            if (location.href !== url) { url = location.href; last = Date.now(); }
+            if (document.readyState === 'complete' && Date.now() - last >= quietMs) { finish('quiet'); }
+        }, 50);
+        cap = setTimeout(function () { finish('cap'); }, capMs);
+    """
+
+    @staticmethod
+    def _to_css(locator) -> str:
+        by, value = locator
+        if by == By.CSS_SELECTOR:
+            return value
+        if by == By.ID:
+            return f"[id='{value}']"
+        if by == By.CLASS_NAME:
+            return f".{value}"
+        raise ValueError(f"terminal locators must be CSS/ID/CLASS_NAME, got {locator}")
+
+    def wait_settled(self, terminal=(), quiet_ms: int = 300, cap: float = 3.0) -> str:
+        """
+        Block until the page reaches a terminal state or goes quiet; never longer than `cap` seconds.
+        terminal: locators whose appearance ends the wait at once (e.g. an error banner).
+        Returns 'terminal', 'quiet' or 'cap'.
+        """
+        css = [self._to_css(loc) for loc in terminal]
+        end = time.time() + cap
+        self._ensure_script_timeout(max(30, cap + 5))
+        while True:
+            remaining = end - time.time()
+            if remaining <= 0:
+                return "cap"
+            try:
+                res = self.driver.execute_async_script(self._SETTLE_JS, css, quiet_ms, int(remaining * 1000))
+                return (res or {}).get("reason", "cap")
+            except WebDriverException:
+                # navigation killed the script; settle again on the new document
+                time.sleep(0.05)
+
+    def is_absent(self, locator, terminal=(), quiet_ms: int = 300, cap: float = 3.0) -> bool:
+        """True when `locator` is not visible once the page has settled (see wait_settled)."""
+        self.wait_settled(terminal=terminal, quiet_ms=quiet_ms, cap=cap)
+        try:
+            return not any(e.is_displayed() for e in self.driver.find_elements(*locator))
+        except WebDriverException:
+            return True
+
+    # ---------- bulk reads ----------
+    _READ_ROWS_JS = """
+        var rows = document.querySelectorAll(arguments[0]), fields = arguments[1], out = [];
+        for (var i = 0; i < rows.length; i++) {
+            var row = {};
+            for (var key in fields) {
+                var spec = fields[key].split('@'), el = rows[i].querySelector(spec[0]);
+                if (!el) { row[key] = null; continue; }
+                row[key] = spec[1] ? el.getAttribute(spec[1])
+                                   : (el.innerText || el.textContent || '').trim();
+            }
+            out.push(row);
+        }
+        return out;
+    """
+
+    def read_rows(self, row_locator, fields: dict) -> list:
+        """
+        Read a whole listing in ONE WebDriver round trip.
+        row_locator: CSS locator of the repeated row, e.g. (By.CSS_SELECTOR, ".cart_item")
+        fields: {key: "css"} for trimmed text or {key: "css@attr"} for an attribute.
+        Returns [{key: str|None}] in DOM order (None when the sub-element is missing).
+        """
+        by, css = row_locator
+        assert by == By.CSS_SELECTOR, f"read_rows needs a CSS row locator, got {row_locator}"
+        return self.driver.execute_script(self._READ_ROWS_JS, css, fields) or []
+
+    # ---------- front-end metrics (opt-in) ----------
+    def _mark(self, action: str):
+        """Right before an action that brings up another page: its ready_ms counts from here."""
+        page_metrics.mark(self.driver, action)
+
+    def _page_ready(self):
+        page_metrics.collect(self)
+
+    # ---------- element / derived-data cache ----------
+    # A page-global MutationObserver counts DOM changes; together with a per-document
+    # id that gives a version string that changes on ANY mutation or navigation.
+    _JS_DOM_VERSION = """
+        if (!window.__pomDocId) {
+            window.__pomDocId = Math.random().toString(36).slice(2);
+            window.__pomMutations = 0;
+            new MutationObserver(function () { window.__pomMutations++; }).observe(
+                document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+        }
+        return window.__pomDocId + ':' + window.__pomMutations;
+    """
+
+    def dom_version(self):
+        try:
+            return self.driver.execute_script(self._JS_DOM_VERSION)
+        except WebDriverException:
+            return None  # mid-navigation: treat as "unknown", i.e. always a miss
+
+    def element(self, locator, visible_timeout: float = 0, fresh: bool = False):
+        """
+        WebElement for `locator`, found once per page object and then reused.
+        visible_timeout > 0 waits for visibility on the first lookup.
+        """
+        el = None if fresh else self._elements.get(locator)
+        if el is None:
+            el = (self.wait_visible(locator, visible_timeout) if visible_timeout
+                  else self.driver.find_element(*locator))
+            self._elements[locator] = el
+        return el
+
+    def on_element(self, locator, fn, visible_timeout: float = 0):
+        """fn(element) on the cached element; a stale element is re-resolved and fn retried once."""
+        try:
+            return fn(self.element(locator, visible_timeout))
+        except StaleElementReferenceException:
+            return fn(self.element(locator, visible_timeout, fresh=True))
+
+    def cached(self, key, compute, copy_value: bool = True):
+        """
+        compute() once per DOM state: repeated reads cost one version check instead of
+        the full extraction. Returns a copy so callers can't edit the cached value;
+        copy_value=False hands out the cached object itself (large indexes, WebElements).
+        """
+        version = self.dom_version()
+        hit = self._memo.get(key)
+        if version is not None and hit is not None and hit[0] == version:
+            return copy.deepcopy(hit[1]) if copy_value else hit[1]
+        value = compute()
+        # tagged with the version from BEFORE compute: if the page changed meanwhile,
+        # the next call sees a newer version and recomputes
+        self._memo[key] = (version, value)
+        return copy.deepcopy(value) if copy_value else value
+
+    def forget(self):
+        """Drop all cached elements and reads (e.g. after driving the page behind our back)."""
+        self._elements.clear()
+        self._memo.clear()
+
+    # ---------- cart state in app storage ----------
+    # The app keeps the cart in localStorage (see pages/catalog.py). Writes only
+    # show up in the UI after a reload; reads are one cheap script.
+    _JS_CART_IDS = """
+        try { return JSON.parse(localStorage.getItem(arguments[0])) || []; } catch (e) { return []; }
+    """
+    # arguments: key, expected count -> {count} so that 0 is still truthy
+    _JS_CART_STORAGE_COUNT = """
+        var ids;
+        try { ids = JSON.parse(localStorage.getItem(arguments[0])) || []; } catch (e) { ids = []; }
+        return ids.length === arguments[1] ? {count: ids.length} : false;
+    """
+
+    def cart_ids_in_storage(self) -> list:
+        return self.driver.execute_script(self._JS_CART_IDS, CART_STORAGE_KEY) or []
+
+    def cart_names_in_storage(self) -> list:
+        return names_for(self.cart_ids_in_storage())
+
+    def write_cart_storage(self, names):
+        """Replace the stored cart with `names` (empty -> no cart). Caller reloads the page."""
+        self.driver.execute_script(
+            "if (arguments[1].length) { localStorage.setItem(arguments[0], JSON.stringify(arguments[1])); }"
+            " else { localStorage.removeItem(arguments[0]); }",
+            CART_STORAGE_KEY, ids_for(names))
+
+    def wait_cart_storage_count(self, expected: int, timeout: float = 10) -> int:
+        res = self.wait_for_js(self._JS_CART_STORAGE_COUNT, CART_STORAGE_KEY, expected, timeout=timeout,
+                               message=f"stored cart never held {expected} item(s)")
+        return res["count"]
 
     def is_url_contains(self, fragment: str) -> bool:
         return fragment in self.driver.current_url
@@ -1,5 +1,6 @@
 # pages/cart_page.py
 from typing import List, Dict
+from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 #<span class="shopping_cart_badge" data-test="shopping-cart-badge">4</span>
@@ -13,6 +14,7 @@ class CartPage(BasePage):
     ITEM_QTY     = (By.CSS_SELECTOR, ".cart_quantity")
     CHECKOUT_BTN = (By.ID, "checkout")
     CONTINUE_SHOP  = (By.ID, "continue-shopping")  
+    PERF_BUDGETS = {"*": {"ready_ms": 3000}}
 
 
     # def item_names(self) -> List[str]:
@@ -20,7 +22,10 @@ class CartPage(BasePage):
     def is_loaded(self) -> bool:
         try:
             el = self.wait_visible(self.TITLE, timeout=10)
-            return "Your Cart" in (el.text or "")
+            if "Your Cart" not in (el.text or ""):
+                return False
+            self._page_ready()
+            return True
         except Exception:
             return False
 
@@ -34,15 +39,23 @@ class CartPage(BasePage):
         """
         Returns a list of dicts like:
         {'name': 'Sauce Labs Backpack', 'price_text': '$29.99', 'price': 29.99, 'qty': 1}
+        Computed once per DOM state; item_names/items_by_name reuse it.
         """
+        return self.cached("item_details", self._read_item_details)
+
+    def _read_item_details(self) -> List[Dict]:
         self.is_loaded()  # soft guard the page
-        rows = self.driver.find_elements(*self.CART_ITEM)
+        rows = self.read_rows(self.CART_ITEM, {
+            "name": self.ITEM_NAME[1],
+            "price_text": self.ITEM_PRICE[1],
+            "qty": self.ITEM_QTY[1],
+        })
         data = []
         for r in rows:
-            name       = r.find_element(*self.ITEM_NAME).text.strip()
-            price_text = r.find_element(*self.ITEM_PRICE).text.strip()
+            name       = r["name"] or ""
+            price_text = r["price_text"] or ""
             # SauceDemo shows qty; default to 1 if missing/blank
-            qty_txt = r.find_element(*self.ITEM_QTY).text.strip() if r.find_elements(*self.ITEM_QTY) else "1"
+            qty_txt = r["qty"] or "1"
             qty = int(qty_txt) if qty_txt.isdigit() else 1
             data.append({
                 "name": name,
@@ -52,6 +65,14 @@ class CartPage(BasePage):
             })
         return data
 
+    def seed(self, names):
+        """Open the cart page already holding `names` (written to app storage, no clicking)."""
+        names = list(names)
+        self.write_cart_storage(names)
+        self.driver.get(urljoin(self.driver.current_url, "cart.html"))
+        assert self.is_loaded(), "cart page did not load after seeding"
+        return self
+
     def item_names(self) -> List[str]:
         return [d["name"] for d in self.item_details()]
 
@@ -60,6 +81,7 @@ class CartPage(BasePage):
         return {d["name"]: d for d in self.item_details()}
     
     def go_to_checkout(self):
+        self._mark("checkout")
         self.wait_clickable(self.CHECKOUT_BTN, timeout=5).click()
 
     def is_empty(self) -> bool:
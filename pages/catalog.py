@@ -0,0 +1,41 @@
+# pages/catalog.py
+"""
+SauceDemo product ids and predefined users. The app keeps the cart as a JSON array of
+these ids in localStorage['cart-contents'], so a cart can be seeded/read without
+touching the UI.
+"""
+from typing import Iterable, List
+
+CART_STORAGE_KEY = "cart-contents"
+
+PRODUCT_IDS = {
+    "Sauce Labs Backpack": 4,
+    "Sauce Labs Bike Light": 0,
+    "Sauce Labs Bolt T-Shirt": 1,
+    "Sauce Labs Fleece Jacket": 5,
+    "Sauce Labs Onesie": 2,
+    "Test.allTheThings() T-Shirt (Red)": 3,
+}
+PRODUCT_NAMES = {pid: name for name, pid in PRODUCT_IDS.items()}
+
+
+def ids_for(names: Iterable[str]) -> List[int]:
+    unknown = [n for n in names if n not in PRODUCT_IDS]
+    assert not unknown, f"no product id known for {unknown}; update pages/catalog.py"
+    return [PRODUCT_IDS[n] for n in names]
+
+
+def names_for(ids: Iterable[int]) -> List[str]:
+    return [PRODUCT_NAMES.get(i, f"<product {i}>") for i in ids]
+
+
+# Known predefined users on saucedemo.com
+USERS_MATRIX = [
+    # (username, expect_success, note/behavior)
+    ("standard_user", True,  "Baseline successful login"),
+    ("locked_out_user", False, "Should be blocked with error"),
+    ("problem_user", True, "Login succeeds; downstream UI issues by design"),
+    ("performance_glitch_user", True, "Login succeeds; slower load by design"),
+    ("error_user", True, "Login succeeds; checkout has known issues by design"),
+    ("visual_user", True, "Login succeeds; visual differences by design"),
+]
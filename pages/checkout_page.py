@@ -24,19 +24,24 @@ class CheckoutPage(BasePage):
     # Complete page
     COMPLETE_HEADER   = (By.CSS_SELECTOR, "h2.complete-header")       # "Thank you for your order!"
     BACK_HOME         = (By.ID, "back-to-products")
+    PERF_BUDGETS = {"*": {"ready_ms": 3000}}
 
     # ---------- Step 1: info ----------
     def fill_info_and_continue(self, first: str, last: str, postal: str):
         self.wait_visible(self.FIRST_NAME, timeout=10).send_keys(first)
         self.driver.find_element(*self.LAST_NAME).send_keys(last)
         self.driver.find_element(*self.POSTAL).send_keys(postal)
+        self._mark("continue")
         self.wait_clickable(self.CONTINUE, timeout=5).click()
 
     # ---------- Step 2: overview ----------
     def is_overview_loaded(self) -> bool:
         try:
             el = self.wait_visible(self.TITLE, timeout=10)
-            return "Checkout: Overview" in (el.text or "")
+            if "Checkout: Overview" not in (el.text or ""):
+                return False
+            self._page_ready()
+            return True
         except Exception:
             return False
 
@@ -49,11 +54,14 @@ class CheckoutPage(BasePage):
     def overview_items(self) -> List[Dict]:
         """List of items on the overview page: {'name','price_text','price'}"""
         assert self.is_overview_loaded(), "Overview not loaded"
-        rows = self.driver.find_elements(*self.OVERVIEW_ITEM)
+        rows = self.read_rows(self.OVERVIEW_ITEM, {
+            "name": self.OVERVIEW_NAME[1],
+            "price_text": self.OVERVIEW_PRICE[1],
+        })
         out = []
         for r in rows:
-            name       = r.find_element(*self.OVERVIEW_NAME).text.strip()
-            price_text = r.find_element(*self.OVERVIEW_PRICE).text.strip()
+            name       = r["name"] or ""
+            price_text = r["price_text"] or ""
             out.append({
                 "name": name,
                 "price_text": price_text,
@@ -76,7 +84,10 @@ class CheckoutPage(BasePage):
 
     # ---------- Finish ----------
     def finish(self):
+        self._mark("finish")
         self.wait_clickable(self.FINISH, timeout=5).click()
 
     def confirmation_message(self) -> str:
-        return self.wait_visible(self.COMPLETE_HEADER, timeout=10).text.strip()
+        text = self.wait_visible(self.COMPLETE_HEADER, timeout=10).text.strip()
+        self._page_ready()
+        return text
@@ -1,9 +1,8 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
-import time
 import random
 from typing import List, Dict, Optional
-from pages.base_page import BasePage
+from pages.base_page import BasePage, FallbackLocator
 from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, StaleElementReferenceException
 from selenium.webdriver.support import expected_conditions as EC
 
@@ -21,10 +20,116 @@ class InventoryPage(BasePage):
     PRODUCT_PRICE = (By.CSS_SELECTOR, ".inventory_item_price")
     CART_BADGE  = (By.CLASS_NAME, "shopping_cart_badge")
     #SORT_SELECT = (By.CSS_SELECTOR, "select[data-test='product_sort_container']")
-    SORT_SELECTS = [
-        (By.CSS_SELECTOR, "select[data-test='product_sort_container']"),(By.CLASS_NAME,  "product_sort_container"),(By.XPATH,"//select[contains(@class,'product_sort_container')]"),]
+    SORT_SELECT = FallbackLocator(
+        "InventoryPage.SORT_SELECT",
+        (By.CSS_SELECTOR, "select[data-test='product-sort-container']"),
+        (By.CSS_SELECTOR, "select[data-test='product_sort_container']"),
+        (By.CLASS_NAME,  "product_sort_container"),
+        (By.XPATH, "//select[contains(@class,'product_sort_container')]"),
+    )
     RESET_LINK  = (By.ID, "reset_sidebar_link")
     MENU_WRAP  = (By.CSS_SELECTOR, "div.bm-menu-wrap")   # the sliding container
+    PERF_BUDGETS = {
+        "*": {"ready_ms": 5000, "longtask_ms": 1000},
+        "standard_user": {"ready_ms": 3000},
+        "performance_glitch_user": {"ready_ms": 10000},  # slow by design
+    }
+
+    # ---------- in-page conditions for BasePage.wait_for_js ----------
+    _JS_BADGE = """
+        var b = document.querySelector('.shopping_cart_badge');
+        var n = b ? parseInt((b.textContent || '').trim(), 10) : 0;
+        return isNaN(n) ? 0 : n;
+    """
+    # arguments: name, expected_badge
+    _JS_ADDED = """
+        var badge = (function () {""" + _JS_BADGE + """})();
+        if (badge === arguments[1]) { return true; }
+        var cards = document.querySelectorAll('.inventory_item');
+        for (var i = 0; i < cards.length; i++) {
+            var n = cards[i].querySelector('.inventory_item_name');
+            if (!n || (n.textContent || '').trim() !== arguments[0]) { continue; }
+            var btn = cards[i].querySelector('button.btn_inventory');
+            return !!btn && ((btn.textContent || '').trim().toLowerCase() === 'remove'
+                             || (btn.id || '').indexOf('remove-') === 0);
+        }
+        return false;
+    """
+    # arguments: expected_badge  -> {count} so that 0 is still truthy
+    _JS_BADGE_EQUALS = """
+        var badge = (function () {""" + _JS_BADGE + """})();
+        return badge === arguments[0] ? {count: badge} : false;
+    """
+    _JS_CART_CLEARED = """
+        if (document.querySelector('.shopping_cart_badge')) { return false; }
+        var btns = document.querySelectorAll('.inventory_item button.btn_inventory');
+        for (var i = 0; i < btns.length; i++) {
+            if ((btns[i].textContent || '').trim().toLowerCase() === 'remove') { return false; }
+        }
+        return true;
+    """
+    # arguments: names -> [{name, button, state}] in the same order; button null when not found
+    _JS_LOCATE_BUTTONS = """
+        var byName = {}, cards = document.querySelectorAll('.inventory_item');
+        for (var i = 0; i < cards.length; i++) {
+            var n = cards[i].querySelector('.inventory_item_name');
+            if (n) { byName[(n.textContent || '').trim()] = cards[i].querySelector('button.btn_inventory'); }
+        }
+        return arguments[0].map(function (name) {
+            var btn = byName[name] || null;
+            var remove = !!btn && ((btn.textContent || '').trim().toLowerCase() === 'remove'
+                                   || (btn.id || '').indexOf('remove-') === 0);
+            return {name: name, button: btn, state: btn ? (remove ? 'remove' : 'add') : null};
+        });
+    """
+    # -> {name: {card, button, button_id, button_text}} for every card, in one pass
+    _JS_CARD_INDEX = """
+        var index = {}, cards = document.querySelectorAll('.inventory_item');
+        for (var i = 0; i < cards.length; i++) {
+            var n = cards[i].querySelector('.inventory_item_name');
+            if (!n) { continue; }
+            var btn = cards[i].querySelector('button.btn_inventory');
+            index[(n.textContent || '').trim()] = {
+                card: cards[i], button: btn,
+                button_id: btn ? (btn.id || '') : '',
+                button_text: btn ? (btn.textContent || '').trim() : ''
+            };
+        }
+        return index;
+    """
+    # arguments: names, expected_badge -> {count} once the badge matches AND every name shows Remove
+    _JS_ALL_ADDED = """
+        var badge = (function () {""" + _JS_BADGE + """})();
+        if (badge !== arguments[1]) { return false; }
+        var states = (function () {""" + _JS_LOCATE_BUTTONS + """}).apply(null, [arguments[0]]);
+        for (var i = 0; i < states.length; i++) {
+            if (states[i].state !== 'remove') { return false; }
+        }
+        return {count: badge};
+    """
+    # arguments: min_count
+    _JS_PRODUCTS_AT_LEAST = "return document.querySelectorAll('.inventory_item').length >= arguments[0];"
+    # arguments: sort value, names before the change
+    _JS_SORT_APPLIED = """
+        var sel = document.querySelector("select[data-test='product_sort_container'], "
+            + "select[data-test='product-sort-container'], select.product_sort_container");
+        if (!sel || sel.value !== arguments[0]) { return false; }
+        var cards = document.querySelectorAll('.inventory_item'), names = [], prices = [];
+        for (var i = 0; i < cards.length; i++) {
+            var n = cards[i].querySelector('.inventory_item_name');
+            var p = cards[i].querySelector('.inventory_item_price');
+            names.push(n ? (n.textContent || '').trim() : '');
+            prices.push(p ? parseFloat((p.textContent || '').replace('$', '')) : 0);
+        }
+        if (JSON.stringify(names) !== JSON.stringify(arguments[1])) { return true; }
+        // unchanged order is fine when it already satisfies the requested sort (e.g. 'az' on load)
+        var key = arguments[0], vals = (key === 'lohi' || key === 'hilo') ? prices : names;
+        var desc = (key === 'za' || key === 'hilo');
+        for (var j = 1; j < vals.length; j++) {
+            if (desc ? vals[j - 1] < vals[j] : vals[j - 1] > vals[j]) { return false; }
+        }
+        return true;
+    """
     
 
     def is_loaded(self) -> bool:
@@ -32,11 +137,20 @@ class InventoryPage(BasePage):
             self.wait_visible(self.TITLE)
             self.wait_visible(self.INVENTORY_LIST)
             self._wait_products_count_at_least(1)
+            self._page_ready()
             return True
         except Exception:
             return False
-        
-    
+
+    def is_not_loaded(self, cap: float = 3.0) -> bool:
+        """
+        Fast negative of is_loaded(): settles on the login error banner, the inventory
+        itself, or a quiet DOM instead of burning DEFAULT_TIMEOUT.
+        """
+        from pages.login_page import LoginPage
+        return self.is_absent(self.INVENTORY_LIST,
+                              terminal=[LoginPage.ERROR_BANNER, self.INVENTORY_LIST], cap=cap)
+
     def logout_style(self) -> str:
         try:
             el = self.wait_present(self.LOGOUT_LINK, timeout=2)
@@ -64,12 +178,8 @@ class InventoryPage(BasePage):
         return el
 
     def maybe_close_chrome_password_alert(self, tag="pwd_alert"):
-        self.screenshot(f"{tag}_before.png")
-        self.send_escape_enter()
-        time.sleep(0.4)
-        self.send_escape_enter()
-        time.sleep(0.2)
-        self.screenshot(f"{tag}_after.png")
+        # only when a native popup actually took focus
+        return self.guard_popup(tag, action=self._escape_enter_twice)
 
     def open_menu(self):
         if self._menu_is_open():
@@ -86,9 +196,8 @@ class InventoryPage(BasePage):
             )
         
     def _wait_products_count_at_least(self, n: int, timeout: int = 10):
-        WebDriverWait(self.driver, timeout, poll_frequency=0.5).until(
-            lambda d: len(d.find_elements(*self.PRODUCT_CARD)) >= n
-        )
+        self.wait_for_js(self._JS_PRODUCTS_AT_LEAST, n, timeout=timeout,
+                         message=f"fewer than {n} product cards after {timeout}s")
 
     def _parse_price(self, txt: str) -> Optional[float]:
         # '$29.99' -> 29.99
@@ -105,21 +214,34 @@ class InventoryPage(BasePage):
         return int(txt) if txt.isdigit() else 0
 
 
-    def fetch_all_products(self) -> List[Dict]:
-        """Return all listed products as dicts: {'name','price_text','price'}."""
-        self._wait_products_count_at_least(1)
-        cards = self.driver.find_elements(*self.PRODUCT_CARD)
+    def _read_cards(self) -> List[Dict]:
+        """
+        All cards in current UI order, read in one round trip:
+        {'name','price_text','price','button_id','button_text'}.
+        """
+        rows = self.read_rows(self.PRODUCT_CARD, {
+            "name": self.PRODUCT_NAME[1],
+            "price_text": self.PRODUCT_PRICE[1],
+            "button_id": "button.btn_inventory@id",
+            "button_text": "button.btn_inventory",
+        })
         out = []
-        for c in cards:
-            name = c.find_element(*self.PRODUCT_NAME).text.strip()
-            price_text = c.find_element(*self.PRODUCT_PRICE).text.strip()
+        for r in rows:
+            price_text = r["price_text"] or ""
             out.append({
-                "name": name,
+                "name": r["name"] or "",
                 "price_text": price_text,
                 "price": self._parse_price(price_text),
+                "button_id": r["button_id"] or "",
+                "button_text": r["button_text"] or "",
             })
         return out
 
+    def fetch_all_products(self) -> List[Dict]:
+        """Return all listed products as dicts: {'name','price_text','price'}."""
+        self._wait_products_count_at_least(1)
+        return [{k: c[k] for k in ("name", "price_text", "price")} for c in self._read_cards()]
+
     def choose_random_products(self, k: int = 4, seed: Optional[int] = None) -> List[Dict]:
         """
         Randomly sample k products (without replacement) from what's visible.
@@ -135,60 +257,103 @@ class InventoryPage(BasePage):
             print(f"[RANDOM PICK] {p['name']} — {p['price_text']}")
         return chosen
     
+    def _card_index(self) -> Dict[str, Dict]:
+        """
+        name -> {'card','button','button_id','button_text'}, built in one script per DOM
+        state (a sort, reset or navigation rebuilds it). Shared, not copied: read only.
+        """
+        return self.cached("card_index",
+                           lambda: self.driver.execute_script(self._JS_CARD_INDEX) or {},
+                           copy_value=False)
+
     def _find_card_by_name(self, name: str):
-        for c in self.driver.find_elements(*self.PRODUCT_CARD):
-            try:
-                if c.find_element(*self.PRODUCT_NAME).text.strip() == name:
-                    return c
-            except StaleElementReferenceException:
-                continue
-        raise AssertionError(f"Product card not found for name: {name}")
+        entry = self._card_index().get(name)
+        if entry is None:
+            raise AssertionError(f"Product card not found for name: {name}")
+        return entry["card"]
+
+    def _card_state(self, name: str) -> Optional[Dict]:
+        """Index entry for `name`, or None when no such card is rendered."""
+        return self._card_index().get(name)
 
     def _is_remove_state_by_name(self, name: str) -> bool:
         try:
-            card = self._find_card_by_name(name)
-            btn  = card.find_element(By.CSS_SELECTOR, "button.btn_inventory")
-            txt  = (btn.text or "").strip().lower()
-            bid  = (btn.get_attribute("id") or "")
-            return (txt == "remove") or bid.startswith("remove-")
+            c = self._card_state(name)
+            return bool(c) and (c["button_text"].strip().lower() == "remove"
+                                or c["button_id"].startswith("remove-"))
         except Exception:
             return False
     
 
     def _click_add_for_name(self, name: str) -> bool:
-    # Best-effort: close native popup
-        try:
-            self.dismiss_pwd_breach_popup(tag=f"before_add_{name}")
-        except Exception:
-            pass
+        for attempt in range(2):
+            entry = self._card_state(name)
+            if entry is None or entry["button"] is None:
+                raise AssertionError(f"Product card not found for name: {name}")
 
-        card = self._find_card_by_name(name)
-        btn  = card.find_element(By.CSS_SELECTOR, "button.btn_inventory")
-
-        # already in cart? nothing to do
-        if (btn.text or "").strip().lower() == "remove" or (btn.get_attribute("id") or "").startswith("remove-"):
-            return False
+            # already in cart? nothing to do
+            if entry["button_text"].lower() == "remove" or entry["button_id"].startswith("remove-"):
+                return False
 
-        self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
-        try:
-            btn.click()
-        except ElementClickInterceptedException:
+            btn = entry["button"]
             try:
-                self.dismiss_pwd_breach_popup(tag=f"after_intercept_{name}")
-            except Exception:
-                pass
-            self.driver.execute_script("arguments[0].click();", btn)
-
-        return True   
+                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", btn)
+                # popup handling only kicks in if the click is actually intercepted
+                self.click_guarded(btn, tag=f"after_intercept_{name}")
+                return True
+            except StaleElementReferenceException:
+                # re-rendered between the index read and the click: rebuild it once
+                self._memo.pop("card_index", None)
+                if attempt:
+                    raise
 
     def _wait_added_by_badge_or_button(self, name: str, expected_badge: int, timeout: int = 12):
-        WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
-            lambda d: self.get_cart_badge_count() == expected_badge or self._is_remove_state_by_name(name)
-        )
+        self.wait_for_js(self._JS_ADDED, name, expected_badge, timeout=timeout,
+                         message=f"'{name}' not added (badge != {expected_badge}, button not Remove)")
     
 
-    def add_products_to_cart_by_names(self, names):
-        """Add each named product; succeed when badge increments OR button shows Remove."""
+    def add_products_to_cart_by_names(self, names, batch: bool = True):
+        """
+        Add each named product to the cart.
+        batch=True: locate every button in one script, click them all, then ONE wait for
+        the final badge count plus Remove on every item. Anything that goes wrong on the
+        way (re-render, missed click) falls back to the per-item path for what is left.
+        """
+        names = list(names)
+        if batch and self._add_products_batch(names):
+            return
+        self._add_products_one_by_one(names)
+
+    def _locate_buttons(self, names) -> List[Dict]:
+        return self.driver.execute_script(self._JS_LOCATE_BUTTONS, list(names)) or []
+
+    def _add_products_batch(self, names) -> bool:
+        """True when all `names` ended up in the cart; False means 'use the fallback'."""
+        if not names:
+            return True
+        start = self.get_cart_badge_count()
+        pending = [r for r in self._locate_buttons(names) if r["state"] != "remove"]
+        if any(r["button"] is None for r in pending):
+            return False  # card not rendered (yet); the per-item path waits/reports properly
+        clicked = 0
+        while pending:
+            r = pending.pop(0)
+            try:
+                self.click_guarded(r["button"], tag=f"after_intercept_{r['name']}")
+                clicked += 1
+            except StaleElementReferenceException:
+                # the list re-rendered under us: re-locate what is still to do, in one pass
+                left = [p["name"] for p in [r] + pending]
+                pending = [x for x in self._locate_buttons(left) if x["state"] == "add"]
+        try:
+            self.wait_for_js(self._JS_ALL_ADDED, names, start + clicked, timeout=22,
+                             message=f"not all of {names} in cart (expected badge {start + clicked})")
+            return True
+        except TimeoutException:
+            return False
+
+    def _add_products_one_by_one(self, names):
+        """Per-item path: click, then wait until the badge increments OR the button shows Remove."""
         start = self.get_cart_badge_count()
         adds_done = 0  # how many successful Add clicks we performed
 
@@ -211,14 +376,29 @@ class InventoryPage(BasePage):
                     f"Timed out waiting after '{name}'. last_state={state}, "
                     f"badge={self.get_cart_badge_count()}, expected_badge={expected}"
                 )
-            
+
     def wait_cart_badge_equals(self, expected: int, timeout: int = 15, poll: float = 0.1) -> int:
-        WebDriverWait(self.driver, timeout, poll_frequency=poll).until(
-            lambda d: self.get_cart_badge_count() == expected
-        )
-        return self.get_cart_badge_count()
+        # `poll` kept for callers; the wait is event-driven in the page now
+        res = self.wait_for_js(self._JS_BADGE_EQUALS, expected, timeout=timeout,
+                               message=f"cart badge never reached {expected}")
+        return res["count"]
+
+    # ---------- cart via app storage (no clicking) ----------
+    def seed_cart(self, names):
+        """Make the cart hold exactly `names` by writing app storage and reloading inventory."""
+        names = list(names)
+        self.write_cart_storage(names)
+        self.driver.refresh()
+        assert self.is_loaded(), "inventory did not come back after seeding the cart"
+        self.wait_cart_badge_equals(len(names))
+        return self
+
+    def clear_cart(self):
+        """Storage-level reset of the cart; use reset_app_state_and_wait() to test the menu itself."""
+        return self.seed_cart([])
 
     def open_cart(self):
+        self._mark("open_cart")
         self.wait_clickable(self.CART_LINK, timeout=5).click()
 
 
@@ -230,30 +410,17 @@ class InventoryPage(BasePage):
 
 
     def _find_sort_select(self, timeout=8):
-        last_err = None
-        for loc in self.SORT_SELECTS:
-            try:
-                # scroll to top to ensure header controls are in view
-                self.driver.execute_script("window.scrollTo(0, 0);")
-                return self.wait_visible(loc, timeout=timeout)
-            except Exception as e:
-                last_err = e
-        self.screenshot("sort_select_not_found.png")
-        raise last_err
+        # scroll to top to ensure header controls are in view
+        self.driver.execute_script("window.scrollTo(0, 0);")
+        try:
+            return self.wait_visible(self.SORT_SELECT, timeout=timeout)
+        except TimeoutException:
+            self.screenshot("sort_select_not_found.png")
+            raise
     
     def _products_in_ui_order(self):
         """Return [{'name', 'price_text', 'price'}] in the CURRENT visual order."""
-        cards = self.driver.find_elements(*self.PRODUCT_CARD)
-        out = []
-        for c in cards:
-            name = c.find_element(*self.PRODUCT_NAME).text.strip()
-            price_text = c.find_element(*self.PRODUCT_PRICE).text.strip()
-            out.append({
-                "name": name,
-                "price_text": price_text,
-                "price": self._parse_price(price_text),
-            })
-        return out
+        return [{k: c[k] for k in ("name", "price_text", "price")} for c in self._read_cards()]
 
     def names_in_ui(self):
         return [p["name"] for p in self._products_in_ui_order()]
@@ -267,22 +434,13 @@ class InventoryPage(BasePage):
         value ∈ {'az','za','lohi','hilo'}.
         Waits until dropdown reflects value AND product order changes.
         """
-        before_names = [e.text.strip()
-                        for e in self.driver.find_elements(*self.PRODUCT_NAME)]
-        sel = Select(self.wait_visible(self.SORT_SELECTS, timeout=timeout))
+        before_names = self.names_in_ui()
+        sel = Select(self._find_sort_select(timeout=timeout))
         sel.select_by_value(value)
 
-        def order_changed_and_selected_ok(d):
-            # dropdown shows the requested value
-            curr = Select(d.find_element(*self.SORT_SELECTS)).first_selected_option \
-                     .get_attribute("value")
-            if curr != value:
-                return False
-            # names differ vs previous order (guard against slow re-render)
-            now = [e.text.strip() for e in d.find_elements(*self.PRODUCT_NAME)]
-            return now != before_names
-
-        WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(order_changed_and_selected_ok)
+        # dropdown shows the requested value AND the list re-rendered (or was already in that order)
+        self.wait_for_js(self._JS_SORT_APPLIED, value, before_names, timeout=timeout,
+                         message=f"product list not re-sorted by '{value}'")
 
     def _is_add_state_by_name(self, name: str) -> bool:
         """
@@ -292,11 +450,9 @@ class InventoryPage(BasePage):
         - id:   starts with "add-to-cart-..."
         """
         try:
-            card = self._find_card_by_name(name)
-            btn  = card.find_element(By.CSS_SELECTOR, "button.btn_inventory")
-            txt  = (btn.text or "").strip().lower()
-            bid  = (btn.get_attribute("id") or "")
-            return (txt == "add to cart") or bid.startswith("add-to-cart-")
+            c = self._card_state(name)
+            return bool(c) and (c["button_text"].strip().lower() == "add to cart"
+                                or c["button_id"].startswith("add-to-cart-"))
         except Exception:
             return False
     #     
@@ -334,16 +490,9 @@ class InventoryPage(BasePage):
             el = self.wait_present(self.RESET_LINK, timeout=3)
             self.driver.execute_script("arguments[0].click();", el)
 
-        # 1) badge gone
-        WebDriverWait(self.driver, timeout, 0.2).until(
-            lambda d: len(d.find_elements(*self.CART_BADGE)) == 0
-        )
-
-        # 2) none of the currently visible item buttons should say 'Remove'
-        WebDriverWait(self.driver, timeout, 0.2).until(
-            lambda d: all((b.text or "").strip().lower() != "remove"
-                          for b in d.find_elements(By.CSS_SELECTOR, ".inventory_item button.btn_inventory"))
-        )
+        # badge gone AND none of the item buttons says 'Remove' (one in-page wait)
+        self.wait_for_js(self._JS_CART_CLEARED, timeout=timeout,
+                         message="cart not cleared after Reset App State")
         return True
 
 
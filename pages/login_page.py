@@ -1,5 +1,5 @@
 from selenium.webdriver.common.by import By
-from .base_page import BasePage
+from .base_page import BasePage, DEFAULT_TIMEOUT
 
 class LoginPage(BasePage):
     # Locators
@@ -7,10 +7,13 @@ class LoginPage(BasePage):
     PASSWORD = (By.ID, "password")
     LOGIN_BTN = (By.ID, "login-button")
     ERROR_BANNER = (By.CSS_SELECTOR, "h3[data-test='error']")
+    PERF_BUDGETS = {"*": {"ready_ms": 5000}}
 
     def load(self, base_url="https://www.saucedemo.com/"):
         self.open(base_url)
-        self.wait_visible(self.USERNAME)
+        # new document: re-resolve (and cache) the username field
+        self.element(self.USERNAME, visible_timeout=DEFAULT_TIMEOUT, fresh=True)
+        self._page_ready()
         return self
 
     # def load(self, base_url: str = None):
@@ -26,6 +29,7 @@ class LoginPage(BasePage):
             self.wait_visible(self.USERNAME, timeout=10)
             self.wait_visible(self.PASSWORD, timeout=10)
             self.wait_present(self.LOGIN_BTN, timeout=10)
+            self._page_ready()
             return True
         except Exception:
             return False
@@ -41,12 +45,17 @@ class LoginPage(BasePage):
     #     btn_el.click()
         
 
+    @staticmethod
+    def _type_into(el, text: str):
+        el.clear()
+        el.send_keys(text)
+
     def login(self, username: str, password: str):
-        self.wait_visible(self.USERNAME).clear()
-        self.driver.find_element(*self.USERNAME).send_keys(username)
-        self.driver.find_element(*self.PASSWORD).clear()
-        self.driver.find_element(*self.PASSWORD).send_keys(password)
-        self.driver.find_element(*self.LOGIN_BTN).click()
+        # fields are looked up once per page object and re-found only if the form re-rendered
+        self.on_element(self.USERNAME, lambda el: self._type_into(el, username), visible_timeout=DEFAULT_TIMEOUT)
+        self.on_element(self.PASSWORD, lambda el: self._type_into(el, password))
+        self._mark("login")
+        self.on_element(self.LOGIN_BTN, lambda el: el.click())
 
     def get_error_text(self) -> str:
         try:
@@ -64,13 +64,8 @@ class LogoutPage(BasePage):
 
     # ---------- native Chrome popup ----------
     def _handle_native_password_alert(self, tag="chrome_pwd_alert"):
-        # Best-effort: ESC+ENTER to dismiss popup; save screenshots for debugging
-        self.screenshot(f"{tag}_before.png")
-        self.send_escape_enter()
-        time.sleep(0.35)
-        self.send_escape_enter()
-        time.sleep(0.2)
-        self.screenshot(f"{tag}_after.png")
+        # On-demand: only fires when a native popup has taken focus (see BasePage.guard_popup)
+        return self.guard_popup(tag, action=self._escape_enter_twice)
 
     # ---------- menu state helpers ----------
     def _logout_display_is_block(self):
@@ -127,6 +122,7 @@ class LogoutPage(BasePage):
         self._handle_native_password_alert()
 
         # Click Logout; if 'clickable' never resolves, fallback to JS click
+        self._mark("logout")
         try:
             self.wait_clickable(self.LOGOUT_LINK, timeout=3).click()
         except (TimeoutException, ElementClickInterceptedException):
@@ -2,7 +2,6 @@
 import time
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException
-from selenium.webdriver.support.ui import WebDriverWait
 from .base_page import BasePage
 
 class ResetPage(BasePage):
@@ -12,13 +11,8 @@ class ResetPage(BasePage):
 
     # ---------- native Chrome popup ----------
     def _handle_native_password_alert(self, tag="chrome_pwd_alert"):
-        # Best-effort: ESC+ENTER to dismiss popup; save screenshots for debugging
-        self.screenshot(f"{tag}_before.png")
-        self.send_escape_enter()
-        time.sleep(0.35)
-        self.send_escape_enter()
-        time.sleep(0.2)
-        self.screenshot(f"{tag}_after.png")
+        # On-demand: only fires when a native popup has taken focus (see BasePage.guard_popup)
+        return self.guard_popup(tag, action=self._escape_enter_twice)
 
     # ---------- menu state helpers ----------
     def _reset_display_is_block(self):
@@ -81,10 +75,8 @@ class ResetPage(BasePage):
             el = self.wait_present(self.RESET_LINK, timeout=2)
             self.driver.execute_script("arguments[0].click();", el)
 
-        # wait until badge reads 0 (badge gone on SauceDemo means 0)
-        WebDriverWait(self.driver, timeout, 0.1).until(
-            lambda d: self.get_cart_badge_count() == 0
-        )
+        # wait until the app has emptied the stored cart (badge gone follows from it)
+        self.wait_cart_storage_count(0, timeout=timeout)
         #     el = self.wait_present(self.RESET_LINK, timeout=8)
         #     # bring into view and click via JS to bypass overlays/animations
         #     self.driver.execute_script(
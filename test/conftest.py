@@ -0,0 +1,197 @@
+# test/conftest.py
+"""
+fake_driver: an in-memory stand-in for a WebDriver session, for the unit tests of the
+harness (caches, pools, contexts, tracing) that don't need Chrome.
+
+It keeps what those features rely on: a URL per tab, cookies and storage per browser
+context, CDP Target contexts, elements by locator that go stale when re-rendered, a DOM
+version that moves on render/navigation, and the list of commands sent (each one would be
+a round trip to chromedriver). Checks that need real browser semantics run in Chrome
+against the local_site stand-in instead (test/test_local_browser.py).
+"""
+from urllib.parse import urlparse
+
+import pytest
+from selenium.common.exceptions import (NoAlertPresentException, NoSuchElementException,
+                                        StaleElementReferenceException)
+
+from pages.base_page import BasePage
+from utils import browser_state
+
+
+class FakeElement:
+    def __init__(self, text=""):
+        self.text = text
+        self.stale = False
+        self.clicks = 0
+
+    def _alive(self):
+        if self.stale:
+            raise StaleElementReferenceException("element is not attached to the page document")
+
+    def click(self):
+        self._alive()
+        self.clicks += 1
+
+    def is_displayed(self):
+        self._alive()
+        return True
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver._switch(handle)
+
+    @property
+    def alert(self):
+        raise NoAlertPresentException("no native dialog in the fake")
+
+
+class FakeDriver:
+    Element = FakeElement
+
+    def __init__(self, url="data:,", app=None, elements=None, scripts=None):
+        self.app = app            # behave like SauceDemo here: app pages need the session cookie
+        self.elements = dict(elements or {})   # (by, value) -> FakeElement
+        self.scripts = dict(scripts or {})     # script -> fn(*args)
+        self.commands = []
+        self.lookups = []         # locators asked for, in order
+        self.perf_log = []
+        self.profile = "perf"
+        self.quit_called = False
+        self._contexts = {None: self._blank_context()}
+        self._tabs = {"home": {"context": None, "url": url}}
+        self.current_window_handle = "home"
+        self._doc, self._mutations = 1, 0
+        self.switch_to = _SwitchTo(self)
+
+    @staticmethod
+    def _blank_context():
+        return {"cookies": [], "localStorage": {}, "sessionStorage": {}}
+
+    def _cmd(self, name):
+        self.commands.append(name)
+
+    @property
+    def _context(self):
+        return self._contexts[self._tabs[self.current_window_handle]["context"]]
+
+    # ---------- navigation / tabs ----------
+    @property
+    def current_url(self):
+        return self._tabs[self.current_window_handle]["url"]
+
+    @property
+    def window_handles(self):
+        return list(self._tabs)
+
+    def get(self, url):
+        self._cmd("get")
+        if self.app and url.startswith(self.app) and urlparse(url).path.strip("/") \
+                and not self.get_cookie("session-username"):
+            url = self.app  # bounced to the login form
+        self._tabs[self.current_window_handle]["url"] = url
+        self._doc, self._mutations = self._doc + 1, 0
+        self.render()
+
+    def _switch(self, handle):
+        self._cmd("switchToWindow")
+        assert handle in self._tabs, f"no such window {handle}"
+        self.current_window_handle = handle
+
+    def close(self):
+        self._cmd("close")
+        del self._tabs[self.current_window_handle]
+
+    def quit(self):
+        self.quit_called = True
+
+    # ---------- DOM ----------
+    def render(self):
+        """The app re-rendered: every element handed out so far goes stale."""
+        for el in self.elements.values():
+            el.stale = True
+        self.elements = {loc: FakeElement(el.text) for loc, el in self.elements.items()}
+        self._mutations += 1
+
+    def find_element(self, by, value):
+        self._cmd("findElement")
+        self.lookups.append((by, value))
+        try:
+            return self.elements[(by, value)]
+        except KeyError:
+            raise NoSuchElementException(value) from None
+
+    def execute_script(self, script, *args):
+        self._cmd("executeScript")
+        for a in args:
+            if isinstance(a, FakeElement):
+                a._alive()
+        if script in self.scripts:
+            return self.scripts[script](*args)
+        if script == BasePage._JS_DOM_VERSION:
+            return f"doc{self._doc}:{self._mutations}"
+        if script == browser_state._DUMP_STORAGE_JS:
+            return dict(self._context[args[0]])
+        if script == browser_state._LOAD_STORAGE_JS:
+            self._context[args[0]].update(args[1])
+            return None
+        if script == browser_state._CLEAR_STORAGE_JS:
+            self._context["localStorage"].clear()
+            self._context["sessionStorage"].clear()
+            return None
+        return "complete"  # document.readyState and other probes
+
+    # ---------- cookies ----------
+    def get_cookies(self):
+        self._cmd("getCookies")
+        return [dict(c) for c in self._context["cookies"]]
+
+    def get_cookie(self, name):
+        return next((dict(c) for c in self._context["cookies"] if c["name"] == name), None)
+
+    def add_cookie(self, cookie):
+        self._cmd("addCookie")
+        self._context["cookies"].append(dict(cookie))
+
+    def delete_all_cookies(self):
+        self._cmd("deleteAllCookies")
+        self._context["cookies"].clear()
+
+    # ---------- CDP / logs ----------
+    def execute_cdp_cmd(self, cmd, params):
+        self._cmd(cmd)
+        if cmd == "Target.createBrowserContext":
+            context_id = f"ctx{len(self.commands)}"
+            self._contexts[context_id] = self._blank_context()
+            return {"browserContextId": context_id}
+        if cmd == "Target.createTarget":
+            handle = f"tab{len(self.commands)}"
+            self._tabs[handle] = {"context": params["browserContextId"], "url": params["url"]}
+            return {"targetId": handle}
+        if cmd == "Target.disposeBrowserContext":
+            context_id = params["browserContextId"]
+            self._tabs = {h: t for h, t in self._tabs.items() if t["context"] != context_id}
+            del self._contexts[context_id]
+        return {}
+
+    def execute(self, command, params=None):
+        """The remote call under the commands that utils.command_counter has to see."""
+        self._cmd(command)
+        return {"value": None}
+
+    def get_log(self, kind):
+        assert kind == "performance"
+        self.execute("getLog", {"type": kind})
+        out, self.perf_log = self.perf_log, []
+        return out
+
+
+@pytest.fixture
+def fake_driver():
+    """Factory: fake_driver(url=..., app=..., elements=..., scripts=...) -> FakeDriver;
+    fake_driver.Element is the matching element class."""
+    return FakeDriver
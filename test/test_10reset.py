@@ -1,16 +1,13 @@
 # test/test_reset_app_state.py
 import pytest
-from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
 
+@pytest.mark.state(start="logged_in", end="logged_in")
 def test_reset_using_fixture(driver, picked_products):
-    from pages.inventory_page import InventoryPage
-    from pages.cart_page import CartPage
-
     inv = InventoryPage(driver)
-    inv.add_products_to_cart_by_names(picked_products)
-    inv.wait_cart_badge_equals(len(picked_products))
+    # only the reset goes through the UI here; the cart is prepared in app storage
+    inv.seed_cart(picked_products)
 
     inv.open_cart()
     cart = CartPage(driver)
@@ -19,3 +16,4 @@ def test_reset_using_fixture(driver, picked_products):
     #cart.continue_shopping()
     inv.reset_app_state_and_wait(names_to_check=picked_products)
     assert inv.get_cart_badge_count() == 0
+    assert inv.cart_ids_in_storage() == []
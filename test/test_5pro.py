@@ -3,6 +3,7 @@ import pytest
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 
+@pytest.mark.state(start="logged_out", end="logged_in")
 def test_randomly_select_4_products_and_extract_data(driver, base_url, password, capsys):
     # 1) Login
     login = LoginPage(driver).load(base_url)
@@ -1,12 +1,9 @@
 import pytest
-from pages.login_page import LoginPage
-from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
 
-def test_add_random_4_products_and_verify_cart(driver, base_url, password):
-    LoginPage(driver).load(base_url).login("standard_user", password)
-
-    inv = InventoryPage(driver)
+@pytest.mark.state(start="logged_in")
+def test_add_random_4_products_and_verify_cart(driver, login_as):
+    inv = login_as("standard_user")
     assert inv.is_loaded()
 
     # optional but recommended: reset state so we always start with empty cart
@@ -22,6 +19,20 @@ def test_add_random_4_products_and_verify_cart(driver, base_url, password):
     assert set(CartPage(driver).item_names()) == set(names)
 
 
+@pytest.mark.state(start="logged_in")
+@pytest.mark.parametrize("batch", [True, False], ids=["batch", "one_by_one"])
+def test_add_whole_catalogue(driver, login_as, batch):
+    inv = login_as("standard_user")
+    names = [p["name"] for p in inv.fetch_all_products()]
+
+    inv.add_products_to_cart_by_names(names, batch=batch)
+    assert inv.get_cart_badge_count() == len(names)
+
+    # adding again is a no-op for items that already show Remove
+    inv.add_products_to_cart_by_names(names[:2], batch=batch)
+    assert inv.get_cart_badge_count() == len(names)
+
+
 # # test/test_cart_random_add.py
 # 
 
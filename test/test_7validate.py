@@ -1,15 +1,13 @@
 # test/test_cart_verify_details.py
 import pytest
-from pages.login_page import LoginPage
-from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
 
-def test_add_random_4_products_and_verify_cart_details(driver, base_url, password):
-    # 1) Login
-    LoginPage(driver).load(base_url).login("standard_user", password)
+@pytest.mark.state(start="logged_in")
+def test_add_random_4_products_and_verify_cart_details(driver, login_as):
+    # 1) Login (session injected, no login form)
+    inv = login_as("standard_user")
 
     # 2) Inventory visible
-    inv = InventoryPage(driver)
     assert inv.is_loaded(), "Inventory did not load after login"
 
     # (Optional) start clean to ensure badge ends at exactly 4
@@ -20,18 +18,11 @@ def test_add_random_4_products_and_verify_cart_details(driver, base_url, passwor
     expected_names  = [p["name"] for p in picked]
     expected_byname = {p["name"]: p for p in picked}  # {'name': {'name','price_text','price'}}
 
-    # 4) Add them to cart (your robust method that handles re-renders/overlays)
-    inv.add_products_to_cart_by_names(expected_names)
-
-    # 5) Badge should be 4
-    inv.wait_cart_badge_equals(4)
-    assert inv.get_cart_badge_count() == 4
-
-    # 6) Open cart and fetch actual listed details
-    inv.open_cart()
-    cart = CartPage(driver)
-    assert cart.is_loaded(), "Cart page did not load"
+    # 4) Prepared cart: written to app storage (adding via the UI is covered by test_6add)
+    cart = CartPage(driver).seed(expected_names)
+    assert sorted(cart.cart_names_in_storage()) == sorted(expected_names)
 
+    # 5-6) Cart page lists them; fetch actual listed details
     cart_details = cart.item_details()
     cart_names   = [d["name"] for d in cart_details]
     assert set(cart_names) == set(expected_names), \
@@ -1,23 +1,21 @@
 # test/test_checkout_flow.py
 import pytest
-from pages.login_page import LoginPage
-from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
 
-def test_checkout_end_to_end(driver, base_url, password):
-    # 1) Login
-    LoginPage(driver).load(base_url).login("standard_user", password)
+@pytest.mark.state(start="logged_in", end="logged_in")
+def test_checkout_end_to_end(driver, login_as):
+    # 1) Login (session injected, no login form)
+    inv = login_as("standard_user")
 
     # 2) Inventory loaded, pick & add 4 items
-    inv = InventoryPage(driver)
     assert inv.is_loaded()
     picks = inv.choose_random_products(k=4, seed=42)
     expected_byname = {p["name"]: p for p in picks}
     names = list(expected_byname.keys())
 
-    inv.add_products_to_cart_by_names(names)
-    inv.wait_cart_badge_equals(4)
+    # prepared cart via app storage; UI add is covered by test_6add
+    inv.seed_cart(names)
     assert inv.get_cart_badge_count() == 4
 
     # 3) Go to cart, verify names & prices match what we added
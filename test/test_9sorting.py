@@ -1,12 +1,13 @@
 # test/test_sorting_inventory.py
 import pytest
-from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 
 def is_sorted(seq, reverse=False):
     cmp = (lambda a, b: a >= b) if reverse else (lambda a, b: a <= b)
     return all(cmp(a, b) for a, b in zip(seq, seq[1:]))
 
+@pytest.mark.command_budget(150)
+@pytest.mark.state(start="logged_in", end="logged_in")
 @pytest.mark.parametrize(
     "sort_value, kind, reverse",
     [
@@ -16,10 +17,9 @@ def is_sorted(seq, reverse=False):
         ("za",   "name",  True),   # Z → A
     ],
 )
-def test_inventory_sorting(driver, base_url, password, sort_value, kind, reverse):
-    # Login
-    LoginPage(driver).load(base_url).login("standard_user", password)
-
+def test_inventory_sorting(driver, login_as, checkpoint, sort_value, kind, reverse):
+    # Login once per module; the other cases restore the logged-in inventory checkpoint
+    checkpoint("inventory", "standard_user", lambda: login_as("standard_user").is_loaded())
     inv = InventoryPage(driver)
     assert inv.is_loaded(), "Inventory page did not load"
 
@@ -0,0 +1,33 @@
+# test/test_benchmark_stats.py
+import pytest
+from benchmarks.stats import compare_flow, mann_whitney_greater, percentile, summarize
+
+
+def test_percentile_interpolates_between_ranks():
+    xs = [4, 1, 3, 2, 5]
+    assert percentile(xs, 50) == 3
+    assert percentile(xs, 100) == 5
+    assert percentile(xs, 95) == pytest.approx(4.8)
+    assert summarize(xs)["max"] == 5
+
+
+def test_mann_whitney_detects_shift_only_in_one_direction():
+    base = [1.00, 1.02, 0.98, 1.01, 0.99, 1.03, 0.97, 1.00, 1.01, 0.99]
+    slower = [x + 0.2 for x in base]
+    assert mann_whitney_greater(base, slower) < 0.001
+    assert mann_whitney_greater(slower, base) > 0.99
+    assert mann_whitney_greater(base, list(base)) > 0.3
+    assert mann_whitney_greater([1.0] * 5, [1.0] * 5) == 1.0
+
+
+def test_compare_flow_needs_significance_and_size():
+    base = {"samples_s": [1.0, 1.02, 0.98, 1.01, 0.99, 1.03, 0.97, 1.0], "commands": {"p50": 40}}
+    much_slower = {"samples_s": [x * 1.3 for x in base["samples_s"]], "commands": {"p50": 40}}
+    barely_slower = {"samples_s": [x * 1.03 for x in base["samples_s"]], "commands": {"p50": 41}}
+
+    r = compare_flow(base, much_slower)
+    assert r["slower"] and not r["more_commands"]
+
+    r = compare_flow(base, barely_slower)
+    assert not r["slower"], "3% is below the default min_slowdown"
+    assert r["more_commands"]
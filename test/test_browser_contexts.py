@@ -0,0 +1,29 @@
+# test/test_browser_contexts.py
+from utils import browser_contexts
+from utils.browser_contexts import ContextHost
+
+BASE = "http://site.test/"
+
+
+def test_each_test_gets_its_own_context_on_one_browser(monkeypatch, fake_driver):
+    monkeypatch.setattr(browser_contexts, "quit_driver", lambda d: d.quit())
+    spawned = []
+    host = ContextHost(lambda: spawned.append(fake_driver()) or spawned[-1], max_uses=2)
+
+    d = host.open(BASE)
+    assert d.current_window_handle != "home" and d.current_url == BASE
+    assert "Network.setBlockedURLs" in d.commands  # perf profile re-applied in the new tab
+    d.add_cookie({"name": "session-username", "value": "standard_user"})
+    host.close(d)
+    assert d.window_handles == ["home"] and d.current_window_handle == "home"
+    assert d.get_cookies() == []  # the default context never saw the test's cookie
+
+    assert host.open(BASE) is d and len(spawned) == 1
+    assert d.get_cookies() == [], "a new context starts empty"
+    host.close(d)
+
+    # max_uses reached -> a new host browser
+    d2 = host.open(BASE)
+    assert d2 is not d and d.quit_called
+    host.close(d2, discard=True)
+    assert d2.quit_called and host.driver is None
@@ -0,0 +1,48 @@
+# test/test_card_index.py
+from selenium.webdriver.common.by import By
+
+from pages.inventory_page import InventoryPage
+
+N = 1000  # far more cards than SauceDemo has
+
+
+def _catalogue(fake_driver, rerender_after_first_read=False):
+    """A fake page with N product buttons; the index script reads them as the page would."""
+    builds = []
+
+    def index():
+        builds.append(1)
+        out = {}
+        for (_, i), el in sorted(driver.elements.items()):
+            out[el.text] = {"card": f"card:{el.text}", "button": el,
+                            "button_id": f"add-to-cart-{i}", "button_text": "Add to cart"}
+        if rerender_after_first_read and len(builds) == 1:
+            driver.render()  # the app re-renders right after we read the list
+        return out
+
+    driver = fake_driver(scripts={InventoryPage._JS_CARD_INDEX: index},
+                         elements={(By.ID, i): fake_driver.Element(f"item {i}") for i in range(N)})
+    return driver, builds
+
+
+def test_lookups_share_one_index_per_dom_state(fake_driver):
+    driver, builds = _catalogue(fake_driver)
+    inv = InventoryPage(driver)
+    assert inv._find_card_by_name("item 999") == "card:item 999"
+    assert inv._is_add_state_by_name("item 500") and not inv._is_remove_state_by_name("item 500")
+    assert len(builds) == 1
+    # each further lookup is one command (the version check), whatever the catalogue size
+    before = len(driver.commands)
+    inv._card_state("item 1")
+    assert len(driver.commands) - before == 1
+
+    driver.render()  # e.g. the list was re-sorted
+    inv._card_state("item 1")
+    assert len(builds) == 2
+
+
+def test_click_after_a_re_render_lands_on_the_live_button(fake_driver):
+    driver, builds = _catalogue(fake_driver, rerender_after_first_read=True)
+    inv = InventoryPage(driver)
+    assert inv._click_add_for_name("item 3") is True
+    assert driver.elements[(By.ID, 3)].clicks == 1 and len(builds) == 2
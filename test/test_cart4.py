@@ -5,6 +5,7 @@ from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 
 # ---------- POSITIVE ----------
+@pytest.mark.state(start="logged_out", end="logged_in")
 def test_cart_icon_visible_and_clickable_happy_path(driver, base_url, password):
     # Login first
     login = LoginPage(driver).load(base_url)
@@ -17,11 +18,14 @@ def test_cart_icon_visible_and_clickable_happy_path(driver, base_url, password):
     inv.assert_cart_visible_and_clickable(driver)  # should not raise
 
 # ---------- NEGATIVE (fails on login page: cart icon absent) ----------
+@pytest.mark.state(start=("logged_out", "after_logout"), end="after_logout")
 def test_cart_icon_assert_fails_when_not_logged_in(driver, base_url):
     # Stay on login page (do NOT log in)
     login = LoginPage(driver).load(base_url)
     assert login.is_loaded(), "Login page failed to load"
 
     inv = InventoryPage(driver)  # page object with the assertion method
+    # page has settled on the login form, so a short timeout is enough to prove absence
+    assert inv.is_absent(inv.CART_LINK, terminal=[login.USERNAME])
     with pytest.raises(TimeoutException):
-        inv.assert_cart_visible_and_clickable(driver)
+        inv.assert_cart_visible_and_clickable(driver, timeout=1)
@@ -0,0 +1,68 @@
+# test/test_checkpoints.py
+from utils.browser_state import _DUMP_STORAGE_JS, _LOAD_STORAGE_JS
+from utils.checkpoints import CheckpointStore
+
+BASE = "http://site.test/"
+
+
+def _prefix(driver, calls):
+    def build():
+        calls.append(1)
+        driver.get(BASE)
+        driver.add_cookie({"name": "session-username", "value": "standard_user", "expiry": 1})
+        driver.execute_script(_LOAD_STORAGE_JS, "localStorage", {"cart-contents": "[]"})
+        driver.execute_script(_LOAD_STORAGE_JS, "sessionStorage", {"tab": "x"})
+        driver.get(BASE + "inventory.html")
+        return ["Sauce Labs Onesie"]
+    return build
+
+
+def test_second_user_of_a_prefix_restores_instead_of_rebuilding(fake_driver):
+    store, calls = CheckpointStore(), []
+    first = fake_driver(app=BASE)
+    assert store.get_or_build(first, BASE, "picked", "standard_user", _prefix(first, calls)) == ["Sauce Labs Onesie"]
+
+    other = fake_driver(app=BASE)  # e.g. another pooled browser
+    result = store.get_or_build(other, BASE, "picked", "standard_user", _prefix(other, calls))
+    assert result == ["Sauce Labs Onesie"] and len(calls) == 1
+    assert other.current_url == BASE + "inventory.html"
+    assert other.execute_script(_DUMP_STORAGE_JS, "sessionStorage") == {"tab": "x"}
+    assert "expiry" not in other.get_cookies()[0]
+
+    # different user -> its own prefix run
+    third = fake_driver(app=BASE)
+    store.get_or_build(third, BASE, "picked", "problem_user", _prefix(third, calls))
+    assert len(calls) == 2
+
+
+def test_checkpoint_that_no_longer_lands_is_rebuilt(fake_driver):
+    store, calls = CheckpointStore(), []
+    d = fake_driver(app=BASE)
+    store.get_or_build(d, BASE, "picked", "standard_user", _prefix(d, calls))
+    store._checkpoints[("picked", "standard_user", BASE)]["state"]["cookies"] = []  # session gone
+
+    # restoring now bounces to the login form, so the prefix runs again
+    d2 = fake_driver(app=BASE)
+    store.get_or_build(d2, BASE, "picked", "standard_user", _prefix(d2, calls))
+    assert len(calls) == 2 and store.hits == 0
+    assert d2.current_url == BASE + "inventory.html"
+
+
+def test_restore_replaces_what_an_un_reset_browser_still_holds(fake_driver):
+    store, calls = CheckpointStore(), []
+    d = fake_driver(app=BASE)
+    store.get_or_build(d, BASE, "picked", "standard_user", _prefix(d, calls))
+
+    # e.g. handed over by the pool without a reset: a cart and leftovers of the previous test
+    dirty = fake_driver(app=BASE)
+    dirty.get(BASE)
+    dirty.add_cookie({"name": "session-username", "value": "problem_user"})
+    dirty.add_cookie({"name": "extra", "value": "1"})
+    dirty.execute_script(_LOAD_STORAGE_JS, "localStorage", {"cart-contents": "[4,0]", "other": "x"})
+    dirty.execute_script(_LOAD_STORAGE_JS, "sessionStorage", {"left": "over"})
+
+    store.get_or_build(dirty, BASE, "picked", "standard_user", _prefix(dirty, calls))
+    assert len(calls) == 1
+    assert [(c["name"], c["value"]) for c in dirty.get_cookies()] == [("session-username", "standard_user")]
+    assert dirty.execute_script(_DUMP_STORAGE_JS, "localStorage") == {"cart-contents": "[]"}
+    assert dirty.execute_script(_DUMP_STORAGE_JS, "sessionStorage") == {"tab": "x"}
@@ -0,0 +1,46 @@
+# test/test_load_driver.py
+import time
+
+import pytest
+
+from benchmarks import load
+
+
+def test_parse_mix():
+    assert load.parse_mix("purchase=3, browse") == {"purchase": 3.0, "browse": 1.0}
+    with pytest.raises(ValueError):
+        load.parse_mix("purchase,teleport")
+
+
+def test_virtual_users_loop_until_the_deadline_and_merge(monkeypatch):
+    calls = {"n": 0}
+
+    def ok(driver, vu):
+        time.sleep(0.01)
+
+    def flaky(driver, vu):
+        calls["n"] += 1
+        if calls["n"] % 2:
+            raise AssertionError("boom")
+
+    monkeypatch.setattr(load, "FLOWS", {"purchase": [("login", ok), ("checkout", flaky)]})
+    monkeypatch.setattr(load, "reset_driver", lambda d, url: None)
+    monkeypatch.setattr(load, "is_healthy", lambda d, url: True)
+    monkeypatch.setattr(load, "quit_driver", lambda d: None)
+
+    deadline = time.time() + 0.3
+    vus = [load.VirtualUser(i, object, "http://s/", "standard_user", "x", {"purchase": 1}, deadline, i)
+           for i in range(2)]
+    for vu in vus:
+        vu.start()
+    for vu in vus:
+        vu.join(5)
+
+    report = load.merge(vus, 0.3)
+    flow = report["flows"]["purchase"]
+    assert flow["completed"] > 0 and flow["failed"] > 0
+    assert 0 < flow["error_rate"] < 1
+    assert report["steps"]["purchase/login"]["failed"] == 0
+    assert report["steps"]["purchase/checkout"]["failed"] == flow["failed"]
+    assert report["steps"]["purchase/login"]["p50_s"] >= 0.01
+    assert report["throughput_per_min"] == pytest.approx(flow["completed"] / 0.005)
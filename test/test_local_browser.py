@@ -0,0 +1,60 @@
+# test/test_local_browser.py
+# Harness features that rely on real browser behaviour, checked in Chrome against the
+# offline stand-in (utils/local_site) instead of saucedemo.com.
+import pytest
+
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+
+
+@pytest.fixture(scope="module")
+def base_url(local_site):
+    return local_site.url
+
+
+def test_dom_version_moves_on_mutation_and_navigation_only(driver, login_as):
+    inv = login_as("standard_user")
+    v1 = inv.dom_version()
+    assert inv.dom_version() == v1, "reading must not count as a change"
+
+    inv.select_sort("za")  # the app re-renders the list
+    v2 = inv.dom_version()
+    assert v2 != v1 and v2.split(":")[0] == v1.split(":")[0]
+
+    driver.refresh()
+    assert InventoryPage(driver).is_loaded()
+    assert inv.dom_version().split(":")[0] != v1.split(":")[0], "new document, new id"
+
+
+def test_browser_contexts_do_not_share_login_or_storage(context_host, base_url, password):
+    d = context_host.open(base_url)
+    LoginPage(d).load(base_url).login("standard_user", password)
+    inv = InventoryPage(d)
+    assert inv.is_loaded()
+    inv.seed_cart(["Sauce Labs Onesie"])
+    context_host.close(d)
+
+    d = context_host.open(base_url)
+    try:
+        assert d.get_cookie("session-username") is None
+        assert LoginPage(d).cart_ids_in_storage() == []
+        d.get(base_url + "inventory.html")
+        assert LoginPage(d).is_loaded(), "a fresh context must bounce to the login form"
+    finally:
+        context_host.close(d)
+
+
+def test_add_click_survives_a_re_render_under_the_card_index(driver, login_as):
+    inv = login_as("standard_user")
+    inv.clear_cart()
+    stale_index = inv._card_index()
+
+    # the stand-in re-renders the whole list on every cart change, detaching every button
+    driver.execute_script("arguments[0].click();", stale_index["Sauce Labs Onesie"]["button"])
+    inv.wait_cart_badge_equals(1)
+    # pretend the re-render raced the version check: the old index still looks current
+    inv._memo["card_index"] = (inv.dom_version(), stale_index)
+
+    assert inv._click_add_for_name("Sauce Labs Backpack") is True
+    inv.wait_cart_badge_equals(2)
+    assert inv._is_remove_state_by_name("Sauce Labs Backpack")
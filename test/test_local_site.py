@@ -0,0 +1,26 @@
+# test/test_local_site.py
+# Plain HTTP checks of the offline stand-in (no browser needed).
+import urllib.request
+from urllib.error import HTTPError
+import pytest
+
+def fetch(url):
+    with urllib.request.urlopen(url, timeout=5) as r:
+        return r.status, r.headers.get("Content-Type"), r.read().decode()
+
+@pytest.mark.parametrize("page", ["", "inventory.html", "cart.html", "checkout-step-one.html",
+                                  "checkout-step-two.html", "checkout-complete.html"])
+def test_local_site_serves_app_shell(local_site, page):
+    status, ctype, body = fetch(local_site.url + page)
+    assert status == 200 and ctype.startswith("text/html")
+    assert '<div id="root">' in body and "/static/app.js" in body
+    assert "glitchDelayMs:" in body
+
+def test_local_site_serves_assets_and_404s(local_site):
+    status, ctype, body = fetch(local_site.url + "static/app.js")
+    assert status == 200 and ctype == "application/javascript"
+    assert "cart-contents" in body and "session-username" in body
+
+    with pytest.raises(HTTPError) as e:
+        fetch(local_site.url + "static/../server.py")
+    assert e.value.code == 404
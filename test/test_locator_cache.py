@@ -0,0 +1,43 @@
+# test/test_locator_cache.py
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage, FallbackLocator
+from utils import locator_cache
+
+OLD = (By.CSS_SELECTOR, "select.old")
+NEW = (By.CSS_SELECTOR, "select.new")
+XPATH = (By.XPATH, "//select")
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(locator_cache, "CACHE_FILE", tmp_path / "locators.json")
+    monkeypatch.setattr(locator_cache, "LOCK_FILE", tmp_path / "locators.lock")
+    monkeypatch.setattr(locator_cache, "_learned", None)
+    # never touch the real cache directory
+    monkeypatch.setattr(locator_cache, "CACHE_DIR", tmp_path)
+    return tmp_path / "locators.json"
+
+
+def test_learned_strategy_is_tried_first_and_persisted(cache_file, fake_driver):
+    sel = FallbackLocator("Page.SELECT", OLD, XPATH, NEW)
+    driver = fake_driver(elements={NEW: fake_driver.Element()})
+    assert BasePage(driver).wait_visible(sel, timeout=2)
+    assert locator_cache.learned("Page.SELECT") == locator_cache.key_of(NEW)
+
+    # next "run": only the file survives
+    locator_cache._learned = None
+    driver.lookups.clear()
+    BasePage(driver).wait_visible(sel, timeout=2)
+    assert driver.lookups == [NEW]
+    assert "select.new" in cache_file.read_text()
+
+
+def test_missing_element_costs_one_timeout_not_one_per_strategy(fake_driver):
+    sel = FallbackLocator("Page.MISSING", OLD, XPATH, NEW)
+    page = BasePage(fake_driver())
+    with pytest.raises(TimeoutException):
+        page.find_fallback(sel, timeout=0.6, probe=0.1)
+    assert locator_cache.learned("Page.MISSING") is None
@@ -17,6 +17,7 @@ INVALID_MATRIX = [
     ("visual_user", "wrong_password", "do not match any user", "Known user with bad password"),
 ]
 
+@pytest.mark.state(start=("logged_out", "after_logout"), end="after_logout")
 @pytest.mark.parametrize(
     "username,password,expected_substr,_",
     INVALID_MATRIX,
@@ -34,7 +35,7 @@ def test_login_invalid_credentials_denied(driver, base_url, username, password,
 
     # Access should NOT proceed to inventory page
     inv = InventoryPage(driver)
-    assert not inv.is_loaded(), "Inventory should NOT load for invalid/unauthorized credentials."
+    assert inv.is_not_loaded(), "Inventory should NOT load for invalid/unauthorized credentials."
 
     # Error banner should contain the expected hint
     assert expected_substr.lower() in err.lower(), f"Expected error to contain '{expected_substr}', got: {err!r}"
@@ -1,17 +1,7 @@
 import pytest
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
-
-# Known predefined users on saucedemo.com
-USERS_MATRIX = [
-    # (username, expect_success, note/behavior)
-    ("standard_user", True,  "Baseline successful login"),
-    ("locked_out_user", False, "Should be blocked with error"),
-    ("problem_user", True, "Login succeeds; downstream UI issues by design"),
-    ("performance_glitch_user", True, "Login succeeds; slower load by design"),
-    ("error_user", True, "Login succeeds; checkout has known issues by design"),
-    ("visual_user", True, "Login succeeds; visual differences by design"),
-]
+from pages.catalog import USERS_MATRIX
 
 @pytest.mark.parametrize("username, expect_success, _", USERS_MATRIX, ids=[u[0] for u in USERS_MATRIX])
 def test_login_per_user(driver, base_url, password, username, expect_success, _):
@@ -0,0 +1,57 @@
+# test/test_network_trace.py
+import json
+
+from utils import command_counter
+from utils.network_trace import NetworkRecorder
+
+
+def _entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def _request(rid, url, start, end, size, disk_cache=False):
+    return [
+        _entry("Network.requestWillBeSent", requestId=rid, timestamp=start, type="Script",
+               request={"url": url, "method": "GET"}),
+        _entry("Network.responseReceived", requestId=rid, type="Script",
+               response={"status": 200, "mimeType": "text/javascript", "fromDiskCache": disk_cache,
+                         "timing": {"requestTime": start, "dnsStart": -1, "dnsEnd": -1,
+                                    "sendStart": 1.0, "sendEnd": 1.5, "receiveHeadersEnd": 40.0}}),
+        _entry("Network.loadingFinished", requestId=rid, timestamp=end, encodedDataLength=size),
+    ]
+
+
+def test_records_are_streamed_and_summarized_per_step(tmp_path, fake_driver):
+    driver = fake_driver()
+    rec = NetworkRecorder(driver, tmp_path / "t.jsonl")
+
+    driver.perf_log = _request("1", "http://s/app.js", 10.0, 10.25, 5000) + _request("2", "http://s/a.css", 10.0, 10.05, 0, True)
+    rec.drain("InventoryPage.is_loaded")
+    lines = (tmp_path / "t.jsonl").read_text().splitlines()
+    assert len(lines) == 2  # written as they finish, not at close
+    first = json.loads(lines[0])
+    assert first["total_ms"] == 250.0 and first["phases"]["wait"] == 38.5 and first["phases"]["dns"] is None
+    assert first["phases"]["receive"] == 210.0
+
+    # a request still in flight at the end of the test is recorded as unfinished
+    driver.perf_log = _request("3", "http://s/slow", 11.0, 12.0, 10)[:1]
+    summary = rec.close()
+    step = summary["InventoryPage.is_loaded"]
+    assert step["requests"] == 2 and step["bytes"] == 5000 and step["cached"] == 1
+    assert step["slowest"][0]["url"] == "http://s/app.js"
+    assert summary["<test>"]["failed"] == 1
+    assert json.loads((tmp_path / "t.summary.json").read_text()) == summary
+
+
+def test_log_drains_are_left_out_of_the_command_count(tmp_path, fake_driver):
+    driver = fake_driver()
+    counter = command_counter.attach(driver)
+    rec = NetworkRecorder(driver, tmp_path / "t.jsonl")
+
+    rec.discard_pending()
+    driver.perf_log = _request("1", "http://s/app.js", 10.0, 10.25, 5000)
+    rec.drain("InventoryPage.is_loaded")
+    driver.execute("findElement")
+    rec.close()
+    assert driver.commands.count("getLog") == 3
+    assert counter.total == 1 and dict(counter.by_command) == {"findElement": 1}
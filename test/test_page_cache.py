@@ -0,0 +1,37 @@
+# test/test_page_cache.py
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+
+FIELD = (By.ID, "field")
+
+
+def test_element_is_found_once_and_re_resolved_when_stale(fake_driver):
+    driver = fake_driver(elements={FIELD: fake_driver.Element()})
+    page = BasePage(driver)
+    page.on_element(FIELD, lambda el: el.click())
+    page.on_element(FIELD, lambda el: el.click())
+    assert driver.lookups == [FIELD]
+
+    driver.render()  # the cached element is now detached
+    page.on_element(FIELD, lambda el: el.click())
+    assert driver.lookups == [FIELD, FIELD] and driver.elements[FIELD].clicks == 1
+
+
+def test_cached_reads_follow_the_dom_version(fake_driver):
+    driver, calls = fake_driver(), []
+    page = BasePage(driver)
+
+    def read():
+        calls.append(1)
+        return [{"name": "a"}]
+
+    first = page.cached("rows", read)
+    first[0]["name"] = "edited by caller"
+    assert page.cached("rows", read) == [{"name": "a"}] and len(calls) == 1
+
+    driver.render()                    # a mutation
+    page.cached("rows", read)
+    driver.get("http://site.test/")    # navigation
+    page.cached("rows", read)
+    assert len(calls) == 3
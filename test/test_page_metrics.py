@@ -0,0 +1,46 @@
+# test/test_page_metrics.py
+from pages.inventory_page import InventoryPage
+from utils import page_metrics
+
+
+def _page(fake_driver, record):
+    return InventoryPage(fake_driver(scripts={page_metrics.COLLECT_JS: lambda page: dict(record)}))
+
+
+def _record(user, ready_ms):
+    return {"url": "/inventory.html", "doc": 1.0, "now": ready_ms, "trigger": "login", "trigger_at": 0,
+            "ready_ms": ready_ms, "longtask_ms": 0, "user": user}
+
+
+def test_budgets_are_per_user_with_a_default():
+    budgets = InventoryPage.PERF_BUDGETS
+    ok = {"page": "InventoryPage", "user": "performance_glitch_user", "ready_ms": 6000}
+    assert page_metrics.budget_violations(ok, budgets) == []
+    slow = dict(ok, user="standard_user")
+    assert page_metrics.budget_violations(slow, budgets) == [
+        "InventoryPage ready_ms=6000 > 3000 (user standard_user)"]
+    assert page_metrics.budget_violations(dict(ok, user="visual_user"), budgets)  # "*" -> 5000
+
+
+def test_one_record_per_load_and_nothing_when_disabled(monkeypatch, fake_driver):
+    page = _page(fake_driver, _record("standard_user", 4000))
+    page_metrics.begin_test()
+    page_metrics.collect(page)
+    assert page_metrics.take_records() == []
+
+    monkeypatch.setattr(page_metrics, "ENABLED", True)
+    page_metrics.collect(page)
+    page_metrics.collect(page)  # is_loaded() again on the same page state
+    records = page_metrics.take_records()
+    assert len(records) == 1
+    assert records[0]["page"] == "InventoryPage" and records[0]["violations"]
+
+
+def test_unmarked_loads_are_not_timed(monkeypatch, fake_driver):
+    rec = dict(_record("standard_user", None), trigger="unmarked", trigger_at=500)
+    page = _page(fake_driver, rec)
+    monkeypatch.setattr(page_metrics, "ENABLED", True)
+    page_metrics.begin_test()
+    page_metrics.collect(page)
+    records = page_metrics.take_records()
+    assert records[0]["ready_ms"] is None and records[0]["violations"] == []
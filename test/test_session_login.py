@@ -0,0 +1,12 @@
+# test/test_session_login.py
+
+def test_login_as_opens_inventory_without_login_form(driver, login_as, session_cache, base_url):
+    inv = login_as("standard_user")
+    assert inv.is_loaded(), "Inventory did not load for injected session"
+    assert inv.is_url_contains("inventory.html")
+
+    # state is cached on disk for the next test and has the session cookie
+    state = session_cache.get(base_url, "standard_user")
+    assert state is not None, "Session state was not cached"
+    assert any(c["name"] == "session-username" for c in state["cookies"])
+    assert "cart-contents" not in state["local_storage"]
@@ -0,0 +1,112 @@
+# test/test_state_affinity.py
+import pytest
+
+from utils.driver_pool import DriverPool
+from utils.browser_state import _DUMP_STORAGE_JS, _LOAD_STORAGE_JS
+from utils.state_affinity import order_for_affinity, order_modules
+
+BASE = "http://site.test/"
+
+
+class _Item:
+    def __init__(self, name, start=None, end=None):
+        self.name, self.nodeid = name, name
+        self._marker = pytest.mark.state(start=start, end=end).mark if (start or end) else None
+
+    def get_closest_marker(self, name):
+        return self._marker if name == "state" else None
+
+
+def test_order_chains_end_state_into_next_start():
+    items = [
+        _Item("add", "logged_in"),
+        _Item("login", "logged_out", "logged_in"),
+        _Item("sort", "logged_in", "logged_in"),
+        _Item("invalid", "logged_out", "logged_out"),
+        _Item("plain"),
+    ]
+    ordered, resets = order_for_affinity(items)
+    assert [i.name for i in ordered] == ["login", "add", "invalid", "plain", "sort"]
+    # reset before: login (first), invalid (add leaves no declared state),
+    # plain (undeclared start), sort (plain's end state is unknown)
+    assert resets == 4
+
+
+def test_order_keeps_original_order_without_markers():
+    items = [_Item(n) for n in "abc"]
+    ordered, resets = order_for_affinity(items, "logged_in")
+    assert ordered == items and resets == 3
+
+
+def test_tolerant_tests_chain_after_a_logout_but_clean_ones_do_not():
+    items = [
+        _Item("logout", "logged_out", "after_logout"),
+        _Item("login", "logged_out", "logged_in"),
+        _Item("invalid", ("logged_out", "after_logout"), "after_logout"),
+    ]
+    ordered, resets = order_for_affinity(items)
+    assert [i.name for i in ordered] == ["logout", "invalid", "login"]
+    assert resets == 2
+
+
+def test_unknown_state_is_a_usage_error():
+    with pytest.raises(pytest.UsageError):
+        order_for_affinity([_Item("x", "logged_on", None)])
+
+
+def _logged_in(driver):
+    return bool(driver.get_cookie("session-username"))
+
+
+def test_pool_skips_reset_only_for_an_accepted_state(fake_driver):
+    pool = DriverPool(lambda: fake_driver(url=BASE), max_uses=10)
+
+    d = pool.acquire(BASE, state="logged_in")
+    d.add_cookie({"name": "session-username", "value": "standard_user"})
+    pool.release(d, state="logged_in")
+    assert pool.acquire(BASE, state="logged_in") is d
+    assert _logged_in(d) and d.kept_state == "logged_in" and pool.resets_skipped == 1
+
+    pool.release(d, state="after_logout")
+    pool.acquire(BASE, state="logged_in")     # wrong state: reset as usual
+    assert not _logged_in(d) and d.kept_state is None
+
+    d.add_cookie({"name": "session-username", "value": "standard_user"})
+    pool.release(d, state="logged_in")
+    pool.acquire(BASE)                        # no declared start state: always reset
+    assert not _logged_in(d) and pool.resets_skipped == 1
+
+    d.execute_script(_LOAD_STORAGE_JS, "localStorage", {"cart-contents": "[4]"})
+    pool.release(d, state="after_logout")
+    pool.acquire(BASE, state="logged_out")    # a logout is not a reset
+    assert d.execute_script(_DUMP_STORAGE_JS, "localStorage") == {}
+
+    d.execute_script(_LOAD_STORAGE_JS, "localStorage", {"cart-contents": "[4]"})
+    pool.release(d, state="after_logout")
+    pool.acquire(BASE, state=("logged_out", "after_logout"))
+    assert d.kept_state == "after_logout"
+    assert d.execute_script(_DUMP_STORAGE_JS, "localStorage") == {"cart-contents": "[4]"}
+
+
+def test_modules_stay_contiguous_and_chain():
+    invalid = [_Item("invalid", "logged_out", "logged_out")]
+    sorting = [_Item("sort1", "logged_in", "logged_in"), _Item("sort2", "logged_in", "logged_in")]
+    login = [_Item("login", "logged_out", "logged_in")]
+    ordered = order_modules([invalid, sorting, login])
+    assert [i.name for i in ordered] == ["invalid", "login", "sort1", "sort2"]
+
+
+def test_kept_login_reloads_inventory_instead_of_restoring(fake_driver, tmp_path):
+    from pages.inventory_page import InventoryPage
+    from utils.session_cache import SessionCache, login_via_session
+
+    d = fake_driver(url=BASE + "inventory.html", app=BASE,
+                    elements={InventoryPage.TITLE: fake_driver.Element("Products")})
+    d.add_cookie({"name": "session-username", "value": "standard_user"})
+    d.kept_state = "logged_in"
+    d.commands.clear()
+
+    login_via_session(d, BASE, "standard_user", "secret_sauce", SessionCache(tmp_path))
+    # already on inventory.html, yet reloaded so e.g. a sort order does not carry over
+    assert d.commands.count("get") == 1 and "addCookie" not in d.commands
+    assert d.current_url == BASE + "inventory.html"
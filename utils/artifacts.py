@@ -0,0 +1,158 @@
+# utils/artifacts.py
+"""
+Failure-only screenshot artifacts.
+
+While a test runs, page-object steps go into a small in-memory ring buffer (newest N
+steps) as label/URL/time only - a screenshot costs a full-page capture and PNG encode
+in Chrome, too much for every green step. SAUCEDEMO_STEP_SCREENSHOTS=1 keeps a PNG per
+step as well. Nothing touches the disk unless the test fails; then the buffer plus a
+final "failure" shot are handed to a background writer thread that lists the steps in
+artifacts/<worker>/<test>/index.json, writes the images as NN_<label>.png, skips images
+whose content was already written this run, and stops writing once the per-run size
+cap is reached.
+"""
+import hashlib
+import json
+import os
+import queue
+import re
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from utils.parallel import artifact_dir
+
+RING_SIZE = int(os.getenv("SAUCEDEMO_ARTIFACT_RING", "8"))
+MAX_BYTES = int(float(os.getenv("SAUCEDEMO_ARTIFACT_MAX_MB", "200")) * 1024 * 1024)
+STEP_SCREENSHOTS = os.getenv("SAUCEDEMO_STEP_SCREENSHOTS") == "1"
+
+
+def safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_")[:120] or "artifact"
+
+
+class ArtifactWriter:
+    """Background thread that writes PNGs, deduplicated by content hash, under a size cap."""
+
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.written_bytes = 0
+        self.skipped_over_cap = 0
+        self._seen = {}  # sha1 -> path written first
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, test_dir, steps):
+        """steps: [{"label", "url", "time", "png" (bytes or None)}] in step order."""
+        self._queue.put((test_dir, steps))
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                self._write(*job)
+            except Exception:
+                pass  # artifacts are best-effort; never break the run
+
+    def _write(self, test_dir, steps):
+        test_dir.mkdir(parents=True, exist_ok=True)
+        index = []
+        for i, step in enumerate(steps):
+            label, png = step["label"], step["png"]
+            entry = {"step": i, "label": label, "url": step["url"], "time": step["time"]}
+            if png is None:
+                index.append(entry)
+                continue
+            digest = entry["sha1"] = hashlib.sha1(png).hexdigest()
+            if digest in self._seen:
+                entry["same_as"] = self._seen[digest]
+            elif self.written_bytes + len(png) > self.max_bytes:
+                self.skipped_over_cap += 1
+                entry["skipped"] = "size cap reached"
+            else:
+                path = test_dir / f"{i:02d}_{safe_name(label)}"
+                if not path.name.endswith(".png"):
+                    path = path.with_name(path.name + ".png")
+                path.write_bytes(png)
+                self.written_bytes += len(png)
+                self._seen[digest] = str(path)
+                entry["file"] = path.name
+            index.append(entry)
+        (test_dir / "index.json").write_text(json.dumps(index, indent=2))
+
+    def close(self, timeout: float = 30):
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+
+class StepRecorder:
+    """Ring buffer of the most recent steps of ONE test."""
+
+    def __init__(self, test_name: str, size: int = RING_SIZE):
+        self.test_name = test_name
+        self.steps = deque(maxlen=size)
+
+    def add(self, label: str, url: str, png: Optional[bytes] = None):
+        self.steps.append({"label": label, "url": url,
+                           "time": time.strftime("%H:%M:%S"), "png": png})
+
+
+_writer: Optional[ArtifactWriter] = None
+_current: Optional[StepRecorder] = None
+
+
+def begin_test(test_name: str):
+    global _current
+    _current = StepRecorder(test_name)
+
+
+def end_test():
+    global _current
+    _current = None
+
+
+def snapshot(driver, label: str) -> bool:
+    """
+    Page-object screenshot hook. Inside a test: record the step in memory only, with
+    a PNG if STEP_SCREENSHOTS. Outside pytest (benchmarks, REPL): write the screenshot
+    straight to artifacts/<worker>/.
+    """
+    try:
+        if _current is None:
+            return driver.save_screenshot(str(artifact_dir() / label))
+        _current.add(label, driver.current_url,
+                     driver.get_screenshot_as_png() if STEP_SCREENSHOTS else None)
+        return True
+    except Exception:
+        return False
+
+
+def flush_failure(driver=None):
+    """Current test failed: add a final shot and queue the ring buffer for writing."""
+    global _writer
+    if _current is None:
+        return
+    if driver is not None:
+        try:
+            _current.add(f"failure_{time.strftime('%H%M%S')}.png", driver.current_url,
+                         driver.get_screenshot_as_png())
+        except Exception:
+            pass
+    if not _current.steps:
+        return
+    if _writer is None:
+        _writer = ArtifactWriter()
+    _writer.submit(artifact_dir(safe_name(_current.test_name)), list(_current.steps))
+    _current.steps.clear()
+
+
+def close():
+    """Wait for pending writes (called once at session end)."""
+    global _writer
+    if _writer is not None:
+        _writer.close()
+        _writer = None
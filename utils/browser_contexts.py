@@ -0,0 +1,90 @@
+# utils/browser_contexts.py
+"""
+Per-test isolation without a new Chrome: one host browser per worker, and every test
+gets its own CDP browser context (Target.createBrowserContext) = separate cookies,
+storage and cache, like an incognito window. The WebDriver session is switched to the
+context's tab, so page objects keep using the same `driver` object unchanged.
+"""
+from typing import Callable, Dict
+
+from utils.driver_factory import apply_profile, new_driver, quit_driver
+from utils.driver_pool import is_healthy
+
+
+class ContextHost:
+    """
+    One long-lived Chrome; open() hands out a fresh browser context per test and
+    close() disposes of it. The host's first tab (default context) stays open as
+    "home" so the session survives between contexts. Recycled after `max_uses`.
+    """
+
+    def __init__(self, factory: Callable = new_driver, max_uses: int = 25):
+        self.factory = factory
+        self.max_uses = max(1, max_uses)
+        self.driver = None
+        self._home = None
+        self._uses = 0
+        self._open: Dict[int, Dict] = {}  # id(driver) -> {"context", "handle"}
+
+    def _spawn(self):
+        self.shutdown()
+        self.driver = self.factory()
+        self._home = self.driver.current_window_handle
+        self._uses = 0
+
+    def _home_is_healthy(self) -> bool:
+        try:
+            self.driver.switch_to.window(self._home)
+            self.driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    def open(self, base_url: str):
+        if self.driver is None or self._uses >= self.max_uses or not self._home_is_healthy():
+            self._spawn()
+        driver = self.driver
+
+        before = set(driver.window_handles)
+        context = driver.execute_cdp_cmd("Target.createBrowserContext", {"disposeOnDetach": False})
+        context_id = context["browserContextId"]
+        target = driver.execute_cdp_cmd("Target.createTarget",
+                                        {"url": "about:blank", "browserContextId": context_id})
+        # chromedriver's window handle for a tab is its target id; fall back to the diff
+        handle = target["targetId"]
+        if handle not in driver.window_handles:
+            handle = next(iter(set(driver.window_handles) - before))
+        driver.switch_to.window(handle)
+
+        # CDP settings are per tab: re-apply the profile's network blocking etc.
+        apply_profile(driver, getattr(driver, "profile", "debug"))
+        driver.get(base_url)
+        if not is_healthy(driver, base_url):
+            self._dispose(driver, context_id)
+            raise RuntimeError(f"fresh browser context could not open {base_url}")
+
+        self._open[id(driver)] = {"context": context_id, "handle": handle}
+        self._uses += 1
+        return driver
+
+    def _dispose(self, driver, context_id: str):
+        try:
+            # issue the dispose from the home tab, not from a tab that is about to close;
+            # disposing the context closes its tabs too
+            driver.switch_to.window(self._home)
+            driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+        except Exception:
+            self.shutdown()  # broken host; next open() spawns a new one
+
+    def close(self, driver, discard: bool = False):
+        """Dispose of the test's context. discard=True also throws the host browser away."""
+        entry = self._open.pop(id(driver), None)
+        if entry:
+            self._dispose(driver, entry["context"])
+        if discard:
+            self.shutdown()
+
+    def shutdown(self):
+        if self.driver is not None:
+            quit_driver(self.driver)
+        self.driver, self._home, self._open = None, None, {}
@@ -0,0 +1,60 @@
+# utils/browser_state.py
+from typing import Dict
+
+
+_DUMP_STORAGE_JS = (
+    "var s = window[arguments[0]], o = {}; for (var i = 0; i < s.length; i++) {"
+    "  var k = s.key(i); o[k] = s.getItem(k); }"
+    "return o;"
+)
+_LOAD_STORAGE_JS = (
+    "var s = window[arguments[0]], d = arguments[1];"
+    "Object.keys(d).forEach(function (k) { s.setItem(k, d[k]); });"
+)
+_CLEAR_STORAGE_JS = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+
+def capture_state(driver) -> Dict:
+    """Snapshot cookies + localStorage of the current origin as plain JSON-able data."""
+    return {
+        "cookies": driver.get_cookies(),
+        "local_storage": driver.execute_script(_DUMP_STORAGE_JS, "localStorage") or {},
+    }
+
+
+def restore_state(driver, state: Dict, base_url: str):
+    """
+    Replace the browser's state with a capture_state() snapshot: existing cookies and
+    storage are dropped first (the pool may hand over a browser it did not reset).
+    Cookies/storage need the app origin loaded first.
+    """
+    if not driver.current_url.startswith(base_url):
+        driver.get(base_url)
+    driver.delete_all_cookies()
+    driver.execute_script(_CLEAR_STORAGE_JS)
+
+    for c in state.get("cookies", []):
+        cookie = dict(c)
+        # cached snapshots can be older than the cookie lifetime; re-add as session cookies
+        cookie.pop("expiry", None)
+        driver.add_cookie(cookie)
+
+    storage = state.get("local_storage") or {}
+    if storage:
+        driver.execute_script(_LOAD_STORAGE_JS, "localStorage", storage)
+
+
+def capture_checkpoint(driver) -> Dict:
+    """capture_state() plus sessionStorage and the page we're on: everything a test prefix leaves behind."""
+    state = capture_state(driver)
+    state["session_storage"] = driver.execute_script(_DUMP_STORAGE_JS, "sessionStorage") or {}
+    state["url"] = driver.current_url
+    return state
+
+
+def restore_checkpoint(driver, state: Dict, base_url: str):
+    """Apply a capture_checkpoint() snapshot and open its page."""
+    restore_state(driver, state, base_url)
+    if state.get("session_storage"):
+        driver.execute_script(_LOAD_STORAGE_JS, "sessionStorage", state["session_storage"])
+    driver.get(state["url"])
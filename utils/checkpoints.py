@@ -0,0 +1,44 @@
+# utils/checkpoints.py
+"""
+Checkpoints for expensive test prefixes (log in, clear the cart, pick products...).
+
+The first test that needs a prefix runs it and captures the browser state it left
+behind (cookies, local/sessionStorage, URL) plus whatever the prefix returned.
+Later tests, on the same or another pooled browser, restore that snapshot instead
+of replaying the steps. Keyed by (prefix name, user, site).
+"""
+import copy
+from typing import Any, Callable, Dict, Tuple
+from urllib.parse import urlparse
+
+from utils.browser_state import capture_checkpoint, restore_checkpoint
+
+
+class CheckpointStore:
+    def __init__(self):
+        self._checkpoints: Dict[Tuple[str, str, str], Dict] = {}
+        self.hits = 0
+        self.builds = 0
+
+    def get_or_build(self, driver, base_url: str, name: str, user: str, build: Callable[[], Any]) -> Any:
+        """Restore checkpoint (name, user) into `driver`, running `build()` the first time; returns its result."""
+        key = (name, user, base_url)
+        cp = self._checkpoints.get(key)
+        if cp is not None:
+            restore_checkpoint(driver, cp["state"], base_url)
+            # an expired session bounces elsewhere (login form): fall through and rebuild
+            if urlparse(driver.current_url).path == urlparse(cp["state"]["url"]).path:
+                self.hits += 1
+                return copy.deepcopy(cp["result"])
+            self._checkpoints.pop(key, None)
+
+        result = build()
+        self.builds += 1
+        self._checkpoints[key] = {"state": capture_checkpoint(driver), "result": result}
+        return result
+
+    def drop(self, name: str = None):
+        """Forget one prefix (all users), or everything."""
+        for key in list(self._checkpoints):
+            if name is None or key[0] == name:
+                del self._checkpoints[key]
@@ -0,0 +1,107 @@
+# utils/chromedriver.py
+"""
+chromedriver resolution + one long-lived chromedriver process per worker.
+
+Resolution order (first hit wins, result memoized for the process):
+  1. CHROMEDRIVER_PATH            -> pinned binary, no lookup at all
+  2. on-disk cache                -> path remembered from an earlier run (no network)
+  3. ChromeDriverManager.install  -> version lookup/download (CHROMEDRIVER_VERSION pins it);
+                                     skipped when SAUCEDEMO_OFFLINE=1
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+from selenium.webdriver.chrome.service import Service
+
+from utils.parallel import file_lock, free_port
+
+CACHE_DIR = Path(os.getenv("SAUCEDEMO_CACHE_DIR", Path.home() / ".cache" / "saucedemo"))
+CACHE_FILE = CACHE_DIR / "chromedriver.json"
+LOCK_FILE = CACHE_DIR / "chromedriver.lock"
+
+# where harness start-up time went; reported by conftest at the end of the run
+STARTUP = {"resolve_s": 0.0, "resolved_from": "", "service_start_s": 0.0}
+
+_resolved: Optional[str] = None
+_service: Optional["SharedService"] = None
+
+
+def _read_cache() -> Optional[str]:
+    try:
+        path = json.loads(CACHE_FILE.read_text()).get("path")
+    except (OSError, ValueError):
+        return None
+    return path if path and os.path.isfile(path) else None
+
+
+def resolve_driver_path() -> str:
+    """Path to a chromedriver binary; cheap after the first call of the process."""
+    global _resolved
+    if _resolved:
+        return _resolved
+
+    start = time.perf_counter()
+    pinned = os.getenv("CHROMEDRIVER_PATH")
+    if pinned:
+        _resolved, source = pinned, "CHROMEDRIVER_PATH"
+    else:
+        _resolved, source = _read_cache(), "cache"
+        if not _resolved:
+            with file_lock(LOCK_FILE):
+                # another worker may have filled the cache while we waited
+                _resolved = _read_cache()
+                if not _resolved:
+                    if os.getenv("SAUCEDEMO_OFFLINE") == "1":
+                        raise RuntimeError(
+                            f"SAUCEDEMO_OFFLINE=1 but no cached chromedriver in {CACHE_FILE}; "
+                            "set CHROMEDRIVER_PATH or run once online")
+                    from webdriver_manager.chrome import ChromeDriverManager
+                    version = os.getenv("CHROMEDRIVER_VERSION") or None
+                    _resolved, source = ChromeDriverManager(driver_version=version).install(), "webdriver-manager"
+                    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    CACHE_FILE.write_text(json.dumps({"path": _resolved, "version": version}))
+
+    STARTUP["resolve_s"] += time.perf_counter() - start
+    STARTUP["resolved_from"] = source
+    return _resolved
+
+
+def invalidate_driver_path():
+    """Forget the cached binary (e.g. Chrome got updated and the session could not be created)."""
+    global _resolved
+    _resolved = None
+    CACHE_FILE.unlink(missing_ok=True)
+    stop_shared_service()
+
+
+class SharedService(Service):
+    """chromedriver process shared by every browser session of this worker."""
+
+    def start(self):
+        if getattr(self, "process", None) is not None and self.process.poll() is None:
+            return
+        begin = time.perf_counter()
+        super().start()
+        STARTUP["service_start_s"] += time.perf_counter() - begin
+
+    def stop(self):
+        pass  # sessions come and go; the process lives until shutdown()
+
+    def shutdown(self):
+        super().stop()
+
+
+def shared_service() -> SharedService:
+    global _service
+    if _service is None:
+        _service = SharedService(resolve_driver_path(), port=free_port())
+    return _service
+
+
+def stop_shared_service():
+    global _service
+    if _service is not None:
+        _service.shutdown()
+        _service = None
@@ -0,0 +1,76 @@
+# utils/command_counter.py
+"""
+Counts WebDriver commands (each one is an HTTP round trip to chromedriver).
+
+attach(driver) wraps driver.execute, which every driver AND WebElement command goes
+through, so find_element, .text, get_attribute, execute_script, clicks... all count.
+Commands are grouped by command type and by the page-object action that issued them
+(the innermost instrumented method; see utils/instrumentation.py). The harness's own
+commands (e.g. the network tracer's log drains) run inside uncounted() and are left out.
+"""
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Dict
+
+from utils import instrumentation
+
+OUTSIDE_ACTIONS = "<test>"
+
+
+class CommandCounter:
+    def __init__(self):
+        self.paused = 0
+        self.reset()
+
+    def reset(self):
+        self.total = 0
+        self.by_command = Counter()
+        self.by_action: Dict[str, Counter] = defaultdict(Counter)
+
+    def add(self, command: str):
+        if self.paused:
+            return
+        action = instrumentation.current_action() or OUTSIDE_ACTIONS
+        self.total += 1
+        self.by_command[command] += 1
+        self.by_action[action][command] += 1
+
+    def as_dict(self) -> Dict:
+        return {
+            "total": self.total,
+            "by_command": dict(self.by_command.most_common()),
+            "by_action": {a: {"total": sum(c.values()), **dict(c.most_common())}
+                          for a, c in sorted(self.by_action.items(),
+                                             key=lambda kv: sum(kv[1].values()), reverse=True)},
+        }
+
+
+def attach(driver) -> CommandCounter:
+    """Install (once) and return the driver's CommandCounter."""
+    counter = getattr(driver, "command_counter", None)
+    if counter is not None:
+        return counter
+    counter = CommandCounter()
+    execute = driver.execute
+
+    def counting_execute(driver_command, params=None):
+        counter.add(driver_command)
+        return execute(driver_command, params)
+
+    driver.execute = counting_execute
+    driver.command_counter = counter
+    return counter
+
+
+@contextmanager
+def uncounted(driver):
+    """Commands sent inside the block are not counted (no-op without a counter)."""
+    counter = getattr(driver, "command_counter", None)
+    if counter is None:
+        yield
+        return
+    counter.paused += 1
+    try:
+        yield
+    finally:
+        counter.paused -= 1
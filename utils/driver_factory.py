@@ -0,0 +1,106 @@
+# utils/driver_factory.py
+import os
+import shutil
+import tempfile
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+
+from utils.chromedriver import invalidate_driver_path, shared_service
+from utils.parallel import worker_id
+
+# "debug": headed Chrome, everything loads (good for watching a test)
+# "perf":  headless, small fixed viewport, no images/fonts/analytics, eager page loads
+PROFILES = ("debug", "perf")
+DEFAULT_PROFILE = os.getenv("SAUCEDEMO_PROFILE", "debug")
+
+PERF_WINDOW_SIZE = "1024,768"
+PERF_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*backtrace.io*", "*optimizely.com*",
+]
+
+
+def chrome_options(user_data_dir: str, profile: str = DEFAULT_PROFILE,
+                   network_log: bool = False) -> webdriver.ChromeOptions:
+    if profile not in PROFILES:
+        raise ValueError(f"unknown browser profile {profile!r}; expected one of {PROFILES}")
+    options = webdriver.ChromeOptions()
+    options.add_argument(f"--user-data-dir={user_data_dir}")
+    options.add_argument("--no-first-run")
+    options.add_argument("--no-default-browser-check")
+    if profile == "debug":
+        # a fresh user-data-dir is already isolated; kept for the familiar debugging setup
+        options.add_argument("--incognito")
+
+    prefs = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False
+    }
+    options.add_experimental_option("prefs", prefs)
+    # headless + lean settings: use the "perf" profile (see below)
+    options.add_argument(
+        "--disable-features=PasswordLeakDetection,PasswordManagerOnboarding,AutofillKeychainIntegration"
+    )
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-extensions")
+
+    if profile == "perf":
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={PERF_WINDOW_SIZE}")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-component-update")
+        options.add_argument("--disable-default-apps")
+        options.add_argument("--disable-sync")
+        options.add_argument("--mute-audio")
+        # return from get() at DOMContentLoaded; page objects wait for what they need
+        options.page_load_strategy = "eager"
+
+    if network_log:
+        # CDP Network.* events via driver.get_log("performance"), see utils/network_trace.py
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+    return options
+
+
+def apply_profile(driver, profile: str):
+    """Per-session tweaks that need CDP (re-run for every new tab/context)."""
+    if profile == "perf":
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": PERF_BLOCKED_URLS})
+
+
+def new_driver(profile: str = DEFAULT_PROFILE, network_log: bool = False):
+    """
+    Launch a fresh Chrome with its own temp profile, attached to the worker's shared chromedriver.
+    profile: "debug" (default, headed) or "perf" (see PROFILES).
+    network_log: enable the performance log that utils/network_trace.py reads.
+    """
+    user_data = tempfile.mkdtemp(prefix=f"chromedata_{worker_id()}_")
+    try:
+        driver = webdriver.Chrome(service=shared_service(), options=chrome_options(user_data, profile, network_log))
+    except SessionNotCreatedException:
+        # usually a cached chromedriver that no longer matches an updated Chrome
+        invalidate_driver_path()
+        driver = webdriver.Chrome(service=shared_service(), options=chrome_options(user_data, profile, network_log))
+    driver.set_page_load_timeout(60)
+    apply_profile(driver, profile)
+    # remembered so quit_driver() can clean the profile up afterwards
+    driver.user_data_dir = user_data
+    driver.profile = profile
+    return driver
+
+
+def quit_driver(driver):
+    """Quit the browser (best-effort) and delete its temp profile."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    user_data = getattr(driver, "user_data_dir", None)
+    if user_data:
+        shutil.rmtree(user_data, ignore_errors=True)
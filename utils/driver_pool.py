@@ -0,0 +1,106 @@
+# utils/driver_pool.py
+from typing import Callable, Dict, List
+from selenium.common.exceptions import NoAlertPresentException
+
+from utils.browser_state import _CLEAR_STORAGE_JS
+from utils.driver_factory import new_driver, quit_driver
+
+
+def reset_driver(driver, base_url: str):
+    """Bring a reused browser back to a clean, logged-out state on base_url."""
+    # leftover native alert would block every other command
+    try:
+        driver.switch_to.alert.dismiss()
+    except NoAlertPresentException:
+        pass
+
+    # keep only the first window/tab
+    handles = driver.window_handles
+    for h in handles[1:]:
+        driver.switch_to.window(h)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    # storage can only be cleared while on the app's origin
+    driver.get(base_url)
+    driver.delete_all_cookies()
+    driver.execute_script(_CLEAR_STORAGE_JS)
+
+
+def is_healthy(driver, base_url: str) -> bool:
+    """Cheap liveness check: session answers and we're sitting on base_url."""
+    try:
+        state = driver.execute_script("return document.readyState;")
+        return state in ("interactive", "complete") and driver.current_url.startswith(base_url)
+    except Exception:
+        return False
+
+
+class DriverPool:
+    """
+    Keeps browsers alive across tests (one pool per pytest process, i.e. per xdist worker).
+    Each acquire() hands out a reset + health-checked driver; a browser is recycled
+    after `max_uses` tests or whenever it looks broken.
+    """
+
+    def __init__(self, factory: Callable = new_driver, max_uses: int = 25):
+        self.factory = factory
+        self.max_uses = max(1, max_uses)
+        self._idle: List = []
+        self._uses: Dict[int, int] = {}
+        self.resets_skipped = 0
+
+    def _spawn(self):
+        driver = self.factory()
+        self._uses[id(driver)] = 0
+        return driver
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        quit_driver(driver)
+
+    def acquire(self, base_url: str, state=None):
+        """
+        state: the app state the test starts from, or a tuple of states it accepts (see
+        utils/state_affinity.py). When the browser was released in one of them, it is
+        handed out without a reset and driver.kept_state says which (None after a reset).
+        """
+        accepted = (state,) if isinstance(state, str) else tuple(state or ())
+        driver = self._idle.pop() if self._idle else self._spawn()
+        if self._uses.get(id(driver), 0) >= self.max_uses:
+            self._discard(driver)
+            driver = self._spawn()
+
+        kept = getattr(driver, "app_state", None)
+        driver.app_state = None  # unknown again until release()
+        driver.kept_state = None
+        if kept is not None and kept in accepted and is_healthy(driver, base_url):
+            driver.kept_state = kept
+            self.resets_skipped += 1
+            self._uses[id(driver)] += 1
+            return driver
+
+        try:
+            reset_driver(driver, base_url)
+        except Exception:
+            pass
+        if not is_healthy(driver, base_url):
+            # one retry with a brand new browser; let errors surface from here
+            self._discard(driver)
+            driver = self._spawn()
+            reset_driver(driver, base_url)
+
+        self._uses[id(driver)] += 1
+        return driver
+
+    def release(self, driver, discard: bool = False, state: str = None):
+        """state: the app state the test declared it leaves behind (None = unknown)."""
+        if discard:
+            self._discard(driver)
+        else:
+            driver.app_state = state
+            self._idle.append(driver)
+
+    def close(self):
+        while self._idle:
+            self._discard(self._idle.pop())
@@ -0,0 +1,179 @@
+# utils/instrumentation.py
+"""
+Opt-in timing of page-object actions (pytest --page-timing / SAUCEDEMO_PAGE_TIMING=1).
+Also enabled by --command-report, which attributes WebDriver commands to current_action(),
+and by --network-trace, which drains the network log at the end of each top-level action.
+
+Every public method of BasePage and its subclasses is wrapped. For each call we keep
+the inclusive wall time, split into:
+  wait  - time inside WebDriverWait.until/until_not and the in-page waits of BasePage
+  sleep - explicit time.sleep() outside of any wait
+  act   - the rest: WebDriver commands, Python work. ActionChains.pause() is a W3C pause
+          action run inside the driver, so those pauses land here, not under sleep.
+Records are kept per test and dumped to JSON by conftest.
+enable() patches time.sleep and WebDriverWait process-wide; disable() puts them back.
+"""
+import functools
+import threading
+import time
+from typing import Dict, List
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+ENABLED = False
+# BasePage methods whose whole duration counts as waiting
+WAIT_METHODS = {"wait_for_js", "wait_settled"}
+# fn(page, action) run when a top-level page-object action returns (e.g. utils/network_trace.py)
+ACTION_END_HOOKS = []
+
+_local = threading.local()
+_real_sleep = time.sleep
+_real_until = WebDriverWait.until
+_real_until_not = WebDriverWait.until_not
+
+
+def _tls():
+    if not hasattr(_local, "stack"):
+        _local.stack = []      # open action frames
+        _local.records = []    # finished actions of the current test
+        _local.wait = 0.0      # running totals, frames diff them
+        _local.sleep = 0.0
+        _local.wait_depth = 0
+    return _local
+
+
+# ---------- wait / sleep accounting ----------
+def _count_wait(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        t = _tls()
+        if not t.stack or t.wait_depth:
+            return fn(*args, **kwargs)
+        t.wait_depth += 1
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            t.wait += time.perf_counter() - start
+            t.wait_depth -= 1
+    return wrapper
+
+
+def _timed_sleep(seconds):
+    t = _tls()
+    if not t.stack or t.wait_depth:
+        return _real_sleep(seconds)
+    start = time.perf_counter()
+    try:
+        return _real_sleep(seconds)
+    finally:
+        t.sleep += time.perf_counter() - start
+
+
+# ---------- action frames ----------
+def _timed(qualname: str, fn, is_wait: bool):
+    inner = _count_wait(fn) if is_wait else fn
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        t = _tls()
+        frame = (time.perf_counter(), t.wait, t.sleep)
+        depth = len(t.stack)
+        t.stack.append(qualname)
+        try:
+            return inner(*args, **kwargs)
+        finally:
+            t.stack.pop()
+            total = time.perf_counter() - frame[0]
+            wait, sleep = t.wait - frame[1], t.sleep - frame[2]
+            t.records.append({
+                "action": qualname,
+                "depth": depth,
+                "total_s": round(total, 4),
+                "wait_s": round(wait, 4),
+                "sleep_s": round(sleep, 4),
+                "act_s": round(max(0.0, total - wait - sleep), 4),
+            })
+            if depth == 0:
+                for hook in ACTION_END_HOOKS:
+                    try:
+                        hook(args[0] if args else None, qualname)
+                    except Exception:
+                        pass  # tracing must never break the action
+    wrapper.__timed__ = True
+    return wrapper
+
+
+def instrument_class(cls):
+    """Wrap the public methods defined directly on `cls` (idempotent)."""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or not callable(attr) or isinstance(attr, (staticmethod, classmethod, type)):
+            continue
+        if getattr(attr, "__timed__", False):
+            continue
+        setattr(cls, name, _timed(f"{cls.__name__}.{name}", attr, name in WAIT_METHODS))
+
+
+def maybe_instrument(cls):
+    """Called from BasePage.__init_subclass__ so late-imported page classes get wrapped too."""
+    if ENABLED:
+        instrument_class(cls)
+
+
+def enable():
+    global ENABLED
+    if ENABLED:
+        return
+    ENABLED = True
+    time.sleep = _timed_sleep
+    WebDriverWait.until = _count_wait(_real_until)
+    WebDriverWait.until_not = _count_wait(_real_until_not)
+
+    from pages.base_page import BasePage
+    todo = [BasePage]
+    while todo:
+        cls = todo.pop()
+        instrument_class(cls)
+        todo.extend(cls.__subclasses__())
+
+
+def disable():
+    """Restore time.sleep and WebDriverWait (page classes stay wrapped; ENABLED only gates new ones)."""
+    global ENABLED
+    if not ENABLED:
+        return
+    ENABLED = False
+    time.sleep = _real_sleep
+    WebDriverWait.until = _real_until
+    WebDriverWait.until_not = _real_until_not
+
+
+def current_action():
+    """Innermost page-object action running on this thread, or None."""
+    t = _tls()
+    return t.stack[-1] if t.stack else None
+
+
+# ---------- per-test records ----------
+def begin_test():
+    t = _tls()
+    t.records = []
+
+
+def take_records() -> List[Dict]:
+    t = _tls()
+    records, t.records = t.records, []
+    return records
+
+
+def summarize(records: List[Dict]) -> List[Dict]:
+    """Aggregate records by action, slowest total first."""
+    agg: Dict[str, Dict] = {}
+    for r in records:
+        a = agg.setdefault(r["action"], {"action": r["action"], "calls": 0, "total_s": 0.0,
+                                         "max_s": 0.0, "wait_s": 0.0, "sleep_s": 0.0, "act_s": 0.0})
+        a["calls"] += 1
+        a["max_s"] = max(a["max_s"], r["total_s"])
+        for k in ("total_s", "wait_s", "sleep_s", "act_s"):
+            a[k] += r[k]
+    return sorted(agg.values(), key=lambda a: a["total_s"], reverse=True)
@@ -0,0 +1,3 @@
+from utils.local_site.server import LocalSite
+
+__all__ = ["LocalSite"]
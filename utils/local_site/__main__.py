@@ -0,0 +1,13 @@
+# python -m utils.local_site [port]  -> serve the stand-in until Ctrl+C
+import sys
+import time
+from utils.local_site import LocalSite
+
+if __name__ == "__main__":
+    site = LocalSite(port=int(sys.argv[1]) if len(sys.argv) > 1 else 0).start()
+    print(f"SauceDemo stand-in running at {site.url}  (SAUCEDEMO_BASE_URL={site.url})")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        site.stop()
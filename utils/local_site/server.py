@@ -0,0 +1,78 @@
+# utils/local_site/server.py
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+# every route of the real site renders the same shell; app.js picks the page
+PAGES = {"/", "/index.html", "/inventory.html", "/cart.html",
+         "/checkout-step-one.html", "/checkout-step-two.html", "/checkout-complete.html"}
+STATIC_TYPES = {".js": "application/javascript", ".css": "text/css"}
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    # set per server in LocalSite.start()
+    shell: bytes = b""
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].split("#", 1)[0]
+        if path in PAGES:
+            return self._send(200, "text/html; charset=utf-8", self.shell)
+
+        if path.startswith("/static/"):
+            f = STATIC_DIR / path[len("/static/"):]
+            if f.parent == STATIC_DIR and f.suffix in STATIC_TYPES and f.is_file():
+                return self._send(200, STATIC_TYPES[f.suffix], f.read_bytes())
+
+        self._send(404, "text/plain", b"not found")
+
+    def _send(self, status: int, ctype: str, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # keep pytest output clean
+
+
+class LocalSite:
+    """
+    Offline SauceDemo stand-in on 127.0.0.1. port=0 picks a free (ephemeral) port.
+
+        site = LocalSite().start()
+        site.url  # -> 'http://127.0.0.1:54321/'
+        site.stop()
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, glitch_delay_ms: int = 1500):
+        self.host = host
+        self.port = port
+        self.glitch_delay_ms = glitch_delay_ms
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> "LocalSite":
+        shell = (STATIC_DIR / "index.html").read_text()
+        shell = shell.replace("{{GLITCH_DELAY_MS}}", str(int(self.glitch_delay_ms)))
+        handler = type("LocalSiteHandler", (_Handler,), {"shell": shell.encode()})
+
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,336 @@
+// Minimal offline stand-in for www.saucedemo.com.
+// Mirrors the pages, ids, classes and data-test attributes used by pages/*.py.
+// State lives where the real app keeps it: the `session-username` cookie and
+// the `cart-contents` localStorage key (JSON array of product ids).
+(function () {
+  "use strict";
+
+  var PASSWORD = "secret_sauce";
+  var USERS = ["standard_user", "locked_out_user", "problem_user",
+               "performance_glitch_user", "error_user", "visual_user"];
+  var PRODUCTS = [
+    {id: 4, name: "Sauce Labs Backpack", price: 29.99,
+     desc: "carry.allTheThings() with the sleek, streamlined Sly Pack."},
+    {id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+     desc: "A red light isn't the desired state in testing but it sure helps when riding your bike at night."},
+    {id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+     desc: "Get your testing superhero on with the Sauce Labs bolt T-shirt."},
+    {id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99,
+     desc: "It's not every day that you come across a midweight quarter-zip fleece jacket."},
+    {id: 2, name: "Sauce Labs Onesie", price: 7.99,
+     desc: "Rib snap infant onesie for the junior automation engineer in development."},
+    {id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+     desc: "This classic Sauce Labs t-shirt is perfect to wear when cozying up to your keyboard."}
+  ];
+  var CONFIG = window.SITE_CONFIG || {};
+  var root = document.getElementById("root");
+
+  // ---------- state ----------
+  function getCookie(name) {
+    var m = document.cookie.match(new RegExp("(?:^|; )" + name + "=([^;]*)"));
+    return m ? decodeURIComponent(m[1]) : null;
+  }
+  function currentUser() { return getCookie("session-username"); }
+  function setUser(name) {
+    var expires = new Date(Date.now() + 10 * 60 * 1000).toUTCString();
+    document.cookie = "session-username=" + encodeURIComponent(name) + "; expires=" + expires + "; path=/";
+  }
+  function clearUser() {
+    document.cookie = "session-username=; expires=Thu, 01 Jan 1970 00:00:00 GMT; path=/";
+  }
+  function cartIds() {
+    try { return JSON.parse(localStorage.getItem("cart-contents")) || []; } catch (e) { return []; }
+  }
+  function setCartIds(ids) {
+    if (ids.length) { localStorage.setItem("cart-contents", JSON.stringify(ids)); }
+    else { localStorage.removeItem("cart-contents"); }
+  }
+  function product(id) {
+    for (var i = 0; i < PRODUCTS.length; i++) { if (PRODUCTS[i].id === id) { return PRODUCTS[i]; } }
+    return null;
+  }
+  function cartProducts() { return cartIds().map(product).filter(Boolean); }
+  function slug(name) { return name.toLowerCase().replace(/ /g, "-"); }
+  function money(n) { return "$" + n.toFixed(2); }
+  function go(page) { window.location.href = "/" + page; }
+
+  // ---------- tiny DOM helper ----------
+  function h(tag, attrs, children) {
+    var el = document.createElement(tag);
+    Object.keys(attrs || {}).forEach(function (k) {
+      if (k === "text") { el.textContent = attrs[k]; }
+      else if (k.indexOf("on") === 0) { el.addEventListener(k.slice(2), attrs[k]); }
+      else { el.setAttribute(k, attrs[k]); }
+    });
+    (children || []).forEach(function (c) { if (c) { el.appendChild(c); } });
+    return el;
+  }
+
+  // ---------- shared header (logo, burger menu, cart) ----------
+  function header(title, secondary) {
+    var menu = h("div", {"class": "bm-menu-wrap", style: "display: none;", "aria-hidden": "true"}, [
+      h("nav", {"class": "bm-item-list"}, [
+        h("a", {id: "inventory_sidebar_link", "class": "bm-item menu-item", href: "#",
+                "data-test": "inventory-sidebar-link", text: "All Items",
+                onclick: function (e) { e.preventDefault(); go("inventory.html"); }}),
+        h("a", {id: "about_sidebar_link", "class": "bm-item menu-item", href: "https://saucelabs.com/",
+                "data-test": "about-sidebar-link", text: "About"}),
+        h("a", {id: "logout_sidebar_link", "class": "bm-item menu-item", href: "#",
+                "data-test": "logout-sidebar-link", text: "Logout",
+                onclick: function (e) { e.preventDefault(); clearUser(); go(""); }}),
+        h("a", {id: "reset_sidebar_link", "class": "bm-item menu-item", href: "#",
+                "data-test": "reset-sidebar-link", text: "Reset App State",
+                onclick: function (e) { e.preventDefault(); setCartIds([]); refresh(); }})
+      ]),
+      h("button", {id: "react-burger-cross-btn", type: "button", text: "Close Menu",
+                   onclick: function () { toggleMenu(menu, false); }})
+    ]);
+    var badge = cartIds().length
+      ? h("span", {"class": "shopping_cart_badge", "data-test": "shopping-cart-badge",
+                   text: String(cartIds().length)})
+      : null;
+    return h("div", {id: "header_container", "class": "header_container"}, [
+      h("div", {"class": "primary_header"}, [
+        h("div", {id: "menu_button_container"}, [
+          h("button", {id: "react-burger-menu-btn", type: "button", text: "Open Menu",
+                       onclick: function () { toggleMenu(menu, true); }}),
+          menu
+        ]),
+        h("div", {"class": "app_logo", text: "Swag Labs"}),
+        h("div", {id: "shopping_cart_container", "class": "shopping_cart_container"}, [
+          h("a", {"class": "shopping_cart_link", href: "/cart.html", "data-test": "shopping-cart-link"}, [badge])
+        ])
+      ]),
+      h("div", {"class": "header_secondary_container", "data-test": "secondary-header"}, [
+        h("span", {"class": "title", "data-test": "title", text: title}),
+        secondary || null
+      ])
+    ]);
+  }
+  function toggleMenu(menu, open) {
+    menu.style.display = open ? "block" : "none";
+    menu.setAttribute("aria-hidden", open ? "false" : "true");
+  }
+
+  // ---------- pages ----------
+  function loginPage() {
+    var error = sessionStorage.getItem("login-error");
+    sessionStorage.removeItem("login-error");
+    var errorBox = h("div", {"class": "error-message-container"});
+    function showError(msg) {
+      errorBox.className = "error-message-container error";
+      errorBox.innerHTML = "";
+      errorBox.appendChild(h("h3", {"data-test": "error", text: "Epic sadface: " + msg}));
+    }
+    if (error) { showError(error); }
+
+    var user = h("input", {id: "user-name", name: "user-name", type: "text", placeholder: "Username",
+                           "class": "input_error form_input", "data-test": "username"});
+    var pass = h("input", {id: "password", name: "password", type: "password", placeholder: "Password",
+                           "class": "input_error form_input", "data-test": "password"});
+    var form = h("form", {onsubmit: function (e) {
+      e.preventDefault();
+      var u = user.value, p = pass.value;
+      if (!u) { return showError("Username is required"); }
+      if (!p) { return showError("Password is required"); }
+      if (USERS.indexOf(u) < 0 || p !== PASSWORD) {
+        return showError("Username and password do not match any user in this service");
+      }
+      if (u === "locked_out_user") { return showError("Sorry, this user has been locked out."); }
+      setUser(u);
+      var delay = u === "performance_glitch_user" ? (CONFIG.glitchDelayMs || 0) : 0;
+      setTimeout(function () { go("inventory.html"); }, delay);
+    }}, [
+      user, pass, errorBox,
+      h("input", {id: "login-button", type: "submit", value: "Login",
+                  "class": "submit-button btn_action", "data-test": "login-button"})
+    ]);
+    return h("div", {"class": "login_container"}, [
+      h("div", {"class": "login_logo", text: "Swag Labs"}),
+      h("div", {"class": "login_wrapper"}, [form])
+    ]);
+  }
+
+  var SORTS = {
+    az:   function (a, b) { return a.name < b.name ? -1 : a.name > b.name ? 1 : 0; },
+    za:   function (a, b) { return a.name < b.name ? 1 : a.name > b.name ? -1 : 0; },
+    lohi: function (a, b) { return a.price - b.price; },
+    hilo: function (a, b) { return b.price - a.price; }
+  };
+  var sortValue = "az";
+
+  function inventoryPage() {
+    var select = h("select", {"class": "product_sort_container", "data-test": "product-sort-container",
+                              onchange: function () { sortValue = select.value; refresh(); }}, [
+      h("option", {value: "az", text: "Name (A to Z)"}),
+      h("option", {value: "za", text: "Name (Z to A)"}),
+      h("option", {value: "lohi", text: "Price (low to high)"}),
+      h("option", {value: "hilo", text: "Price (high to low)"})
+    ]);
+    select.value = sortValue;
+
+    var inCart = cartIds();
+    var items = PRODUCTS.slice().sort(SORTS[sortValue]).map(function (p) {
+      var added = inCart.indexOf(p.id) >= 0;
+      var btnId = (added ? "remove-" : "add-to-cart-") + slug(p.name);
+      return h("div", {"class": "inventory_item", "data-test": "inventory-item"}, [
+        h("div", {"class": "inventory_item_img"}),
+        h("div", {"class": "inventory_item_description"}, [
+          h("div", {"class": "inventory_item_label"}, [
+            h("a", {id: "item_" + p.id + "_title_link", href: "#", "data-test": "item-" + p.id + "-title-link"}, [
+              h("div", {"class": "inventory_item_name", "data-test": "inventory-item-name", text: p.name})
+            ]),
+            h("div", {"class": "inventory_item_desc", "data-test": "inventory-item-desc", text: p.desc})
+          ]),
+          h("div", {"class": "pricebar"}, [
+            h("div", {"class": "inventory_item_price", "data-test": "inventory-item-price", text: money(p.price)}),
+            h("button", {id: btnId, name: btnId, "data-test": btnId,
+                         "class": "btn " + (added ? "btn_secondary" : "btn_primary") + " btn_small btn_inventory",
+                         text: added ? "Remove" : "Add to cart",
+                         onclick: function () {
+                           var ids = cartIds(), i = ids.indexOf(p.id);
+                           if (i >= 0) { ids.splice(i, 1); } else { ids.push(p.id); }
+                           setCartIds(ids);
+                           refresh();
+                         }})
+          ])
+        ])
+      ]);
+    });
+    return h("div", {id: "page_wrapper", "class": "page_wrapper"}, [
+      header("Products", select),
+      h("div", {id: "inventory_container", "class": "inventory_container"}, [
+        h("div", {"class": "inventory_list", "data-test": "inventory-list"}, items)
+      ])
+    ]);
+  }
+
+  function itemRow(p, withRemove) {
+    var btnId = "remove-" + slug(p.name);
+    return h("div", {"class": "cart_item", "data-test": "inventory-item"}, [
+      h("div", {"class": "cart_quantity", "data-test": "item-quantity", text: "1"}),
+      h("div", {"class": "cart_item_label"}, [
+        h("a", {id: "item_" + p.id + "_title_link", href: "#"}, [
+          h("div", {"class": "inventory_item_name", "data-test": "inventory-item-name", text: p.name})
+        ]),
+        h("div", {"class": "inventory_item_desc", text: p.desc}),
+        h("div", {"class": "item_pricebar"}, [
+          h("div", {"class": "inventory_item_price", "data-test": "inventory-item-price", text: money(p.price)}),
+          withRemove ? h("button", {id: btnId, "data-test": btnId, "class": "btn btn_secondary btn_small cart_button",
+                                    text: "Remove", onclick: function () {
+                                      setCartIds(cartIds().filter(function (id) { return id !== p.id; }));
+                                      refresh();
+                                    }}) : null
+        ])
+      ])
+    ]);
+  }
+
+  function cartPage() {
+    return h("div", {id: "page_wrapper", "class": "page_wrapper"}, [
+      header("Your Cart"),
+      h("div", {id: "cart_contents_container"}, [
+        h("div", {"class": "cart_list", "data-test": "cart-list"},
+          cartProducts().map(function (p) { return itemRow(p, true); })),
+        h("div", {"class": "cart_footer"}, [
+          h("button", {id: "continue-shopping", "data-test": "continue-shopping", "class": "btn btn_secondary",
+                       text: "Continue Shopping", onclick: function () { go("inventory.html"); }}),
+          h("button", {id: "checkout", "data-test": "checkout", "class": "btn btn_action checkout_button",
+                       text: "Checkout", onclick: function () { go("checkout-step-one.html"); }})
+        ])
+      ])
+    ]);
+  }
+
+  function checkoutStepOne() {
+    var errorBox = h("div", {"class": "error-message-container"});
+    function field(id, dataTest, placeholder) {
+      return h("input", {id: id, name: id, type: "text", placeholder: placeholder,
+                         "class": "input_error form_input", "data-test": dataTest});
+    }
+    var first = field("first-name", "firstName", "First Name"),
+        last = field("last-name", "lastName", "Last Name"),
+        postal = field("postal-code", "postalCode", "Zip/Postal Code");
+    var form = h("form", {onsubmit: function (e) {
+      e.preventDefault();
+      var msg = !first.value ? "First Name is required" : !last.value ? "Last Name is required"
+              : !postal.value ? "Postal Code is required" : null;
+      if (msg) {
+        errorBox.className = "error-message-container error";
+        errorBox.innerHTML = "";
+        errorBox.appendChild(h("h3", {"data-test": "error", text: "Error: " + msg}));
+        return;
+      }
+      go("checkout-step-two.html");
+    }}, [
+      first, last, postal, errorBox,
+      h("button", {id: "cancel", type: "button", "data-test": "cancel", "class": "btn btn_secondary",
+                   text: "Cancel", onclick: function () { go("cart.html"); }}),
+      h("input", {id: "continue", type: "submit", value: "Continue", "data-test": "continue",
+                  "class": "submit-button btn btn_primary cart_button btn_action"})
+    ]);
+    return h("div", {id: "page_wrapper", "class": "page_wrapper"}, [
+      header("Checkout: Your Information"),
+      h("div", {id: "checkout_info_container", "class": "checkout_info"}, [form])
+    ]);
+  }
+
+  function checkoutStepTwo() {
+    var items = cartProducts();
+    var subtotal = items.reduce(function (s, p) { return s + p.price; }, 0);
+    var tax = Math.round(subtotal * 0.08 * 100) / 100;
+    return h("div", {id: "page_wrapper", "class": "page_wrapper"}, [
+      header("Checkout: Overview"),
+      h("div", {id: "checkout_summary_container"}, [
+        h("div", {"class": "cart_list", "data-test": "cart-list"},
+          items.map(function (p) { return itemRow(p, false); })),
+        h("div", {"class": "summary_info"}, [
+          h("div", {"class": "summary_subtotal_label", "data-test": "subtotal-label",
+                    text: "Item total: " + money(subtotal)}),
+          h("div", {"class": "summary_tax_label", "data-test": "tax-label", text: "Tax: " + money(tax)}),
+          h("div", {"class": "summary_total_label", "data-test": "total-label",
+                    text: "Total: " + money(subtotal + tax)}),
+          h("button", {id: "cancel", "data-test": "cancel", "class": "btn btn_secondary", text: "Cancel",
+                       onclick: function () { go("inventory.html"); }}),
+          h("button", {id: "finish", "data-test": "finish", "class": "btn btn_action cart_button", text: "Finish",
+                       onclick: function () { setCartIds([]); go("checkout-complete.html"); }})
+        ])
+      ])
+    ]);
+  }
+
+  function checkoutComplete() {
+    return h("div", {id: "page_wrapper", "class": "page_wrapper"}, [
+      header("Checkout: Complete!"),
+      h("div", {id: "checkout_complete_container", "class": "checkout_complete_container"}, [
+        h("h2", {"class": "complete-header", "data-test": "complete-header", text: "Thank you for your order!"}),
+        h("div", {"class": "complete-text", "data-test": "complete-text",
+                  text: "Your order has been dispatched, and will arrive just as fast as the pony can get there!"}),
+        h("button", {id: "back-to-products", "data-test": "back-to-products", "class": "btn btn_primary btn_small",
+                     text: "Back Home", onclick: function () { go("inventory.html"); }})
+      ])
+    ]);
+  }
+
+  var PAGES = {
+    "inventory.html": inventoryPage,
+    "cart.html": cartPage,
+    "checkout-step-one.html": checkoutStepOne,
+    "checkout-step-two.html": checkoutStepTwo,
+    "checkout-complete.html": checkoutComplete
+  };
+
+  function refresh() {
+    var page = window.location.pathname.replace(/^\//, "");
+    var render = PAGES[page];
+    if (render && !currentUser()) {
+      sessionStorage.setItem("login-error", "You can only access '/" + page + "' when you are logged in.");
+      window.location.replace("/");
+      return;
+    }
+    root.innerHTML = "";
+    root.appendChild((render || loginPage)());
+  }
+
+  refresh();
+})();
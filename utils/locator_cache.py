@@ -0,0 +1,60 @@
+# utils/locator_cache.py
+"""
+Which strategy of a fallback locator chain last worked, remembered across runs.
+
+One small JSON file ({locator name: "by=value"}) next to the chromedriver cache.
+Reads happen once per process; writes only when a winner changes, merged under a
+file lock so xdist workers don't overwrite each other.
+"""
+import json
+from typing import Dict, Optional
+
+from utils.chromedriver import CACHE_DIR
+from utils.parallel import file_lock
+
+CACHE_FILE = CACHE_DIR / "locators.json"
+LOCK_FILE = CACHE_DIR / "locators.lock"
+
+_learned: Optional[Dict[str, str]] = None
+
+
+def _read() -> Dict[str, str]:
+    try:
+        data = json.loads(CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def key_of(locator) -> str:
+    by, value = locator
+    return f"{by}={value}"
+
+
+def learned(name: str) -> Optional[str]:
+    global _learned
+    if _learned is None:
+        _learned = _read()
+    return _learned.get(name)
+
+
+def remember(name: str, locator):
+    key = key_of(locator)
+    if learned(name) == key:
+        return
+    _learned[name] = key
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with file_lock(LOCK_FILE):
+            data = _read()
+            data[name] = key
+            CACHE_FILE.write_text(json.dumps(data, indent=2, sort_keys=True))
+    except OSError:
+        pass  # read-only home etc.: still learned for this process
+
+
+def forget():
+    """Drop everything learned (tests, or after a big UI change)."""
+    global _learned
+    _learned = {}
+    CACHE_FILE.unlink(missing_ok=True)
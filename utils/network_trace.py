@@ -0,0 +1,166 @@
+# utils/network_trace.py
+"""
+Opt-in per-test network trace (pytest --network-trace / SAUCEDEMO_NETWORK_TRACE=1).
+
+Chrome's performance log (goog:loggingPrefs, see driver_factory.new_driver) carries the
+CDP Network.* events. We drain it whenever a top-level page-object action returns, so
+every request is attributed to the step that caused it, and write one compact JSON line
+per finished request to artifacts/<worker>/network/<test>.jsonl right away. Only
+in-flight requests and per-step totals stay in memory. On close, <test>.summary.json
+holds request count, bytes and the slowest requests of every step.
+"""
+import heapq
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from utils import command_counter, instrumentation
+
+OUTSIDE_STEPS = "<test>"
+SLOWEST_PER_STEP = 5
+
+_current: Optional["NetworkRecorder"] = None
+
+
+def _ms(a, b):
+    return round(b - a, 1) if a is not None and b is not None and a >= 0 and b >= 0 else None
+
+
+class NetworkRecorder:
+    def __init__(self, driver, path: Path):
+        self.driver = driver
+        self.path = Path(path)
+        self._out = open(self.path, "w", buffering=1)
+        self._inflight: Dict[str, Dict] = {}
+        self._steps: Dict[str, Dict] = {}
+        self._order = 0  # tie-breaker for the heaps
+
+    # ---------- event handling ----------
+    def _on_event(self, method: str, p: Dict, step: str):
+        rid = p.get("requestId")
+        if method == "Network.requestWillBeSent":
+            req = p.get("request", {})
+            self._inflight[rid] = {
+                "step": step, "url": req.get("url", "")[:300], "method": req.get("method"),
+                "type": p.get("type"), "start": p.get("timestamp"), "cache": "network",
+            }
+        elif rid not in self._inflight:
+            return
+        elif method == "Network.requestServedFromCache":
+            self._inflight[rid]["cache"] = "memory"
+        elif method == "Network.responseReceived":
+            r, rec = p.get("response", {}), self._inflight[rid]
+            rec["type"] = p.get("type") or rec["type"]
+            rec["status"] = r.get("status")
+            rec["mime"] = r.get("mimeType")
+            if r.get("fromDiskCache"):
+                rec["cache"] = "disk"
+            elif r.get("fromServiceWorker"):
+                rec["cache"] = "service-worker"
+            t = r.get("timing") or {}
+            rec["phases"] = {
+                "dns": _ms(t.get("dnsStart"), t.get("dnsEnd")),
+                "connect": _ms(t.get("connectStart"), t.get("connectEnd")),
+                "ssl": _ms(t.get("sslStart"), t.get("sslEnd")),
+                "send": _ms(t.get("sendStart"), t.get("sendEnd")),
+                "wait": _ms(t.get("sendEnd"), t.get("receiveHeadersEnd")),
+            }
+            rec["_request_time"], rec["_headers_end"] = t.get("requestTime"), t.get("receiveHeadersEnd")
+        elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+            rec = self._inflight.pop(rid)
+            end = p.get("timestamp")
+            if method == "Network.loadingFailed":
+                rec["error"] = p.get("errorText") or ("canceled" if p.get("canceled") else "failed")
+            rec["bytes"] = int(p.get("encodedDataLength") or 0)
+            if rec.get("_request_time") is not None and rec.get("_headers_end") is not None and end:
+                rec.setdefault("phases", {})["receive"] = round(
+                    (end - rec["_request_time"]) * 1000 - rec["_headers_end"], 1)
+            rec["total_ms"] = round((end - rec["start"]) * 1000, 1) if end and rec.get("start") else None
+            self._emit(rec)
+
+    def _emit(self, rec: Dict):
+        rec.pop("_request_time", None)
+        rec.pop("_headers_end", None)
+        rec.pop("start", None)
+        self._out.write(json.dumps(rec, separators=(",", ":")) + "\n")
+
+        s = self._steps.setdefault(rec["step"], {"requests": 0, "bytes": 0, "failed": 0, "cached": 0,
+                                                 "slowest": []})
+        s["requests"] += 1
+        s["bytes"] += rec["bytes"]
+        s["failed"] += 1 if rec.get("error") else 0
+        s["cached"] += 1 if rec["cache"] != "network" else 0
+        self._order += 1
+        item = (rec.get("total_ms") or 0, self._order, {"url": rec["url"], "total_ms": rec.get("total_ms"),
+                                                         "bytes": rec["bytes"], "type": rec.get("type")})
+        if len(s["slowest"]) < SLOWEST_PER_STEP:
+            heapq.heappush(s["slowest"], item)
+        else:
+            heapq.heappushpop(s["slowest"], item)
+
+    # ---------- public ----------
+    def drain(self, step: str = OUTSIDE_STEPS):
+        """Pull everything Chrome logged since the last drain and attribute it to `step`."""
+        try:
+            with command_counter.uncounted(self.driver):
+                entries = self.driver.get_log("performance")
+        except Exception:
+            return
+        for entry in entries:
+            try:
+                msg = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method = msg.get("method", "")
+            if method.startswith("Network."):
+                self._on_event(method, msg.get("params", {}), step)
+
+    def discard_pending(self):
+        """Throw away what was logged before the test (pool reset, checkpoint restore...)."""
+        try:
+            with command_counter.uncounted(self.driver):
+                self.driver.get_log("performance")
+        except Exception:
+            pass
+
+    def summary(self) -> Dict:
+        return {
+            step: {**{k: v for k, v in s.items() if k != "slowest"},
+                   "slowest": [x[2] for x in sorted(s["slowest"], reverse=True)]}
+            for step, s in self._steps.items()
+        }
+
+    def close(self) -> Dict:
+        self.drain(OUTSIDE_STEPS)
+        for rec in self._inflight.values():
+            rec["error"] = "unfinished"
+            rec["bytes"] = 0
+            self._emit(rec)
+        self._inflight.clear()
+        self._out.close()
+        summary = self.summary()
+        self.path.with_suffix(".summary.json").write_text(json.dumps(summary, indent=1))
+        return summary
+
+
+def _on_action_end(page, action: str):
+    if _current is not None and getattr(page, "driver", None) is _current.driver:
+        _current.drain(action)
+
+
+def start(driver, path: Path) -> NetworkRecorder:
+    """Begin tracing `driver` for one test; needs a driver created with network_log=True."""
+    global _current
+    if _on_action_end not in instrumentation.ACTION_END_HOOKS:
+        instrumentation.ACTION_END_HOOKS.append(_on_action_end)
+    _current = NetworkRecorder(driver, path)
+    _current.discard_pending()
+    return _current
+
+
+def stop() -> Optional[Dict]:
+    global _current
+    if _current is None:
+        return None
+    recorder, _current = _current, None
+    return recorder.close()
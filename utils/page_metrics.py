@@ -0,0 +1,142 @@
+# utils/page_metrics.py
+"""
+Opt-in front-end metrics per page-object load (pytest --page-metrics / SAUCEDEMO_PAGE_METRICS=1).
+
+When a page object sees its page ready (load / is_loaded) we read, in one script:
+  navigation timing  ttfb_ms, dcl_ms, load_ms          (of the current document)
+  paint timing       fp_ms, fcp_ms
+  long tasks         longtasks, longtask_ms            (observed since the page was marked/collected)
+  ready_ms           from the triggering action (a 'pom:' performance mark set right before
+                     e.g. the login click) or from navigation start, to "page object saw it ready".
+                     None for a page reached by an action that set no mark.
+                     SauceDemo routes client-side, so this is the number that moves for
+                     performance_glitch_user; navigation timing only covers the first document.
+The user comes from the app's session-username cookie. Records are checked against the
+page class' PERF_BUDGETS = {user or "*": {metric: max}} and kept per test for conftest.
+"""
+import threading
+from typing import Dict, List
+
+ENABLED = False
+
+_JS_WATCH = """
+    if (!window.__pomLongTasks) {
+        window.__pomLongTasks = [];
+        try {
+            new PerformanceObserver(function (list) {
+                list.getEntries().forEach(function (e) { window.__pomLongTasks.push([e.startTime, e.duration]); });
+            }).observe({type: 'longtask', buffered: true});
+        } catch (e) { /* longtask not supported */ }
+    }
+"""
+# arguments: action name
+MARK_JS = _JS_WATCH + "performance.mark('pom:' + arguments[0]);"
+
+# arguments: page object name -> record, or null when that page was already reported and
+# nothing was marked since. A collected record consumes the 'pom:' marks: the app routes
+# client-side, so an old mark would otherwise time every later, unmarked page.
+COLLECT_JS = _JS_WATCH + """
+    var nav = performance.getEntriesByType('navigation')[0] || {};
+    var out = {url: location.pathname, doc: performance.timeOrigin, now: performance.now()};
+    function r(v) { return typeof v === 'number' ? Math.round(v) : null; }
+    out.ttfb_ms = r(nav.responseStart);
+    out.dcl_ms = r(nav.domContentLoadedEventEnd);
+    out.load_ms = nav.loadEventEnd ? r(nav.loadEventEnd) : null;
+    performance.getEntriesByType('paint').forEach(function (p) {
+        out[p.name === 'first-paint' ? 'fp_ms' : 'fcp_ms'] = r(p.startTime);
+    });
+    var marks = performance.getEntriesByType('mark').filter(function (m) { return m.name.indexOf('pom:') === 0; });
+    var mark = marks.length ? marks[marks.length - 1] : null, since = 0;
+    marks.forEach(function (m) { performance.clearMarks(m.name); });
+    if (mark) {
+        since = mark.startTime;
+        out.trigger = mark.name.slice(4);
+        out.ready_ms = r(out.now - since);
+    } else if (window.__pomLastPage) {
+        // reached without a marked action (or the same page checked again): no start to time from
+        if (window.__pomLastPage === arguments[0]) { return null; }
+        since = window.__pomLastAt;
+        out.trigger = 'unmarked';
+        out.ready_ms = null;
+    } else {
+        out.trigger = 'navigation';
+        out.ready_ms = r(out.now);
+    }
+    out.trigger_at = r(since);
+    window.__pomLastPage = arguments[0];
+    window.__pomLastAt = out.now;
+    var lt = window.__pomLongTasks.filter(function (t) { return t[0] >= since; });
+    out.longtasks = lt.length;
+    out.longtask_ms = r(lt.reduce(function (s, t) { return s + t[1]; }, 0));
+    var m = document.cookie.match(/(?:^|; )session-username=([^;]*)/);
+    out.user = m ? decodeURIComponent(m[1]) : null;
+    return out;
+"""
+
+_local = threading.local()
+
+
+def _tls():
+    if not hasattr(_local, "records"):
+        _local.records = []
+        _local.seen = set()
+    return _local
+
+
+def enable():
+    global ENABLED
+    ENABLED = True
+
+
+def mark(driver, action: str):
+    """Start the clock for the page an action is about to bring up (no-op unless enabled)."""
+    if not ENABLED:
+        return
+    try:
+        driver.execute_script(MARK_JS, action)
+    except Exception:
+        pass
+
+
+def budget_violations(record: Dict, budgets: Dict) -> List[str]:
+    limits = dict(budgets.get("*", {}))
+    limits.update(budgets.get(record.get("user"), {}))
+    out = []
+    for metric, limit in sorted(limits.items()):
+        value = record.get(metric)
+        if value is not None and value > limit:
+            out.append(f"{record['page']} {metric}={value} > {limit} (user {record.get('user') or '-'})")
+    return out
+
+
+def collect(page) -> None:
+    """Called by page objects once their page is ready; one record per page state."""
+    if not ENABLED:
+        return
+    try:
+        rec = page.driver.execute_script(COLLECT_JS, type(page).__name__)
+    except Exception:
+        return
+    if not rec:
+        return
+    t = _tls()
+    key = (type(page).__name__, rec["doc"], rec["trigger"], rec["trigger_at"])
+    if key in t.seen:
+        return  # the same load seen again (is_loaded called twice)
+    t.seen.add(key)
+    rec["page"] = type(page).__name__
+    rec.pop("doc", None)
+    rec.pop("now", None)
+    rec["violations"] = budget_violations(rec, getattr(page, "PERF_BUDGETS", {}))
+    t.records.append(rec)
+
+
+def begin_test():
+    t = _tls()
+    t.records, t.seen = [], set()
+
+
+def take_records() -> List[Dict]:
+    t = _tls()
+    records, t.records = t.records, []
+    return records
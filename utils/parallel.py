@@ -0,0 +1,112 @@
+# utils/parallel.py
+"""
+Per-worker resource helpers for running the suite with pytest-xdist (`pytest -n auto`).
+Outside xdist everything behaves as a single worker called "main".
+"""
+import os
+import socket
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+ARTIFACTS_ROOT = os.getenv("SAUCEDEMO_ARTIFACTS", "artifacts")
+# rough resident size of one Chrome + chromedriver running this suite
+RAM_PER_CHROME_MB = int(os.getenv("SAUCEDEMO_RAM_PER_CHROME_MB", "600"))
+PORTS_PER_WORKER = 200
+PORT_RANGE_START = int(os.getenv("SAUCEDEMO_PORT_RANGE_START", "20000"))
+
+
+def worker_id() -> str:
+    """'gw0', 'gw1', ... under xdist; 'main' otherwise."""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def worker_index() -> int:
+    wid = worker_id()
+    return int(wid[2:]) if wid.startswith("gw") and wid[2:].isdigit() else 0
+
+
+def artifact_dir(*parts: str) -> Path:
+    """artifacts/<worker>/<parts...>, created on demand."""
+    path = Path(ARTIFACTS_ROOT, worker_id(), *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _available_ram_mb() -> int:
+    try:
+        with open("/proc/meminfo") as fh:
+            for line in fh:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return 0
+
+
+def _usable_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def auto_worker_count() -> int:
+    """
+    Worker count for `-n auto`: one per usable core, capped by how many
+    Chromes fit in available RAM. SAUCEDEMO_WORKERS overrides the guess.
+    """
+    forced = os.getenv("SAUCEDEMO_WORKERS")
+    if forced:
+        return max(1, int(forced))
+    workers = _usable_cpus()
+    ram = _available_ram_mb()
+    if ram:
+        workers = min(workers, ram // RAM_PER_CHROME_MB)
+    return max(1, workers)
+
+
+def free_port() -> int:
+    """
+    A free TCP port from this worker's own range, so chromedriver instances
+    started by different workers at the same moment can't race for one port.
+    """
+    start = PORT_RANGE_START + worker_index() * PORTS_PER_WORKER
+    for port in range(start, start + PORTS_PER_WORKER):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            try:
+                s.bind(("127.0.0.1", port))
+                return port
+            except OSError:
+                continue
+    raise RuntimeError(f"No free port in {start}-{start + PORTS_PER_WORKER - 1} for worker {worker_id()}")
+
+
+@contextmanager
+def file_lock(path):
+    """Cross-process exclusive lock (used around shared caches like the chromedriver download)."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+") as fh:
+        if fcntl:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+        else:
+            fh.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+            else:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,85 @@
+# utils/session_cache.py
+import json
+import re
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urljoin, urlparse
+
+from selenium.common.exceptions import TimeoutException
+
+from utils.browser_state import capture_state, restore_state
+
+# app keys that describe *data*, not the login; never replay them from the cache
+VOLATILE_STORAGE_KEYS = ("cart-contents",)
+
+
+class SessionCache:
+    """On-disk cache of logged-in browser state, one JSON file per (site, user)."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, base_url: str, username: str) -> Path:
+        host = urlparse(base_url).netloc or "local"
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", f"{host}__{username}")
+        return self.directory / f"{safe}.json"
+
+    def get(self, base_url: str, username: str) -> Optional[Dict]:
+        try:
+            return json.loads(self._path(base_url, username).read_text())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, base_url: str, username: str, state: Dict):
+        self._path(base_url, username).write_text(json.dumps(state, indent=2))
+
+    def drop(self, base_url: str, username: str):
+        self._path(base_url, username).unlink(missing_ok=True)
+
+
+def login_via_session(driver, base_url: str, username: str, password: str, cache: SessionCache):
+    """
+    Open inventory.html already logged in as `username`, skipping the login form.
+    Uses the cached session state when it still works; otherwise logs in through the
+    UI once and refreshes the cache. Returns the loaded InventoryPage.
+    """
+    from pages.login_page import LoginPage
+    from pages.inventory_page import InventoryPage
+
+    inv = InventoryPage(driver)
+    inventory_url = urljoin(base_url, "inventory.html")
+
+    # the pool handed this browser over un-reset (state affinity): it may already be logged in
+    if getattr(driver, "kept_state", None) == "logged_in":
+        cookie = driver.get_cookie("session-username")
+        if cookie and cookie.get("value") == username:
+            # always reload: page state such as the sort order must not carry over
+            driver.get(inventory_url)
+            try:
+                inv.wait_visible(inv.TITLE, timeout=5)
+                return inv
+            except TimeoutException:
+                pass
+
+    state = cache.get(base_url, username)
+    if state:
+        restore_state(driver, state, base_url)
+        driver.get(inventory_url)
+        # a stale/invalid session bounces back to the login form
+        if inv.is_url_contains("inventory.html"):
+            try:
+                inv.wait_visible(inv.TITLE, timeout=5)
+                return inv
+            except Exception:
+                pass
+        cache.drop(base_url, username)
+
+    LoginPage(driver).load(base_url).login(username, password)
+    assert inv.is_loaded(), f"{username}: inventory did not load after UI login"
+
+    state = capture_state(driver)
+    state["local_storage"] = {k: v for k, v in state["local_storage"].items()
+                              if k not in VOLATILE_STORAGE_KEYS}
+    cache.put(base_url, username, state)
+    return inv
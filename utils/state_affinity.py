@@ -0,0 +1,160 @@
+# utils/state_affinity.py
+"""
+State-affinity scheduling (pytest plugin, opt-in with --state-affinity / SAUCEDEMO_STATE_AFFINITY=1).
+
+Tests declare the app state they start from (one state, or a tuple of states they
+tolerate) and the one they leave behind:
+
+    @pytest.mark.state(start="logged_in", end="logged_in")
+    @pytest.mark.state(start=("logged_out", "after_logout"), end="logged_out")
+
+States:
+  logged_out    what reset_driver() gives you: no cookies, empty storage
+  after_logout  login page without a session cookie, but the app's storage (cart-contents
+                etc.) may be left over, e.g. after a UI logout. Tests that only look at
+                the login page accept it, and also end in it: they don't clean up.
+  logged_in     standard_user, empty cart
+Tests that leave anything else behind (e.g. a filled cart) declare no end state and
+the browser is reset after them.
+With --state-affinity, tests are reordered (within each module, then module by module)
+so that one test's end state feeds the next test's start state, and the pooled driver
+fixture hands the browser over WITHOUT a reset when the previous test on it passed and
+ended in a state the next test accepts. A module's tests stay together, so
+module-scoped fixtures are never set up twice.
+Under pytest-xdist a chain only holds if it stays on one worker, so -n needs
+--dist loadfile (or loadscope); workers report their skipped resets to the controller.
+"""
+import os
+from typing import List, Optional, Tuple
+
+import pytest
+
+STATES = ("logged_out", "after_logout", "logged_in")
+# what reset_driver() leaves behind
+AFTER_RESET = "logged_out"
+# filled in for the terminal summary
+STATS = {"enabled": False, "resets_skipped": 0}
+
+
+def declared_states(item) -> Tuple[Optional[Tuple[str, ...]], Optional[str]]:
+    """(accepted start states, end) from the item's state marker; (None, None) when undeclared."""
+    marker = item.get_closest_marker("state")
+    if marker is None:
+        return None, None
+    start, end = marker.kwargs.get("start"), marker.kwargs.get("end")
+    starts = (start,) if isinstance(start, str) else (tuple(start) if start else None)
+    for s in (starts or ()) + (end,):
+        if s is not None and s not in STATES:
+            raise pytest.UsageError(f"{item.nodeid}: unknown state {s!r}; expected one of {STATES}")
+    return starts, end
+
+
+def _chain(units: List, state: Optional[str], states) -> Tuple[List, int]:
+    remaining, ordered, resets = list(units), [], 0
+    while remaining:
+        pick = None
+        if state is not None:
+            pick = next((u for u in remaining if state in (states(u)[0] or ())), None)
+        if pick is None:
+            resets += 1
+            pick = next((u for u in remaining if states(u)[0] is None or AFTER_RESET in states(u)[0]),
+                        remaining[0])
+        remaining.remove(pick)
+        ordered.append(pick)
+        state = states(pick)[1]
+    return ordered, resets
+
+
+def order_for_affinity(items: List, state: Optional[str] = None) -> Tuple[List, int]:
+    """
+    Greedy chain over `items` (original order is the tie-breaker): take the first test
+    starting where the previous one ended; otherwise the first that a reset satisfies
+    (or doesn't care); otherwise the next in line. Returns (ordered, transitions needing a reset).
+    """
+    return _chain(items, state, declared_states)
+
+
+def order_modules(modules: List[List]) -> List:
+    """
+    Order tests inside each module, then chain the modules the same way (a module enters
+    with its first test's start state and leaves with its last test's end state).
+    Modules stay contiguous so module-scoped fixtures are set up once.
+    """
+    blocks = [order_for_affinity(group)[0] for group in modules]
+    blocks, _ = _chain(blocks, None,
+                       lambda b: (declared_states(b[0])[0], declared_states(b[-1])[1]))
+    return [it for block in blocks for it in block]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--state-affinity",
+        action="store_true",
+        default=os.getenv("SAUCEDEMO_STATE_AFFINITY") == "1",
+        help="order tests by declared start/end state (@pytest.mark.state) and skip the "
+             "pooled browser reset when the previous test left a state the next one accepts",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "state(start=None, end=None): app state(s) the test accepts / leaves: "
+        "logged_out, after_logout, logged_in",
+    )
+    if not config.getoption("--state-affinity"):
+        return
+    STATS["enabled"] = True
+    # the xdist controller: 'load' would deal a module's chain out to several workers
+    dist = config.getoption("dist", "no")
+    if not hasattr(config, "workerinput") and dist not in ("no", "loadfile", "loadscope"):
+        raise pytest.UsageError(
+            f"--state-affinity needs each module on one worker: use --dist loadfile "
+            f"(or loadscope) with -n, not --dist {dist}"
+        )
+
+
+def pytest_sessionfinish(session):
+    # xdist worker: hand the count to the controller (the pool was closed with the session fixtures)
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["state_affinity_resets_skipped"] = STATS["resets_skipped"]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    STATS["resets_skipped"] += getattr(node, "workeroutput", {}).get("state_affinity_resets_skipped", 0)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    if not config.getoption("--state-affinity"):
+        return
+    modules = {}
+    for it in items:
+        modules.setdefault(it.nodeid.split("::")[0], []).append(it)
+    items[:] = order_modules(list(modules.values()))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not STATS["enabled"]:
+        return
+    terminalreporter.write_sep("-", "state affinity")
+    terminalreporter.write_line(f"browser resets skipped: {STATS['resets_skipped']}")
+
+
+def start_state(item) -> Optional[Tuple[str, ...]]:
+    """Start states to ask the pool for, or None (always reset) when affinity is off."""
+    if not item.config.getoption("--state-affinity"):
+        return None
+    return declared_states(item)[0]
+
+
+def end_state(item) -> Optional[str]:
+    """Declared end state, but only if the test passed: a failure leaves anything behind."""
+    if not item.config.getoption("--state-affinity"):
+        return None
+    rep = getattr(item, "rep_call", None)
+    if rep is None or not rep.passed:
+        return None
+    return declared_states(item)[1]